@@ -17,6 +17,7 @@ from app.models import (
     group,  # noqa: F401
     like,  # noqa: F401
     program,  # noqa: F401
+    service_key,  # noqa: F401
     tag,  # noqa: F401
     task,  # noqa: F401
     troop,  # noqa: F401
@@ -0,0 +1,37 @@
+"""add content.comment_count
+
+Revision ID: 4b1d2c9e7f30
+Revises: e7b6183583c0
+Create Date: 2026-10-18 06:10:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d2c9e7f30'
+down_revision: Union[str, Sequence[str], None] = 'e7b6183583c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('content', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE content SET comment_count = counts.n
+        FROM (SELECT content_id, count(*) AS n FROM comments GROUP BY content_id) AS counts
+        WHERE content.id = counts.content_id
+        """
+    )
+    op.create_check_constraint('ck_content_comment_count_nonneg', 'content', 'comment_count >= 0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_content_comment_count_nonneg', 'content', type_='check')
+    op.drop_column('content', 'comment_count')
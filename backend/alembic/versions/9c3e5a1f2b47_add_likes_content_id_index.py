@@ -0,0 +1,36 @@
+"""add likes(content_id) index
+
+Revision ID: 9c3e5a1f2b47
+Revises: 4b1d2c9e7f30
+Create Date: 2026-10-18 06:14:37.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a1f2b47'
+down_revision: Union[str, Sequence[str], None] = '4b1d2c9e7f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps likes writable while the index builds; it cannot run in a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_likes_content_id', 'likes', ['content_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_likes_content_id', table_name='likes',
+            postgresql_concurrently=True, if_exists=True,
+        )
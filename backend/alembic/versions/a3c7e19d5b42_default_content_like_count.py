@@ -0,0 +1,27 @@
+"""default content.like_count to 0
+
+Revision ID: a3c7e19d5b42
+Revises: e5b2d9f4a108
+Create Date: 2026-10-18 18:05:11.204719
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e19d5b42'
+down_revision: Union[str, Sequence[str], None] = 'e5b2d9f4a108'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('content', 'like_count', server_default='0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('content', 'like_count', server_default=None)
@@ -0,0 +1,50 @@
+"""add pg_trgm indexes for user, group and tag search
+
+Revision ID: a6d1e8b3c5f2
+Revises: f3c9a7d15e26
+Create Date: 2026-10-18 11:02:17.640512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d1e8b3c5f2'
+down_revision: Union[str, Sequence[str], None] = 'f3c9a7d15e26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column): the columns the list endpoints match q against
+INDEXES = [
+    ('ix_users_name_trgm', 'users', 'name'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_users_auth0_id_trgm', 'users', 'auth0_id'),
+    ('ix_groups_name_trgm', 'groups', 'name'),
+    ('ix_tags_name_trgm', 'tags', 'name'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name, table, [column],
+                unique=False, postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
+    # pg_trgm is left installed; other objects may depend on it
@@ -0,0 +1,53 @@
+"""add indexes for repository access paths
+
+Revision ID: b7e4f0c2d815
+Revises: 9c3e5a1f2b47
+Create Date: 2026-10-18 06:20:51.337820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4f0c2d815'
+down_revision: Union[str, Sequence[str], None] = '9c3e5a1f2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns) - each matches a repository filter plus its sort order
+INDEXES = [
+    ('ix_events_workspace_id_start_dt', 'events', ['workspace_id', 'start_dt', 'id']),
+    ('ix_events_program_id_start_dt', 'events', ['program_id', 'start_dt', 'id']),
+    ('ix_tasks_event_id', 'tasks', ['event_id']),
+    ('ix_troops_workspace_id_name', 'troops', ['workspace_id', 'name']),
+    ('ix_troop_participation_event_id', 'troop_participation', ['event_id']),
+    ('ix_content_tags_tag_id_content_id', 'content_tags', ['tag_id', 'content_id']),
+    ('ix_comments_content_id_created_at', 'comments', ['content_id', 'created_at', 'id']),
+    ('ix_comments_user_id_created_at', 'comments', ['user_id', 'created_at']),
+    ('ix_group_memberships_group_id', 'group_memberships', ['group_id']),
+    ('ix_workspace_memberships_user_id', 'workspace_memberships', ['user_id']),
+    ('ix_users_lower_email', 'users', [sa.text('lower(email)')]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY avoids blocking writes while building; it cannot run in a transaction.
+    # if_not_exists lets a rerun pick up after an interrupted build (drop any INVALID
+    # index it left behind first).
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,49 @@
+"""add indexes for the faceted content query
+
+Revision ID: c4f8e2a9d731
+Revises: a6d1e8b3c5f2
+Create Date: 2026-10-18 14:26:51.203118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8e2a9d731'
+down_revision: Union[str, Sequence[str], None] = 'a6d1e8b3c5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_content_created_at_id', 'content', ['created_at', 'id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_tasks_estimated_duration', 'tasks', ['estimated_duration'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_tasks_equipment', 'tasks', ['equipment'],
+            unique=False, postgresql_using='gin',
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ('ix_tasks_equipment', 'tasks'),
+            ('ix_tasks_estimated_duration', 'tasks'),
+            ('ix_content_created_at_id', 'content'),
+        ):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
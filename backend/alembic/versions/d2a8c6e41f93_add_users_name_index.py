@@ -0,0 +1,36 @@
+"""add users(name) index
+
+Revision ID: d2a8c6e41f93
+Revises: b7e4f0c2d815
+Create Date: 2026-10-18 06:31:08.554217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8c6e41f93'
+down_revision: Union[str, Sequence[str], None] = 'b7e4f0c2d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The user list pages by name; without this every page sorts the whole table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_users_name'), 'users', ['name'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_users_name'), table_name='users',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,36 @@
+"""add GIN index on tasks.media
+
+Revision ID: e5b2d9f4a108
+Revises: c4f8e2a9d731
+Create Date: 2026-10-18 16:12:40.518937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2d9f4a108'
+down_revision: Union[str, Sequence[str], None] = 'c4f8e2a9d731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_media', 'tasks', ['media'],
+            unique=False, postgresql_using='gin',
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_media', table_name='tasks',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,58 @@
+"""add content search_vector and GIN index
+
+Revision ID: f3c9a7d15e26
+Revises: d2a8c6e41f93
+Create Date: 2026-10-18 09:12:44.301865
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a7d15e26'
+down_revision: Union[str, Sequence[str], None] = 'd2a8c6e41f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 'simple' (lowercase, no stemming or stop words) because the content is Icelandic;
+# 'english' would stem Icelandic words and drop those that look like English stop
+# words. Must match SEARCH_CONFIG in app.domain.content_constraints
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites content under an exclusive lock;
+    # run it in a maintenance window on large tables
+    op.add_column(
+        'content',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_content_search_vector', 'content', ['search_vector'],
+            unique=False, postgresql_using='gin',
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_content_search_vector', table_name='content',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('content', 'search_vector')
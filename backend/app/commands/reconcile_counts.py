@@ -0,0 +1,37 @@
+"""
+Recompute denormalised counters from their source tables.
+
+Usage (from backend/):
+    PYTHONPATH=. uv run python -m app.commands.reconcile_counts
+
+content.like_count and content.comment_count are kept up to date by LikeService
+and CommentService on every write; this command repairs drift after manual SQL,
+restores or bugs, and is safe to run at any time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from app.core.db import dispose_engine, get_session_maker
+from app.services.comments import CommentService
+from app.services.likes import LikeService
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with get_session_maker()() as session:
+        fixed = await LikeService(session).reconcile_counts()
+        print(f"like_count:    corrected {fixed} row(s)")
+        fixed = await CommentService(session).reconcile_counts()
+        print(f"comment_count: corrected {fixed} row(s)")
+    await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute denormalised counters")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Manage service API keys for machine clients.
+
+Usage (from backend/):
+    PYTHONPATH=. uv run python -m app.commands.service_keys create nightly-export --scope programs:read --scope events:read
+    PYTHONPATH=. uv run python -m app.commands.service_keys list
+    PYTHONPATH=. uv run python -m app.commands.service_keys revoke <key id>
+
+The plaintext key is printed once by ``create`` and cannot be recovered later.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from app.core.db import dispose_engine, get_session_maker
+from app.schemas.service_key import ServiceApiKeyCreate
+from app.services.service_keys import ServiceApiKeyService
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with get_session_maker()() as session:
+        svc = ServiceApiKeyService(session)
+        if args.command == "create":
+            created = await svc.create(ServiceApiKeyCreate(name=args.name, scopes=args.scope))
+            print(f"id:     {created.id}")
+            print(f"scopes: {', '.join(created.scopes)}")
+            print(f"key:    {created.key}")
+        elif args.command == "list":
+            for key in await svc.list():
+                state = f"revoked {key.revoked_at:%Y-%m-%d}" if key.revoked_at else "active"
+                print(f"{key.id}  {key.prefix}  {key.name:<30} {','.join(key.scopes):<40} {state}")
+        elif args.command == "revoke":
+            await svc.revoke(args.key_id)
+            print(f"revoked {args.key_id}")
+    await dispose_engine()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage service API keys")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    create = sub.add_parser("create", help="Create a key and print it once")
+    create.add_argument("name")
+    create.add_argument(
+        "--scope",
+        action="append",
+        required=True,
+        help="Router tag, <tag>:read, <tag>:write or * (repeatable)",
+    )
+
+    sub.add_parser("list", help="List keys (without secrets)")
+
+    revoke = sub.add_parser("revoke", help="Revoke a key")
+    revoke.add_argument("key_id", type=UUID)
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
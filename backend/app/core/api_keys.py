@@ -0,0 +1,44 @@
+"""
+Helpers for service API keys.
+
+A key looks like ``slodi_<prefix>_<secret>``. The prefix is stored in clear and
+used to find the key row; the secret is only stored as an HMAC-SHA256 digest
+keyed with SERVICE_KEY_PEPPER, and compared in constant time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+
+from app.domain.service_key_constraints import PREFIX_LEN
+from app.settings import settings
+
+KEY_SCHEME = "slodi"
+
+
+def generate_api_key() -> tuple[str, str, str]:
+    """Return ``(key, prefix, key_hash)`` for a new random key."""
+    prefix = secrets.token_hex(PREFIX_LEN // 2)
+    secret = secrets.token_urlsafe(32)
+    return f"{KEY_SCHEME}_{prefix}_{secret}", prefix, hash_secret(secret)
+
+
+def hash_secret(secret: str) -> str:
+    return hmac.new(
+        settings.service_key_pepper.encode(), secret.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def split_api_key(key: str) -> tuple[str, str] | None:
+    """Return ``(prefix, secret)``, or None if ``key`` is not a service key."""
+    scheme, _, rest = key.partition("_")
+    prefix, _, secret = rest.partition("_")
+    if scheme != KEY_SCHEME or len(prefix) != PREFIX_LEN or not secret:
+        return None
+    return prefix, secret
+
+
+def verify_secret(secret: str, key_hash: str) -> bool:
+    return hmac.compare_digest(hash_secret(secret), key_hash)
@@ -5,22 +5,31 @@ This module provides:
 - JWT token verification using Auth0's public keys (JWKS)
 - Automatic user creation on first login
 - FastAPI dependency for protecting endpoints with authentication
+- Service API keys (X-API-Key header) for machine clients, scoped per router
 """
 
-from functools import lru_cache
+import asyncio
+import hashlib
 import logging
+import time
+from dataclasses import dataclass
+from typing import Annotated
+from uuid import UUID
 
 import httpx
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.db import get_session
+from app.core.identity_cache import identity_cache
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.services.service_keys import ServiceApiKeyService
 from app.services.users import UserService
 
 # Setup logging
@@ -28,42 +37,228 @@ logger = logging.getLogger(__name__)
 
 # HTTPBearer extracts the token from Authorization: Bearer <token> header
 security = HTTPBearer()
+# Routes that also accept an API key check for the Bearer token themselves
+optional_security = HTTPBearer(auto_error=False)
 
+# Machine clients authenticate with a service API key in the X-API-Key header
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
-@lru_cache()
-def get_auth0_jwks() -> dict:
+
+# Shared HTTP client for calls to Auth0, so JWKS fetches reuse pooled connections
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient used for Auth0 requests."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=settings.auth0_http_timeout)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Auth0 HTTP client (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class JWKSProvider:
+    """
+    Async cache of Auth0 public keys (JWKS), indexed by key ID (kid).
+
+    - Keys older than ``ttl`` seconds keep being served while a background task
+      refetches them; only the very first fetch blocks the request.
+    - A token signed with an unknown kid forces one refetch (Auth0 key rotation),
+      at most once every ``min_refresh_interval`` seconds.
+    - Concurrent refreshes are collapsed into a single fetch (single-flight).
+    - If Auth0 is unreachable, the last known good keys keep being served.
     """
-    Fetch and cache Auth0 public keys (JWKS) for JWT verification.
 
-    The JWKS (JSON Web Key Set) contains the public keys used by Auth0
-    to sign JWT tokens. We cache this to avoid fetching on every request.
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl: float,
+        min_refresh_interval: float,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._client = client
+        self._keys: dict[str, dict] = {}
+        self._fetched_at: float | None = None
+        self._attempted_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    def _is_stale(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl
+
+    def _recently_attempted(self) -> bool:
+        return (
+            self._attempted_at is not None
+            and time.monotonic() - self._attempted_at < self.min_refresh_interval
+        )
 
-    Returns:
-        dict: The JWKS response containing public keys
+    async def get_signing_key(self, kid: str) -> dict | None:
+        """
+        Return the RSA public key for ``kid``, refreshing the key set if needed.
+
+        Returns None if the key is unknown even after a refresh.
+
+        Raises:
+            HTTPException: 503 if no keys have ever been fetched and Auth0 is unreachable
+        """
+        if not self._keys:
+            await self.refresh()
+        elif self._is_stale():
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None:
+            # Unknown kid: Auth0 may have rotated its keys since our last fetch
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    def _refresh_in_background(self) -> None:
+        # Keep a reference so the task is not garbage collected mid-fetch
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Background refresh of Auth0 public keys failed: {e}")
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Refetch the key set unless another caller has just done so."""
+        attempted_before = self._attempted_at
+        async with self._lock:
+            # Another coroutine refreshed while we were waiting for the lock
+            if self._attempted_at != attempted_before:
+                return
+            if not (force or self._is_stale()):
+                return
+            if self._keys and self._recently_attempted():
+                return
+
+            self._attempted_at = time.monotonic()
+            try:
+                client = self._client or get_http_client()
+                response = await client.get(self.url)
+                response.raise_for_status()
+                jwks = response.json()
+            except httpx.HTTPError as e:
+                if self._keys:
+                    logger.warning(f"Unable to refresh Auth0 public keys, using cached keys: {e}")
+                    return
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=f"Unable to fetch Auth0 public keys: {str(e)}",
+                ) from e
+
+            self._keys = {
+                key["kid"]: {
+                    "kty": key["kty"],
+                    "kid": key["kid"],
+                    "use": key["use"],
+                    "n": key["n"],
+                    "e": key["e"],
+                }
+                for key in jwks.get("keys", [])
+                if key.get("kty") == "RSA"
+            }
+            self._fetched_at = self._attempted_at
 
-    Raises:
-        HTTPException: If unable to fetch JWKS from Auth0
+
+jwks_provider = JWKSProvider(
+    f"{settings.auth0_base_url}/.well-known/jwks.json",
+    ttl=settings.auth0_jwks_ttl,
+    min_refresh_interval=settings.auth0_jwks_min_refresh_interval,
+)
+
+
+class UserInfoClient:
     """
-    jwks_url = f"https://{settings.auth0_domain}/.well-known/jwks.json"
+    Async client for Auth0's /userinfo endpoint, used when a token has no email claim.
 
-    try:
-        response = httpx.get(jwks_url, timeout=10.0)
+    - Requests go through the shared, pooled AsyncClient.
+    - The resulting email/name are cached per ``sub`` for ``ttl`` seconds.
+    - Concurrent lookups for the same ``sub`` share a single HTTP request.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl: float,
+        maxsize: int,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.url = url
+        self._client = client
+        self._cache: TTLCache[str, dict] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[str, asyncio.Future[dict]] = {}
+
+    async def get(self, sub: str, token: str) -> dict:
+        """
+        Return ``{"email": ..., "name": ...}`` for the user behind ``token``.
+
+        Raises:
+            httpx.HTTPError: If Auth0 cannot be reached or rejects the token
+        """
+        cached = self._cache.get(sub)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(sub)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(token))
+            self._inflight[sub] = task
+            task.add_done_callback(lambda _: self._inflight.pop(sub, None))
+
+        # Shielded so one cancelled request does not abort the lookup for the others
+        info = await asyncio.shield(task)
+        if info.get("email"):
+            self._cache.set(sub, info)
+        return info
+
+    async def _fetch(self, token: str) -> dict:
+        client = self._client or get_http_client()
+        response = await client.get(self.url, headers={"Authorization": f"Bearer {token}"})
         response.raise_for_status()
-        return response.json()
-    except httpx.HTTPError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=f"Unable to fetch Auth0 public keys: {str(e)}",
-        ) from e
+        userinfo = response.json()
+        return {"email": userinfo.get("email"), "name": userinfo.get("name")}
+
 
+userinfo_client = UserInfoClient(
+    f"{settings.auth0_base_url}/userinfo",
+    ttl=settings.auth0_userinfo_cache_ttl,
+    maxsize=settings.auth0_userinfo_cache_size,
+)
 
-def verify_auth0_token(token: str) -> dict:
+# Verified claims keyed by token hash; each entry expires with the token's exp claim
+token_cache: TTLCache[str, dict] = TTLCache(maxsize=settings.auth0_token_cache_size)
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def verify_auth0_token(token: str) -> dict:
     """
     Verify Auth0 JWT token and extract claims.
 
     This function:
+    0. Returns the cached claims if this exact token was verified before and
+       has not expired yet (skips the RSA signature check)
     1. Gets the unverified header to find which key to use (kid)
-    2. Fetches Auth0's JWKS and finds the matching public key
+    2. Looks up the matching public key in the cached Auth0 JWKS
     3. Validates the JWT signature using the public key
     4. Checks token expiration, audience, and issuer
     5. Returns the verified token payload (claims)
@@ -81,6 +276,12 @@ def verify_auth0_token(token: str) -> dict:
     # Toggle this to enable/disable debug logging for token verification
     DEBUG_AUTH = False
 
+    # Tokens verified earlier are served from cache until they expire
+    cache_key = _token_cache_key(token)
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         if DEBUG_AUTH:
             logger.info(f"=== Token Verification Debug ===")
@@ -99,21 +300,9 @@ def verify_auth0_token(token: str) -> dict:
             logger.info(f"Expected audience: {settings.auth0_audience}")
             logger.info(f"Expected issuer: https://{settings.auth0_domain}/")
 
-        # Get the key from JWKS
-        jwks = get_auth0_jwks()
-        rsa_key = {}
-
-        # Find the key that matches the token's kid (key ID)
-        for key in jwks["keys"]:
-            if key["kid"] == unverified_header["kid"]:
-                rsa_key = {
-                    "kty": key["kty"],
-                    "kid": key["kid"],
-                    "use": key["use"],
-                    "n": key["n"],
-                    "e": key["e"],
-                }
-                break
+        # Get the key matching the token's kid (key ID) from the cached JWKS
+        kid = unverified_header.get("kid")
+        rsa_key = await jwks_provider.get_signing_key(kid) if kid else None
 
         if not rsa_key:
             logger.error("Unable to find appropriate signing key")
@@ -144,8 +333,14 @@ def verify_auth0_token(token: str) -> dict:
 
         if DEBUG_AUTH:
             logger.info(f"Token verified successfully! User: {payload.get('sub')}")
+
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            token_cache.set(cache_key, payload, expires_at=exp)
         return payload
 
+    except HTTPException:
+        raise
     except ExpiredSignatureError as e:
         logger.error(f"Token expired: {str(e)}")
         raise HTTPException(
@@ -170,8 +365,8 @@ def verify_auth0_token(token: str) -> dict:
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_session),
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> User:
     """
     FastAPI dependency that authenticates requests and returns the current user.
@@ -180,8 +375,9 @@ async def get_current_user(
     1. Extracts the Bearer token from the Authorization header
     2. Verifies the token with Auth0 (signature, expiration, claims)
     3. Extracts user information from the verified token
-    4. Looks up the user in the database by auth0_id
-    5. Auto-creates the user if this is their first login
+    4. Looks up the user in the identity cache, then the database, by auth0_id
+    5. Auto-creates the user if this is their first login (fetching the email
+       from Auth0's userinfo endpoint if the token does not carry it)
     6. Returns the authenticated User object
 
     Usage:
@@ -202,10 +398,12 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails (invalid token, etc.)
     """
-    token = credentials.credentials
+    return await _user_for_token(credentials.credentials, session)
+
 
+async def _user_for_token(token: str, session: AsyncSession) -> User:
     # Verify token and get claims
-    payload = verify_auth0_token(token)
+    payload = await verify_auth0_token(token)
 
     # Extract user info from verified token
     auth0_id = payload.get("sub")
@@ -217,47 +415,154 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token missing required claim (sub)"
         )
 
-    # If email is missing from token, fetch it from Auth0 userinfo endpoint
-    if not email:
-        try:
-            userinfo_url = f"https://{settings.auth0_domain}/userinfo"
-            response = httpx.get(
-                userinfo_url, headers={"Authorization": f"Bearer {token}"}, timeout=10.0
-            )
-            response.raise_for_status()
-            userinfo = response.json()
+    # Get the user (cached by auth0_id to skip the lookup query)
+    user = await identity_cache.get(session, auth0_id)
+    if user is not None:
+        return user
+
+    user_service = UserService(session)
+    user = await user_service.get_by_auth0_id(auth0_id)
+
+    if not user:
+        # If email is missing from token, fetch it from Auth0 userinfo endpoint
+        if not email:
+            try:
+                userinfo = await userinfo_client.get(auth0_id, token)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail=f"Failed to fetch user info from Auth0: {str(e)}",
+                ) from e
             email = userinfo.get("email")
             if not name:
                 name = userinfo.get("name")
-        except Exception as e:
+
+        if not email:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=f"Failed to fetch user info from Auth0: {str(e)}",
-            ) from e
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Unable to retrieve user email"
+            )
+
+        # Use email as fallback for name if still not set
+        if not name:
+            name = email
+
+        # Auto-create user on first login (SAFE because token is verified).
+        # Upsert, so parallel first requests with a new token all get the same row
+        user_data = UserCreate(auth0_id=auth0_id, email=email, name=name)
+        user = await user_service.provision(user_data)
+
+    await identity_cache.set(user)
+    return user
+
+
+@dataclass(frozen=True)
+class ServicePrincipal:
+    """A machine client authenticated with a service API key."""
+
+    key_id: UUID
+    name: str
+    scopes: frozenset[str]
+
+    def allows(self, tags: list[str], method: str) -> bool:
+        """
+        Check the key's scopes against the tags of the route being called.
+
+        A scope is a router tag (full access), ``<tag>:read`` (safe methods only),
+        ``<tag>:write`` (read and write), or ``*`` (every router).
+        """
+        if "*" in self.scopes:
+            return True
+        read_only = method in ("GET", "HEAD", "OPTIONS")
+        for tag in tags:
+            if tag in self.scopes or f"{tag}:write" in self.scopes:
+                return True
+            if read_only and f"{tag}:read" in self.scopes:
+                return True
+        return False
+
+
+# Verified keys keyed by hash of the full key; short TTL so revocations apply quickly
+service_key_cache: TTLCache[str, ServicePrincipal] = TTLCache(
+    maxsize=1024, ttl=settings.service_key_cache_ttl
+)
+
 
-    if not email:
+async def get_service_principal(
+    request: Request,
+    api_key: Annotated[str | None, Depends(api_key_header)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> ServicePrincipal:
+    """
+    FastAPI dependency that authenticates a machine client by service API key.
+
+    This is the cheap alternative to get_current_user for bulk clients: no RSA
+    verification and, once a key has been seen, no database access. The key's
+    scopes must cover one of the tags of the router handling the request.
+
+    Usage:
+        @router.get("/export")
+        async def export(
+            principal: Annotated[ServicePrincipal, Depends(get_service_principal)],
+        ):
+            ...
+
+    Raises:
+        HTTPException: 401 if the key is missing or invalid, 403 if out of scope
+    """
+    if not api_key:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing API key")
+    return await _service_principal(request, api_key, session)
+
+
+async def _service_principal(
+    request: Request, api_key: str, session: AsyncSession
+) -> ServicePrincipal:
+    cache_key = _token_cache_key(api_key)
+    principal = service_key_cache.get(cache_key)
+    if principal is None:
+        row = await ServiceApiKeyService(session).authenticate(api_key)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+        principal = ServicePrincipal(key_id=row.id, name=row.name, scopes=frozenset(row.scopes))
+        service_key_cache.set(cache_key, principal)
+
+    route = request.scope.get("route")
+    tags = [str(t) for t in getattr(route, "tags", None) or []]
+    if not principal.allows(tags, request.method):
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Unable to retrieve user email"
+            status_code=status.HTTP_403_FORBIDDEN, detail="API key not allowed for this resource"
         )
+    return principal
 
-    # Use email as fallback for name if still not set
-    if not name:
-        name = email
 
-    # Get or create user
-    user_service = UserService(session)
-    user = await user_service.get_by_auth0_id(auth0_id)
+async def get_principal(
+    request: Request,
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(optional_security)],
+    api_key: Annotated[str | None, Depends(api_key_header)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> User | ServicePrincipal:
+    """
+    FastAPI dependency for routes used by both people and machine clients.
 
-    if not user:
-        # Auto-create user on first login (SAFE because token is verified)
-        user_data = UserCreate(auth0_id=auth0_id, email=email, name=name)
-        user_out = await user_service.create(user_data)
-        # Get the actual User model instance
-        user = await user_service.get_by_auth0_id(auth0_id)
+    An X-API-Key header authenticates as get_service_principal does (scoped to
+    the route's tags); otherwise a Bearer token authenticates as get_current_user.
+    Used on the endpoints import scripts and export jobs call, so those can skip
+    the Auth0 round trip and RSA verification.
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to create user"
-            )
+    Raises:
+        HTTPException: 401 if neither credential is present or valid, 403 if an
+            API key is out of scope
+    """
+    if api_key:
+        return await _service_principal(request, api_key, session)
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await _user_for_token(credentials.credentials, session)
 
-    return user
+
+# A signed-in user or a service API key, for routes open to both
+Principal = Annotated[User | ServicePrincipal, Depends(get_principal)]
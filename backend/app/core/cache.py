@@ -0,0 +1,74 @@
+"""
+Small in-process caches shared by the core modules.
+
+TTLCache is a bounded LRU mapping whose entries expire either after a fixed
+time-to-live or at an explicit wall-clock timestamp. It is not thread-safe,
+which is fine for code running on a single asyncio event loop.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, *, expires_at: float | None = None) -> None:
+        """Store ``value``; ``expires_at`` (epoch seconds) overrides the default TTL."""
+        if self.maxsize <= 0:
+            return
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits, misses=self.misses, size=len(self._data), maxsize=self.maxsize
+        )
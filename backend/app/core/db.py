@@ -1,32 +1,235 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
 from functools import lru_cache
+from typing import Any
 
+from fastapi import Request, Response
+from sqlalchemy import exc, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from app.core import query_stats
 from app.settings import settings
 
+# Cookie set after a successful write; reads go to the primary until it expires
+PRIMARY_PIN_COOKIE = "db_primary_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Upper bounds (ms) of the pool wait-time histogram buckets; the last bucket is open
+WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass
+class PoolStats:
+    """Counters collected by InstrumentedPool while handing out connections."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    waiters: int = 0
+    max_waiters: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+    wait_buckets: list[int] = field(default_factory=lambda: [0] * (len(WAIT_BUCKETS_MS) + 1))
+
+    def observe_wait(self, wait_ms: float) -> None:
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.wait_buckets[i] += 1
+                return
+        self.wait_buckets[-1] += 1
+
+    def histogram(self) -> dict[str, int]:
+        labels = [f"le_{bound:g}ms" for bound in WAIT_BUCKETS_MS] + ["inf"]
+        return dict(zip(labels, self.wait_buckets, strict=True))
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):  # type: ignore[override]
+        # A caller has to wait when nothing is idle and overflow is exhausted
+        waiting = self.checkedin() == 0 and self._overflow >= self._max_overflow > -1
+        if waiting:
+            self.stats.waiters += 1
+            self.stats.max_waiters = max(self.stats.max_waiters, self.stats.waiters)
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            if waiting:
+                self.stats.waiters -= 1
+        self.stats.checkouts += 1
+        self.stats.observe_wait((time.perf_counter() - start) * 1000)
+        return entry
+
+    def recreate(self) -> InstrumentedPool:
+        # Keep counting across dispose()/invalidation, which swap in a fresh pool
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool  # type: ignore[return-value]
+
+
+def make_engine(url: str, **overrides: Any) -> AsyncEngine:
+    """Create an engine whose pool is sized and tuned from settings."""
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+    options.update(overrides)
+    engine = create_async_engine(url, **options)
+    query_stats.install(engine)
+    return engine
+
 
 @lru_cache
 def get_engine(url: str | None = None) -> AsyncEngine:
     db_url = url or settings.db_url
-    return create_async_engine(db_url, pool_pre_ping=True)
+    return make_engine(db_url)
+
+
+@lru_cache
+def get_read_engine() -> AsyncEngine:
+    """Engine for the read replica, or the primary engine when none is configured."""
+    if not settings.db_replica_url:
+        return get_engine()
+    return make_engine(settings.db_replica_url)
+
+
+def has_replica() -> bool:
+    return bool(settings.db_replica_url)
+
+
+def pool_status(engine: AsyncEngine | None = None) -> dict[str, Any]:
+    """Snapshot of the engine's pool occupancy and wait-time statistics."""
+    pool = (engine or get_engine()).pool
+    status: dict[str, Any] = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": pool._max_overflow,
+        "timeout": pool.timeout(),
+    }
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        status.update(
+            waiters=stats.waiters,
+            max_waiters=stats.max_waiters,
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            wait_avg_ms=round(stats.wait_total_ms / stats.checkouts, 3) if stats.checkouts else 0.0,
+            wait_max_ms=round(stats.wait_max_ms, 3),
+            wait_histogram=stats.histogram(),
+        )
+    return status
 
 
 def get_session_maker(
     engine: AsyncEngine | None = None,
 ) -> async_sessionmaker[AsyncSession]:
-    engine = engine or get_engine()
+    if engine is None:
+        return _default_session_maker()
     return async_sessionmaker(engine, expire_on_commit=False)
 
 
+@lru_cache
+def _default_session_maker() -> async_sessionmaker[AsyncSession]:
+    # Built once per process; get_session runs on every request
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
+@lru_cache
+def _read_session_maker() -> async_sessionmaker[AsyncSession]:
+    if not has_replica():
+        return _default_session_maker()
+    return async_sessionmaker(get_read_engine(), expire_on_commit=False)
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` pooled connections and run a trivial query on each.
+
+    The connections are returned to the pool afterwards, so the first requests
+    after startup do not pay for TCP, TLS and authentication handshakes.
+    """
+    connections = min(connections, engine.pool.size())
+    if connections <= 0:
+        return
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        for conn in conns:
+            await conn.execute(text("SELECT 1"))
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and forget the process-wide engines."""
+    if get_read_engine.cache_info().currsize and has_replica():
+        await get_read_engine().dispose()
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    _read_session_maker.cache_clear()
+    _default_session_maker.cache_clear()
+    get_read_engine.cache_clear()
+    get_engine.cache_clear()
+
+
 async def get_session() -> AsyncIterator[AsyncSession]:
     async_session = get_session_maker()
     async with async_session() as session:
         yield session
+
+
+def pin_to_primary(response: Response) -> None:
+    """Send this client's reads to the primary for DB_REPLICA_PIN_SECONDS.
+
+    Called after a successful write so that the client's next reads see it
+    even while the replica is still catching up.
+    """
+    until = time.time() + settings.db_replica_pin_seconds
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        f"{until:.3f}",
+        max_age=max(1, int(settings.db_replica_pin_seconds)),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, "0")) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """Session for read-only handlers, bound to the replica when one is configured."""
+    pinned = is_pinned_to_primary(request)
+    async_session = get_session_maker() if pinned else _read_session_maker()
+    async with async_session() as session:
+        yield session
@@ -0,0 +1,126 @@
+"""
+Cache of resolved users keyed by Auth0 ID (the token's ``sub`` claim).
+
+get_current_user maps every authenticated request to a User row. The mapping
+rarely changes, so the resolved row is cached here and re-attached to the
+request's session without a database round trip.
+
+By default entries live in process memory. Setting IDENTITY_CACHE_REDIS_URL
+shares them between workers through Redis (requires the optional ``redis``
+package). UserService invalidates entries when a user is updated or deleted.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Protocol
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession, async_object_session
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import TTLCache
+from app.models.user import User
+from app.schemas.user import UserOut
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "identity:user:"
+
+
+class IdentityCacheBackend(Protocol):
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, value: str) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class MemoryIdentityBackend:
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str) -> str | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+
+class RedisIdentityBackend:
+    def __init__(self, url: str, *, ttl: float) -> None:
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError(
+                "IDENTITY_CACHE_REDIS_URL is set but the 'redis' package is not installed"
+            ) from e
+        self._redis = aioredis.from_url(url)
+        self._ttl = max(1, int(ttl))
+
+    async def get(self, key: str) -> str | None:
+        value = await self._redis.get(key)
+        return value.decode() if value is not None else None
+
+    async def set(self, key: str, value: str) -> None:
+        await self._redis.set(key, value, ex=self._ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+
+class IdentityCache:
+    def __init__(self, backend: IdentityCacheBackend) -> None:
+        self.backend = backend
+
+    async def get(self, session: AsyncSession, auth0_id: str) -> User | None:
+        """Return the cached user attached to ``session``, or None on a miss."""
+        try:
+            data = await self.backend.get(KEY_PREFIX + auth0_id)
+        except Exception as e:
+            logger.warning(f"Identity cache lookup failed: {e}")
+            return None
+        if data is None:
+            return None
+
+        snapshot = UserOut.model_validate_json(data)
+        user = User(**snapshot.model_dump())
+        make_transient_to_detached(user)
+        # load=False trusts the snapshot instead of SELECTing the row again
+        return await session.merge(user, load=False)
+
+    async def set(self, user: User) -> None:
+        state = inspect(user)
+        # Deferred columns (preferences) belong in the snapshot too
+        missing = [a.key for a in state.mapper.column_attrs if a.key in state.unloaded]
+        if missing and (session := async_object_session(user)) is not None:
+            await session.refresh(user, missing)
+        data = UserOut.model_validate(user).model_dump_json()
+        try:
+            await self.backend.set(KEY_PREFIX + user.auth0_id, data)
+        except Exception as e:
+            logger.warning(f"Identity cache store failed: {e}")
+
+    async def invalidate(self, *auth0_ids: str) -> None:
+        for auth0_id in auth0_ids:
+            try:
+                await self.backend.delete(KEY_PREFIX + auth0_id)
+            except Exception as e:
+                logger.warning(f"Identity cache invalidation failed: {e}")
+
+
+def _make_backend() -> IdentityCacheBackend:
+    if settings.identity_cache_redis_url:
+        return RedisIdentityBackend(
+            settings.identity_cache_redis_url, ttl=settings.identity_cache_ttl
+        )
+    return MemoryIdentityBackend(
+        maxsize=settings.identity_cache_size, ttl=settings.identity_cache_ttl
+    )
+
+
+identity_cache = IdentityCache(_make_backend())
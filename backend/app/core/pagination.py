@@ -1,17 +1,76 @@
+import base64
+import datetime as dt
+import json
 import math
-from typing import Annotated
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, Generic, Literal, TypeVar
+from uuid import UUID
 
-from fastapi import Query, Request, Response
+from fastapi import HTTPException, Query, Request, Response, status
+from sqlalchemy import ColumnElement, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+TotalMode = Literal["exact", "estimate", "none"]
+SearchOrder = Literal["name", "similarity"]
 
 Limit = Annotated[int, Query(ge=1, le=200, description="Max items to return (1-200)")]
 Offset = Annotated[int, Query(ge=0, description="Number of items to skip")]
+Total = Annotated[
+    TotalMode,
+    Query(
+        description=(
+            "exact: count all matching rows (default); estimate: use the query planner's "
+            "row estimate; none: skip counting"
+        ),
+    ),
+]
+Sort = Annotated[
+    SearchOrder,
+    Query(
+        description=(
+            "name: alphabetical (default); similarity: closest trigram match to q first, "
+            "then by name. similarity requires q"
+        ),
+    ),
+]
+Cursor = Annotated[
+    str | None,
+    Query(
+        max_length=512,
+        description=(
+            'Opaque cursor from a rel="next" Link header; pass an empty value to get the '
+            "first page. Switches to keyset pagination, which ignores offset and skips the "
+            "total count"
+        ),
+    ),
+]
+
+
+@dataclass
+class OffsetPage(Generic[T]):
+    items: list[T]
+    total: int | None
+    has_more: bool
+    estimated: bool = False
+
+    def map(self, fn: Callable[[T], U]) -> "OffsetPage[U]":
+        return OffsetPage(
+            items=[fn(item) for item in self.items],
+            total=self.total,
+            has_more=self.has_more,
+            estimated=self.estimated,
+        )
 
 
 def add_pagination_headers(
     *,
     response: Response,
     request: Request,
-    total: int,
+    page: OffsetPage[Any],
     limit: int,
     offset: int,
 ) -> None:
@@ -27,7 +86,7 @@ def add_pagination_headers(
         )
 
     # next
-    if offset + limit < total:
+    if page.has_more:
         links.append(f'<{url_with(offset + limit)}>; rel="next"')
 
     # prev
@@ -35,14 +94,105 @@ def add_pagination_headers(
         prev_offset = max(0, offset - limit)
         links.append(f'<{url_with(prev_offset)}>; rel="prev"')
 
-    # first & last
+    # first & last (last only when the total is exact)
     links.append(f'<{url_with(0)}>; rel="first"')
-    last_offset = 0 if total == 0 else max(0, (math.ceil(total / limit) - 1) * limit)
-    links.append(f'<{url_with(last_offset)}>; rel="last"')
+    if page.total is not None and not page.estimated:
+        total = page.total
+        last_offset = 0 if total == 0 else max(0, (math.ceil(total / limit) - 1) * limit)
+        links.append(f'<{url_with(last_offset)}>; rel="last"')
 
     if links:
         response.headers["Link"] = ", ".join(links)
 
-    response.headers["X-Total-Count"] = str(total)
+    if page.total is not None:
+        header = "X-Total-Count-Estimate" if page.estimated else "X-Total-Count"
+        response.headers[header] = str(page.total)
     response.headers["X-Limit"] = str(limit)
     response.headers["X-Offset"] = str(offset)
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+class Keyset:
+    """Sort order for cursor pagination; the last column must be unique (the id).
+
+    Cursors encode the sort values of the last item on a page, and the next page
+    is fetched with a row comparison on those values, so every page costs the
+    same index range scan regardless of depth.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute[Any], descending: bool = False) -> None:
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self) -> list[ColumnElement[Any]]:
+        return [c.desc() if self.descending else c.asc() for c in self.columns]
+
+    def after(self, cursor: str) -> ColumnElement[bool]:
+        """Filter selecting the rows that come after ``cursor`` in this order."""
+        values = self.decode(cursor)
+        key = tuple_(*self.columns)
+        bound = tuple_(*(literal(v, c.type) for c, v in zip(self.columns, values, strict=True)))
+        return key < bound if self.descending else key > bound
+
+    def encode(self, item: Any) -> str:
+        values = []
+        for column in self.columns:
+            value = getattr(item, column.key)
+            values.append(value.isoformat() if isinstance(value, dt.datetime) else value)
+        raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError("wrong number of values")
+            return [
+                _from_json(column.type.python_type, value)
+                for column, value in zip(self.columns, values, strict=True)
+            ]
+        except (ValueError, TypeError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from e
+
+    def cursor_page(self, page: OffsetPage[T]) -> CursorPage[T]:
+        """Turn a page fetched after a cursor (with ``total="none"``) into a cursor page."""
+        next_cursor = self.encode(page.items[-1]) if page.has_more and page.items else None
+        return CursorPage(items=page.items, next_cursor=next_cursor)
+
+
+def _from_json(python_type: type, value: Any) -> Any:
+    if value is None:
+        return None
+    if python_type is dt.datetime:
+        return dt.datetime.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    if not isinstance(value, python_type):
+        raise TypeError(f"expected {python_type.__name__}")
+    return value
+
+
+def add_cursor_headers(
+    *,
+    response: Response,
+    request: Request,
+    next_cursor: str | None,
+    limit: int,
+) -> None:
+    """Attach RFC 8288 Link headers for a keyset-paginated response."""
+    base = request.url.remove_query_params("offset")
+    links: list[str] = []
+    if next_cursor is not None:
+        links.append(f'<{base.include_query_params(cursor=next_cursor, limit=limit)}>; rel="next"')
+    links.append(f'<{base.include_query_params(cursor="", limit=limit)}>; rel="first"')
+
+    response.headers["Link"] = ", ".join(links)
+    response.headers["X-Limit"] = str(limit)
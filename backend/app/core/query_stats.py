@@ -0,0 +1,106 @@
+"""
+Per-request SQL statement accounting.
+
+install() attaches cursor-execute hooks to an engine. While a request is being
+handled (see track()), every statement it issues is counted and timed, and
+statements are grouped by fingerprint: the SQL with bound parameters and
+literals replaced by ``?``. When one fingerprint runs more than
+SQL_REPEAT_WARN_THRESHOLD times in a request, a warning is logged once with
+that fingerprint; this is the usual signature of an N+1 lazy load.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_BIND_PARAM = re.compile(r"%\(\w+\)s|\$\d+|(?<![:\w])[:@]\w+|\?")
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalise ``statement`` so that executions differing only in values match."""
+    sql = _POSTCOMPILE.sub("(?)", statement)
+    sql = _STRING.sub("?", sql)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    label: str = ""
+    statements: int = 0
+    db_time_ms: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.statements += 1
+        self.db_time_ms += elapsed_ms
+        shape = fingerprint(statement)
+        self.shapes[shape] += 1
+        threshold = settings.sql_repeat_warn_threshold
+        if threshold and self.shapes[shape] == threshold + 1:
+            logger.warning(
+                f"Possible N+1 in {self.label or 'request'}: statement ran more than "
+                f"{threshold} times: {shape}"
+            )
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current() -> QueryStats | None:
+    return _current.get()
+
+
+@contextmanager
+def track(label: str = "") -> Iterator[QueryStats]:
+    """Count the statements executed in this context (and tasks it starts)."""
+    stats = QueryStats(label=label)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    start = conn.info.pop("query_start", None)
+    if stats is None or start is None:
+        return
+    stats.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def install(engine: Any) -> None:
+    """Attach the statement hooks to ``engine`` (sync or async)."""
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
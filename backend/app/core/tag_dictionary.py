@@ -0,0 +1,142 @@
+"""
+Process-local dictionary of tags for typeahead.
+
+Tags are global and few, so each worker keeps all of them in memory: a list
+sorted by case-folded name answers prefix lookups with a binary search, and
+substring lookups scan the same list without touching the database. Matches
+rank prefix hits first, then by how much content uses the tag.
+
+The dictionary loads lazily on first use (and at startup, see app.main) and
+reloads once it is invalidated or older than TAG_DICTIONARY_TTL. TagService
+sends a NOTIFY on CHANNEL in the transaction that creates, renames or deletes a
+tag; listen() runs in every worker and invalidates its copy when one arrives,
+so workers pick up the change on their next lookup. Usage counts are only
+refreshed by the TTL; attaching a tag does not invalidate anything.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from itertools import chain
+from uuid import UUID
+
+import psycopg
+from sqlalchemy.engine import make_url
+
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "tags_changed"
+LISTEN_RETRY_SECONDS = 5.0
+
+# Sorts after any character a tag name can contain; bounds a prefix range
+_PREFIX_END = "\U0010ffff"
+
+
+@dataclass(frozen=True)
+class TagEntry:
+    id: UUID
+    name: str
+    usage_count: int
+
+    @property
+    def rank(self) -> tuple[int, str]:
+        return -self.usage_count, self.name.casefold()
+
+
+Loader = Callable[[], Awaitable[Iterable[tuple[UUID, str, int]]]]
+
+
+class TagDictionary:
+    def __init__(self, *, ttl: float) -> None:
+        self.ttl = ttl
+        self._keys: list[str] = []
+        self._entries: list[TagEntry] = []
+        self._loaded_at: float | None = None
+        # Bumped by invalidate(); a reload that started before the bump stays stale
+        self._generation = 0
+        self._loaded_generation = -1
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or self._loaded_generation != self._generation
+            or time.monotonic() - self._loaded_at > self.ttl
+        )
+
+    def invalidate(self) -> None:
+        self._generation += 1
+
+    def load(self, rows: Iterable[tuple[UUID, str, int]], *, generation: int | None = None) -> None:
+        """Replace the contents with ``(id, name, usage_count)`` rows."""
+        entries = sorted(
+            (TagEntry(id=tag_id, name=name, usage_count=count) for tag_id, name, count in rows),
+            key=lambda e: e.name.casefold(),
+        )
+        self._keys = [e.name.casefold() for e in entries]
+        self._entries = entries
+        self._loaded_at = time.monotonic()
+        self._loaded_generation = self._generation if generation is None else generation
+
+    async def ensure_loaded(self, loader: Loader) -> None:
+        """Reload through ``loader`` if stale; concurrent callers share one reload."""
+        if not self.stale:
+            return
+        async with self._lock:
+            if not self.stale:
+                return
+            generation = self._generation
+            self.load(await loader(), generation=generation)
+
+    def suggest(self, q: str, limit: int = 10) -> list[TagEntry]:
+        """Tags whose name starts with, then contains, ``q`` (case-insensitive)."""
+        key = q.strip().casefold()
+        if not key or limit <= 0:
+            return []
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + _PREFIX_END, lo)
+        ranked = heapq.nsmallest(limit, self._entries[lo:hi], key=lambda e: e.rank)
+        if len(ranked) < limit:
+            contains = (
+                self._entries[i]
+                for i in chain(range(lo), range(hi, len(self._keys)))
+                if key in self._keys[i]
+            )
+            ranked += heapq.nsmallest(limit - len(ranked), contains, key=lambda e: e.rank)
+        return ranked
+
+
+async def listen(dictionary: TagDictionary, url: str | None = None) -> None:
+    """Invalidate ``dictionary`` on every CHANNEL notification until cancelled.
+
+    Uses its own connection rather than one from the pool, and reconnects after
+    LISTEN_RETRY_SECONDS if it drops. Notifications sent while disconnected are
+    lost, so the dictionary is invalidated on every (re)connect.
+    """
+    conninfo = make_url(url or settings.db_url).set(drivername="postgresql")
+    dsn = conninfo.render_as_string(hide_password=False)
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as conn:
+                await conn.execute(f"LISTEN {CHANNEL}")
+                dictionary.invalidate()
+                async for _ in conn.notifies():
+                    dictionary.invalidate()
+        except (OSError, psycopg.Error) as e:
+            logger.warning(f"Tag dictionary listener disconnected: {e}")
+        await asyncio.sleep(LISTEN_RETRY_SECONDS)
+
+
+tag_dictionary = TagDictionary(ttl=settings.tag_dictionary_ttl)
@@ -3,3 +3,8 @@ from typing import Final
 NAME_MIN: Final[int] = 1
 NAME_MAX: Final[int] = 100
 DESC_MAX: Final[int] = 1000
+
+# Text search configuration for content.search_vector and the queries against it.
+# Content is mostly Icelandic: "simple" only lowercases, where "english" would
+# stem Icelandic words and drop the ones that happen to be English stop words
+SEARCH_CONFIG: Final[str] = "simple"
@@ -0,0 +1,7 @@
+from typing import Final
+
+NAME_MIN: Final[int] = 1
+NAME_MAX: Final[int] = 100
+
+PREFIX_LEN: Final[int] = 12
+SCOPE_MAX: Final[int] = 50
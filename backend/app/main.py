@@ -1,30 +1,80 @@
 # app/main.py
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.requests import Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core import query_stats
+from app.core.auth import close_http_client
+from app.core.db import (
+    SAFE_METHODS,
+    dispose_engine,
+    get_engine,
+    get_read_engine,
+    get_session_maker,
+    has_replica,
+    pin_to_primary,
+    pool_status,
+    warm_up,
+)
 from app.core.logging import configure_logging
+from app.core.tag_dictionary import listen, tag_dictionary
+from app.repositories.tags import TagRepository
 from app.routers import (
     comments_router,
+    content_router,
     email_list_router,
     events_router,
     groups_router,
     likes_router,
     programs_router,
+    search_router,
     tags_router,
     tasks_router,
     troops_router,
     users_router,
     workspaces_router,
 )
+from app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Build the engine and session factory before serving the first request
+    engines = [get_engine()]
+    if has_replica():
+        engines.append(get_read_engine())
+    session_maker = get_session_maker()
+    try:
+        for engine in engines:
+            await warm_up(engine, settings.db_pool_warmup)
+        async with session_maker() as session:
+            await tag_dictionary.ensure_loaded(TagRepository(session).usage_counts)
+    except Exception as e:
+        # Requests will still connect lazily once the database is reachable
+        logger.warning(f"Database warm-up failed: {e}")
+    tag_listener = asyncio.create_task(listen(tag_dictionary))
+    try:
+        yield
+    finally:
+        tag_listener.cancel()
+        await asyncio.gather(tag_listener, return_exceptions=True)
+        await close_http_client()
+        await dispose_engine()
 
 
 def create_app() -> FastAPI:
     configure_logging()
-    app = FastAPI(title="Backend API")
+    app = FastAPI(title="Backend API", lifespan=lifespan)
 
     # Add CORS middleware
     app.add_middleware(
@@ -37,6 +87,28 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+
+    # Statement counts and pool internals are for local debugging and load tests only
+    expose_diagnostics = settings.env.lower() != "production"
+
+    @app.middleware("http")
+    async def count_queries(request: Request, call_next):
+        with query_stats.track(f"{request.method} {request.url.path}") as stats:
+            response = await call_next(request)
+        if expose_diagnostics:
+            response.headers["X-DB-Statements"] = str(stats.statements)
+            response.headers["X-DB-Time-Ms"] = f"{stats.db_time_ms:.1f}"
+        return response
+
+    if has_replica():
+
+        @app.middleware("http")
+        async def read_your_writes(request: Request, call_next):
+            response = await call_next(request)
+            if request.method not in SAFE_METHODS and response.status_code < 400:
+                pin_to_primary(response)
+            return response
+
     app.include_router(email_list_router.router)
     app.include_router(users_router.router)
     app.include_router(groups_router.router)
@@ -47,12 +119,23 @@ def create_app() -> FastAPI:
     app.include_router(tasks_router.router)
     app.include_router(tags_router.router)
     app.include_router(comments_router.router)
+    app.include_router(content_router.router)
     app.include_router(likes_router.router)
+    app.include_router(search_router.router)
 
     @app.get("/healthz")
     async def healthz():
         return {"ok": True}
 
+    if expose_diagnostics:
+
+        @app.get("/healthz/pool", include_in_schema=False)
+        async def healthz_pool():
+            status = pool_status()
+            if has_replica():
+                status["replica"] = pool_status(get_read_engine())
+            return status
+
     @app.get("/docs", include_in_schema=False)
     async def custom_swagger_ui_html(req: Request):
         root_path = req.scope.get("root_path", "").rstrip("/")
@@ -4,6 +4,7 @@ from .content import Content, ContentType  # noqa: F401
 from .event import Event  # noqa: F401
 from .group import Group, GroupMembership, GroupRole  # noqa: F401
 from .program import Program  # noqa: F401
+from .service_key import ServiceApiKey  # noqa: F401
 from .tag import ContentTag, Tag  # noqa: F401
 from .task import Task  # noqa: F401
 from .troop import Troop, TroopParticipation  # noqa: F401
@@ -1,5 +1,57 @@
+from typing import Any
+
+from sqlalchemy import DDL, Connection, Index, event, inspect, text
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
+
+
+class Loaded:
+    """Attribute view of an ORM instance that hides attributes not loaded yet.
+
+    Reading a deferred column or an unloaded relationship through it raises
+    AttributeError instead of emitting a lazy load (which an AsyncSession cannot
+    do). Pydantic's from_attributes treats that as a missing field, so a schema
+    validated from ``Loaded(row)`` leaves those fields unset.
+    """
+
+    __slots__ = ("_instance", "_unloaded")
+
+    def __init__(self, instance: Any) -> None:
+        self._instance = instance
+        self._unloaded = inspect(instance).unloaded
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._unloaded:
+            raise AttributeError(name)
+        return getattr(self._instance, name)
+
+
+def _pg_trgm_available(ddl: Any, target: Any, bind: Connection | None, **kw: Any) -> bool:
+    # Without a connection (offline SQL) assume a full Postgres install
+    if bind is None:
+        return True
+    found = bind.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+    return found.first() is not None
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """GIN trigram index on ``column``, serving ILIKE '%q%' and similarity searches.
+
+    Migrations always create it. create_all (tests, local setups) skips it on servers
+    built without the pg_trgm contrib module, where searches fall back to a scan.
+    """
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql", callable_=_pg_trgm_available)
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql", callable_=_pg_trgm_available
+    ),
+)
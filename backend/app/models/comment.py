@@ -20,12 +20,11 @@ if TYPE_CHECKING:
 
 class Comment(Base):
     __tablename__ = "comments"
-    __table_args__ = (
-        Index("ix_comments_content_id_created_at", "content_id", "created_at"),
-        Index("ix_comments_user_id_created_at", "user_id", "created_at"),
-    )
     __table_args__ = (
         CheckConstraint(f"char_length(body) >= {BODY_MIN}", name="ck_comment_body_min"),
+        # Serves the newest-first comment list (created_at, id) for one content
+        Index("ix_comments_content_id_created_at", "content_id", "created_at", "id"),
+        Index("ix_comments_user_id_created_at", "user_id", "created_at"),
     )
 
     # Columns
@@ -7,10 +7,13 @@ from uuid import UUID, uuid4
 
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy import Enum as SAEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import DateTime as SADateTime
@@ -20,6 +23,7 @@ from app.domain.content_constraints import (
     DESC_MAX,
     NAME_MAX,
     NAME_MIN,
+    SEARCH_CONFIG,
 )
 
 from .base import Base
@@ -30,6 +34,13 @@ if TYPE_CHECKING:
     from .user import User
 
 
+# Name matches rank above description matches
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+
 class ContentType(str, Enum):
     program = "program"
     event = "event"
@@ -45,7 +56,11 @@ class Content(Base):
     }
     __table_args__ = (
         CheckConstraint("like_count >= 0", name="ck_content_like_nonneg"),
+        CheckConstraint("comment_count >= 0", name="ck_content_comment_count_nonneg"),
         CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_content_name_min"),
+        Index("ix_content_search_vector", "search_vector", postgresql_using="gin"),
+        # GET /content pages newest first
+        Index("ix_content_created_at_id", "created_at", "id"),
     )
 
     # Columns
@@ -61,9 +76,25 @@ class Content(Base):
     )
     name: Mapped[str] = mapped_column(String(NAME_MAX), nullable=False)
     description: Mapped[str | None] = mapped_column(String(DESC_MAX), nullable=True)
+    # Counters maintained by LikeService and CommentService on write; repaired in
+    # bulk by app.commands.reconcile_counts
     like_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
+        default=0,
+        server_default="0",
+    )
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    # Kept up to date by Postgres; only search queries read it
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
     )
     created_at: Mapped[dt.datetime] = mapped_column(
         SADateTime(timezone=True),
@@ -89,8 +120,3 @@ class Content(Base):
     def tags(self):
         """Return list of Tag objects from content_tags relationship"""
         return [ct.tag for ct in self.content_tags]
-
-    @property
-    def comment_count(self) -> int:
-        """Return count of comments for this content"""
-        return len(self.comments) if self.comments else 0
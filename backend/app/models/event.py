@@ -4,7 +4,7 @@ import datetime as dt
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, ForeignKeyConstraint, String
+from sqlalchemy import ForeignKey, ForeignKeyConstraint, Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import DateTime as SADateTime
@@ -32,6 +32,9 @@ class Event(Content):
             deferrable=True,
             initially="DEFERRED",
         ),
+        # Event lists filter by workspace or program and sort by (start_dt, id)
+        Index("ix_events_workspace_id_start_dt", "workspace_id", "start_dt", "id"),
+        Index("ix_events_program_id_start_dt", "program_id", "start_dt", "id"),
     )
 
     # Columns
@@ -5,14 +5,14 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, ForeignKey, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, String
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.group_constraints import IMG_MAX, NAME_MAX, NAME_MIN
 
-from .base import Base
+from .base import Base, trigram_index
 
 if TYPE_CHECKING:
     from .user import User
@@ -30,6 +30,7 @@ class Group(Base):
     __tablename__ = "groups"
     __table_args__ = (
         CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_group_name_min"),
+        trigram_index("ix_groups_name_trgm", "name"),
     )
 
     # Columns
@@ -53,6 +54,7 @@ class Group(Base):
 
 class GroupMembership(Base):
     __tablename__ = "group_memberships"
+    __table_args__ = (Index("ix_group_memberships_group_id", "group_id"),)
 
     # Columns
     user_id: Mapped[UUID] = mapped_column(
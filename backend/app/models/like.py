@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,6 +11,10 @@ from .base import Base
 
 class UserLikedContent(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # The primary key leads with user_id; per-content lookups need their own index
+        Index("ix_likes_content_id", "content_id"),
+    )
 
     # Columns
     user_id: Mapped[UUID] = mapped_column(
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import datetime as dt
+from uuid import UUID, uuid4
+
+from sqlalchemy import CheckConstraint, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import DateTime as SADateTime
+
+from app.domain.service_key_constraints import NAME_MAX, NAME_MIN, PREFIX_LEN, SCOPE_MAX
+
+from .base import Base
+
+
+class ServiceApiKey(Base):
+    """
+    API key for machine clients (import scripts, export jobs).
+
+    Only an HMAC of the secret part is stored; ``prefix`` is the public part of
+    the key used to find the row.
+    """
+
+    __tablename__ = "service_api_keys"
+    __table_args__ = (
+        UniqueConstraint("prefix", name="uq_service_api_keys_prefix"),
+        CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_service_api_keys_name_min"),
+    )
+
+    # Columns
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        nullable=False,
+        default=uuid4,
+    )
+    name: Mapped[str] = mapped_column(String(NAME_MAX), nullable=False)
+    prefix: Mapped[str] = mapped_column(String(PREFIX_LEN), nullable=False)
+    key_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    scopes: Mapped[list[str]] = mapped_column(ARRAY(String(SCOPE_MAX)), nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        SADateTime(timezone=True),
+        nullable=False,
+    )
+    revoked_at: Mapped[dt.datetime | None] = mapped_column(
+        SADateTime(timezone=True),
+        nullable=True,
+    )
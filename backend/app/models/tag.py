@@ -3,13 +3,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, ForeignKey, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.tag_constraints import NAME_MAX, NAME_MIN
 
-from .base import Base
+from .base import Base, trigram_index
 
 if TYPE_CHECKING:
     from .content import Content
@@ -20,6 +20,7 @@ class Tag(Base):
     __table_args__ = (
         CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_tag_name_min"),
         UniqueConstraint("name", name="uq_tag_name"),
+        trigram_index("ix_tags_name_trgm", "name"),
     )
 
     # Columns
@@ -38,6 +39,8 @@ class Tag(Base):
 
 class ContentTag(Base):
     __tablename__ = "content_tags"
+    # The primary key leads with content_id; tag pages look up by tag_id
+    __table_args__ = (Index("ix_content_tags_tag_id_content_id", "tag_id", "content_id"),)
 
     # Columns
     content_id: Mapped[UUID] = mapped_column(
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -17,6 +17,15 @@ if TYPE_CHECKING:
 class Task(Content):
     __tablename__ = "tasks"
     __mapper_args__ = {"polymorphic_identity": ContentType.task}
+    __table_args__ = (
+        Index("ix_tasks_event_id", "event_id"),
+        # Content query filters: duration range
+        Index("ix_tasks_estimated_duration", "estimated_duration"),
+        # Key existence (?, ?&, ?|) and containment (@>) filters. The default
+        # jsonb_ops opclass serves both; jsonb_path_ops only serves containment
+        Index("ix_tasks_equipment", "equipment", postgresql_using="gin"),
+        Index("ix_tasks_media", "media", postgresql_using="gin"),
+    )
 
     # Columns
     id: Mapped[UUID] = mapped_column(
@@ -26,8 +35,9 @@ class Task(Content):
         nullable=False,
     )
 
-    equipment: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
-    media: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    # Deferred: list views leave them out unless asked for (?include=)
+    equipment: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True, deferred=True)
+    media: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True, deferred=True)
 
     event_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 class Troop(Base):
     __tablename__ = "troops"
+    __table_args__ = (Index("ix_troops_workspace_id_name", "workspace_id", "name"),)
 
     # Columns
     id: Mapped[UUID] = mapped_column(
@@ -45,6 +46,8 @@ class Troop(Base):
 
 class TroopParticipation(Base):
     __tablename__ = "troop_participation"
+    # The primary key leads with troop_id; listing an event's troops needs event_id first
+    __table_args__ = (Index("ix_troop_participation_event_id", "event_id"),)
 
     # Columns
     troop_id: Mapped[UUID] = mapped_column(
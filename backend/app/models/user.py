@@ -4,7 +4,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, String, UniqueConstraint
+from sqlalchemy import CheckConstraint, Index, String, UniqueConstraint, text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
@@ -23,7 +23,7 @@ from app.domain.user_constraints import (
     NAME_MIN,
 )
 
-from .base import Base
+from .base import Base, trigram_index
 
 if TYPE_CHECKING:
     from .comment import Comment
@@ -47,6 +47,12 @@ class User(Base):
         UniqueConstraint("email", name="uq_users_email"),
         CheckConstraint(f"char_length(name) >= {NAME_MIN}", name="ck_users_name_min"),
         CheckConstraint(f"char_length(auth0_id) >= {AUTH0_ID_MIN}", name="ck_users_auth0_min"),
+        # get_by_email compares lower(email), which the plain email index cannot serve
+        Index("ix_users_lower_email", text("lower(email)")),
+        # The user search matches q anywhere in name, email or auth0_id
+        trigram_index("ix_users_name_trgm", "name"),
+        trigram_index("ix_users_email_trgm", "email"),
+        trigram_index("ix_users_auth0_id_trgm", "auth0_id"),
     )
 
     # Columns
@@ -66,6 +72,7 @@ class User(Base):
     name: Mapped[str] = mapped_column(
         String(NAME_MAX),
         nullable=False,
+        index=True,
     )
 
     pronouns: Mapped[Pronouns | None] = mapped_column(
@@ -79,9 +86,11 @@ class User(Base):
         index=True,
     )
 
+    # Deferred: list views and embedded authors leave it out (see UserListItem)
     preferences: Mapped[dict[str, Any] | None] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
     )
 
     # Relationships
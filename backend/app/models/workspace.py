@@ -9,6 +9,7 @@ from sqlalchemy import (
     CheckConstraint,
     Date,
     ForeignKey,
+    Index,
     String,
     Time,
 )
@@ -84,7 +85,8 @@ class Workspace(Base):
     )
     season_start: Mapped[dt.date] = mapped_column(Date, nullable=False)
 
-    settings: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    # Deferred: list views leave it out unless asked for (?include=)
+    settings: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True, deferred=True)
 
     group_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("groups.id"), nullable=True
@@ -119,6 +121,7 @@ class Workspace(Base):
 
 class WorkspaceMembership(Base):
     __tablename__ = "workspace_memberships"
+    __table_args__ = (Index("ix_workspace_memberships_user_id", "user_id"),)
 
     # Columns
     workspace_id: Mapped[UUID] = mapped_column(
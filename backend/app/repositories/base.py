@@ -1,13 +1,74 @@
 from __future__ import annotations
 
+import asyncio
+import re
 from collections.abc import Sequence
 from typing import Any, TypeVar
 
-from sqlalchemy import Select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ClauseElement,
+    ColumnElement,
+    Executable,
+    Select,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.sql.compiler import SQLCompiler
+
+from app.core.pagination import OffsetPage, TotalMode
+from app.settings import settings
 
 T = TypeVar("T")
 
+TOTAL_COLUMN = "_total_count"
+
+# Set in Session.info once the current transaction has written; a second connection
+# would not see those rows, so counts then stay on the session's own connection
+_WROTE = "wrote_in_transaction"
+_SNAPSHOT_ID = re.compile(r"^[0-9A-F]+-[0-9A-F]+(-[0-9]+)?$")
+_SNAPSHOT_LEVELS = {"REPEATABLE READ", "SERIALIZABLE"}
+_LIKE_SPECIAL = re.compile(r"[\\%_]")
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _transaction_ended(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_WROTE, None)
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>``, executed with the statement's bind values."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any], *, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
 
 class Repository:
     def __init__(self, session: AsyncSession) -> None:
@@ -17,6 +78,16 @@ class Repository:
         self.session.add(instance)
         return instance
 
+    async def refresh(self, instance: Any, *relationships: str) -> None:
+        """Reload the columns of ``instance``, deferred ones included.
+
+        Session.refresh skips deferred columns; naming every column also leaves
+        relationships that are already loaded in place. Relationships named in
+        ``relationships`` are loaded too, for a response that will read them.
+        """
+        columns = [attr.key for attr in inspect(instance).mapper.column_attrs]
+        await self.session.refresh(instance, [*columns, *relationships])
+
     async def scalars(self, stmt: Select[Any]) -> Sequence[Any]:
         result = await self.session.execute(stmt)
         return result.scalars().all()
@@ -24,3 +95,163 @@ class Repository:
     async def scalar_one(self, stmt: Select[Any]) -> Any:
         result = await self.session.execute(stmt)
         return result.scalars().one()
+
+    async def paginate(
+        self,
+        stmt: Select[Any],
+        *,
+        limit: int,
+        offset: int,
+        total: TotalMode = "exact",
+        scalars: bool = True,
+    ) -> OffsetPage[Any]:
+        """Fetch one page of ``stmt`` (ordered, without limit/offset).
+
+        ``exact`` runs the page and a count concurrently on two pooled connections
+        (see ``_count_engine`` for when that is possible); otherwise it adds
+        ``count(*) OVER ()`` so the page and the total come back in one
+        statement. ``estimate`` reads the planner's row estimate instead and ``none``
+        skips counting; both fetch one extra row to tell whether a next page exists.
+        With ``scalars=False`` items are column mappings instead of the first entity.
+        """
+        if total == "exact" and (engine := self._count_engine()) is not None:
+            return await self._page_and_count(
+                stmt, engine, limit=limit, offset=offset, scalars=scalars
+            )
+        if total == "exact":
+            windowed = stmt.add_columns(func.count().over().label(TOTAL_COLUMN))
+            rows = (await self.session.execute(windowed.limit(limit).offset(offset))).all()
+            if rows:
+                count = rows[0]._mapping[TOTAL_COLUMN]
+            elif offset == 0:
+                count = 0
+            else:
+                # Past the end there is no row to carry the window count
+                count = await self.count_rows(stmt)
+            return OffsetPage(
+                items=[self._item(row, scalars) for row in rows],
+                total=count,
+                has_more=offset + len(rows) < count,
+            )
+
+        rows = (await self.session.execute(stmt.limit(limit + 1).offset(offset))).all()
+        estimate = await self.estimate_count(stmt) if total == "estimate" else None
+        return OffsetPage(
+            items=[self._item(row, scalars) for row in rows[:limit]],
+            total=estimate,
+            has_more=len(rows) > limit,
+            estimated=estimate is not None,
+        )
+
+    async def count_rows(self, stmt: Select[Any]) -> int:
+        """Exact number of rows ``stmt`` would return."""
+        result = await self.session.scalar(_count_statement(stmt))
+        return result or 0
+
+    def _count_engine(self) -> AsyncEngine | None:
+        """Engine to count on a second connection, or None to count in the page query.
+
+        A second connection only helps when it is free right away and can see the
+        same rows as the session: the pool must have an idle connection (queueing
+        for one would cost more than it saves) and the session's transaction must
+        not have written anything yet.
+        """
+        bind = self.session.bind
+        if not settings.db_concurrent_count or not isinstance(bind, AsyncEngine):
+            return None
+        if self.session.sync_session.info.get(_WROTE):
+            return None
+        checkedin = getattr(bind.pool, "checkedin", None)
+        if checkedin is None or checkedin() == 0:
+            return None
+        return bind
+
+    async def _page_and_count(
+        self,
+        stmt: Select[Any],
+        engine: AsyncEngine,
+        *,
+        limit: int,
+        offset: int,
+        scalars: bool,
+    ) -> OffsetPage[Any]:
+        snapshot = await self._export_snapshot()
+
+        async def count() -> int:
+            async with engine.connect() as conn:
+                if snapshot is not None:
+                    await conn.execution_options(isolation_level="REPEATABLE READ")
+                    await conn.execute(text(f"SET TRANSACTION SNAPSHOT '{snapshot}'"))
+                result = await conn.scalar(_count_statement(stmt))
+                await conn.rollback()
+                return result or 0
+
+        # Wait for both before raising so the session is never left mid-query
+        page, counted = await asyncio.gather(
+            self.session.execute(stmt.limit(limit).offset(offset)),
+            count(),
+            return_exceptions=True,
+        )
+        for outcome in (page, counted):
+            if isinstance(outcome, BaseException):
+                raise outcome
+        rows = page.all()
+        return OffsetPage(
+            items=[self._item(row, scalars) for row in rows],
+            total=counted,
+            has_more=offset + len(rows) < counted,
+        )
+
+    async def _export_snapshot(self) -> str | None:
+        """Snapshot id of the session's transaction, if it keeps one across statements.
+
+        Under READ COMMITTED every statement takes a fresh snapshot, so a count on
+        another connection is as consistent as one run after the page on the same
+        connection and nothing needs sharing.
+        """
+        if not self.session.in_transaction():
+            return None
+        conn = (await self.session.connection()).sync_connection
+        level = (
+            conn.get_execution_options().get("isolation_level")
+            or conn.engine.get_execution_options().get("isolation_level")
+            or conn.dialect.default_isolation_level
+        )
+        if (level or "").upper() not in _SNAPSHOT_LEVELS:
+            return None
+        snapshot = await self.session.scalar(text("SELECT pg_export_snapshot()"))
+        if not _SNAPSHOT_ID.match(snapshot or ""):
+            raise RuntimeError(f"Unexpected snapshot id {snapshot!r}")
+        return snapshot
+
+    async def estimate_count(self, stmt: Select[Any]) -> int:
+        """Planner's row estimate for ``stmt``, from table statistics (no rows are read)."""
+        plan = await self.session.scalar(Explain(stmt.order_by(None).limit(None).offset(None)))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def _item(row: Any, scalars: bool) -> Any:
+        if scalars:
+            return row[0]
+        return {k: v for k, v in row._mapping.items() if k != TOTAL_COLUMN}
+
+
+def _count_statement(stmt: Select[Any]) -> Select[Any]:
+    subquery = stmt.order_by(None).limit(None).offset(None).subquery()
+    return select(func.count()).select_from(subquery)
+
+
+def contains_any(q: str, *columns: Any) -> ColumnElement[bool]:
+    """Case-insensitive match of ``q`` anywhere in any of ``columns``.
+
+    LIKE wildcards in ``q`` match literally. With 3+ characters the trigram indexes
+    (app.models.base.trigram_index) serve this instead of a table scan.
+    """
+    pattern = "%" + _LIKE_SPECIAL.sub(lambda m: "\\" + m.group(), q.strip()) + "%"
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def similarity_to(q: str, *columns: Any) -> ColumnElement[float]:
+    """How closely ``q`` matches a word run in the best of ``columns`` (0-1, pg_trgm)."""
+    scores = [func.word_similarity(q.strip(), column) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import Keyset, OffsetPage, TotalMode
 from app.models.comment import Comment
+from app.models.content import Content
 from app.repositories.base import Repository
 
+COMMENT_ORDER = Keyset(Comment.created_at, Comment.id, descending=True)
+
 
 class CommentRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
@@ -27,32 +30,56 @@ class CommentRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_content_comments(self, content_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(Comment).where(Comment.content_id == content_id)
-        )
-        return result or 0
-
     async def list_for_content(
         self,
         content_id: UUID,
         *,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[Comment]:
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Comment]:
         stmt = (
             select(Comment)
             .where(Comment.content_id == content_id)
-            .order_by(desc(Comment.created_at), Comment.id)
-            .limit(limit)
-            .offset(offset)
+            .order_by(*COMMENT_ORDER.order_by())
         )
-        return await self.scalars(stmt)
+        if cursor:
+            stmt = stmt.where(COMMENT_ORDER.after(cursor))
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, comment: Comment) -> Comment:
         await self.add(comment)
         return comment
 
-    async def delete(self, comment_id: UUID) -> int:
-        res = await self.session.execute(delete(Comment).where(Comment.id == comment_id))
+    async def delete(self, comment_id: UUID) -> UUID | None:
+        """Delete a comment; returns the id of the content it was on, None if missing."""
+        return await self.session.scalar(
+            delete(Comment).where(Comment.id == comment_id).returning(Comment.content_id)
+        )
+
+    async def adjust_comment_count(self, content_id: UUID, delta: int) -> int:
+        """Add ``delta`` to the content's comment_count in place; returns rows updated."""
+        res = await self.session.execute(
+            update(Content)
+            .where(Content.id == content_id)
+            .values(comment_count=Content.comment_count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        return res.rowcount or 0
+
+    async def reconcile_comment_counts(self) -> int:
+        """Recompute every content's comment_count; returns how many were wrong."""
+        actual = (
+            select(func.count(Comment.id))
+            .where(Comment.content_id == Content.id)
+            .correlate(Content)
+            .scalar_subquery()
+        )
+        res = await self.session.execute(
+            update(Content)
+            .where(Content.comment_count.is_distinct_from(actual))
+            .values(comment_count=actual)
+            .execution_options(synchronize_session=False)
+        )
         return res.rowcount or 0
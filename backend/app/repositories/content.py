@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Text,
+    cast,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.pagination import Keyset, OffsetPage
+from app.models.content import Content
+from app.models.tag import ContentTag, Tag
+from app.models.task import Task
+from app.repositories.base import Repository
+from app.schemas.content_query import ContentFilter
+
+CONTENT_ORDER = Keyset(Content.created_at, Content.id, descending=True)
+# Upper bounds (minutes) of the duration facet buckets; the last bucket is open-ended
+DURATION_BUCKETS = (15, 30, 60, 120)
+MAX_TAG_FACETS = 50
+
+_content = Content.__table__
+_tasks = Task.__table__
+
+
+class ContentRepository(Repository):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def query(
+        self,
+        filters: ContentFilter,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> OffsetPage[Content]:
+        """A page of content matching ``filters``, newest first, without a total.
+
+        The total is the sum of the content type facet, so ``facets`` provides it.
+        """
+        conds = _conditions(filters)
+        if cursor:
+            conds.append(CONTENT_ORDER.after(cursor))
+        stmt = (
+            select(Content)
+            .options(
+                selectinload(Content.author),
+                selectinload(Content.content_tags).selectinload(ContentTag.tag),
+            )
+            .where(*conds)
+            .order_by(*CONTENT_ORDER.order_by())
+        )
+        return await self.paginate(stmt, limit=limit, offset=offset, total="none")
+
+    async def facets(self, filters: ContentFilter) -> Sequence[Row[Any]]:
+        """(facet, value, label, count) rows for every facet, in one statement.
+
+        The matching rows are collected once in a CTE and grouped three ways: by
+        content type, by tag (the MAX_TAG_FACETS most used) and by duration bucket
+        (``value`` is the bucket index into DURATION_BUCKETS, tasks only).
+        """
+        matched = (
+            select(_content.c.id, _content.c.content_type, _tasks.c.estimated_duration)
+            .select_from(_content.outerjoin(_tasks, _tasks.c.id == _content.c.id))
+            .where(*_conditions(filters))
+            .cte("matched")
+        )
+        n = func.count().label("count")
+        by_type = select(
+            literal("content_type").label("facet"),
+            cast(matched.c.content_type, Text).label("value"),
+            null().label("label"),
+            n,
+        ).group_by(matched.c.content_type)
+        by_tag = (
+            select(literal("tag"), cast(Tag.id, Text), Tag.name, n)
+            .select_from(matched)
+            .join(ContentTag, ContentTag.content_id == matched.c.id)
+            .join(Tag, Tag.id == ContentTag.tag_id)
+            .group_by(Tag.id, Tag.name)
+            .order_by(n.desc(), Tag.name)
+            .limit(MAX_TAG_FACETS)
+        )
+        bucket = func.width_bucket(
+            matched.c.estimated_duration, array(DURATION_BUCKETS, type_=Integer)
+        )
+        by_duration = (
+            select(literal("duration"), cast(bucket, Text), null(), n)
+            .where(matched.c.estimated_duration.is_not(None))
+            .group_by(bucket)
+        )
+        res = await self.session.execute(union_all(by_type, by_tag, by_duration))
+        return res.all()
+
+
+def _conditions(filters: ContentFilter) -> list[ColumnElement[bool]]:
+    """WHERE clauses for ``filters`` over the content table left-joined to tasks."""
+    conds: list[ColumnElement[bool]] = []
+    if filters.tag_id:
+        tag_ids = set(filters.tag_id)
+        tagged = select(ContentTag.content_id).where(ContentTag.tag_id.in_(tag_ids))
+        if filters.tag_mode == "all":
+            tagged = tagged.group_by(ContentTag.content_id).having(func.count() == len(tag_ids))
+        conds.append(_content.c.id.in_(tagged))
+    if filters.content_type:
+        conds.append(_content.c.content_type.in_(filters.content_type))
+    if filters.created_from is not None:
+        conds.append(_content.c.created_at >= filters.created_from)
+    if filters.created_to is not None:
+        conds.append(_content.c.created_at <= filters.created_to)
+
+    if filters.tasks_only:
+        conds.append(_tasks.c.id.is_not(None))
+    if filters.duration_min is not None:
+        conds.append(_tasks.c.estimated_duration >= filters.duration_min)
+    if filters.duration_max is not None:
+        conds.append(_tasks.c.estimated_duration <= filters.duration_max)
+    # A task without a participant bound is open-ended on that side
+    if filters.participants_max is not None:
+        conds.append(func.coalesce(_tasks.c.participant_min, 0) <= filters.participants_max)
+    if filters.participants_min is not None:
+        conds.append(
+            or_(
+                _tasks.c.participant_max.is_(None),
+                _tasks.c.participant_max >= filters.participants_min,
+            )
+        )
+    if filters.equipment:
+        conds.append(_tasks.c.equipment.has_all(array(filters.equipment, type_=Text)))
+    return conds
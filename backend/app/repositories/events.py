@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import datetime as dt
-from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import and_, asc, delete, func, select
+from sqlalchemy import and_, delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import Keyset, OffsetPage, TotalMode
 from app.models.event import Event
+from app.models.tag import ContentTag
 from app.repositories.base import Repository
 
+EVENT_ORDER = Keyset(Event.start_dt, Event.id)
+
 
 class EventRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
@@ -29,6 +32,9 @@ class EventRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
+    async def exists(self, event_id: UUID) -> bool:
+        return await self.scalar_one(select(exists().where(Event.id == event_id)))
+
     async def get_in_program(
         self, event_id: UUID, program_id: UUID, workspace_id: UUID
     ) -> Event | None:
@@ -40,24 +46,6 @@ class EventRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_for_workspace(
-        self,
-        workspace_id: UUID,
-        *,
-        date_from: dt.datetime | None = None,
-        date_to: dt.datetime | None = None,
-    ) -> int:
-        conds = [Event.workspace_id == workspace_id]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
-
-        result = await self.session.scalar(
-            select(func.count()).select_from(Event).where(and_(*conds))
-        )
-        return result or 0
-
     async def list_for_workspace(
         self,
         workspace_id: UUID,
@@ -66,43 +54,28 @@ class EventRepository(Repository):
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[Event]:
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Event]:
         conds = [Event.workspace_id == workspace_id]
         if date_from is not None:
             conds.append(Event.start_dt >= date_from)
         if date_to is not None:
             conds.append(Event.start_dt <= date_to)
+        if cursor:
+            conds.append(EVENT_ORDER.after(cursor))
 
         stmt = (
             select(Event)
+            .options(
+                selectinload(Event.author),
+                selectinload(Event.workspace),
+                selectinload(Event.content_tags).selectinload(ContentTag.tag),
+            )
             .where(and_(*conds))
-            .order_by(asc(Event.start_dt))
-            .limit(limit)
-            .offset(offset)
-        )
-        return await self.scalars(stmt)
-
-    async def count_for_program(
-        self,
-        workspace_id: UUID,
-        program_id: UUID,
-        *,
-        date_from: dt.datetime | None = None,
-        date_to: dt.datetime | None = None,
-    ) -> int:
-        conds = [
-            Event.workspace_id == workspace_id,
-            Event.program_id == program_id,
-        ]
-        if date_from is not None:
-            conds.append(Event.start_dt >= date_from)
-        if date_to is not None:
-            conds.append(Event.start_dt <= date_to)
-
-        result = await self.session.scalar(
-            select(func.count()).select_from(Event).where(and_(*conds))
+            .order_by(*EVENT_ORDER.order_by())
         )
-        return result or 0
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def list_for_program(
         self,
@@ -113,7 +86,9 @@ class EventRepository(Repository):
         date_to: dt.datetime | None = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[Event]:
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Event]:
         conds = [
             Event.workspace_id == workspace_id,
             Event.program_id == program_id,
@@ -122,15 +97,20 @@ class EventRepository(Repository):
             conds.append(Event.start_dt >= date_from)
         if date_to is not None:
             conds.append(Event.start_dt <= date_to)
+        if cursor:
+            conds.append(EVENT_ORDER.after(cursor))
 
         stmt = (
             select(Event)
+            .options(
+                selectinload(Event.author),
+                selectinload(Event.workspace),
+                selectinload(Event.content_tags).selectinload(ContentTag.tag),
+            )
             .where(and_(*conds))
-            .order_by(asc(Event.start_dt))
-            .limit(limit)
-            .offset(offset)
+            .order_by(*EVENT_ORDER.order_by())
         )
-        return await self.scalars(stmt)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, event: Event) -> Event:
         await self.add(event)
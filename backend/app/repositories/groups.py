@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import Select, and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import OffsetPage, SearchOrder, TotalMode
 from app.models.group import Group, GroupMemberRow, GroupMembership, GroupRole
 from app.models.user import User
-from app.repositories.base import Repository
+from app.repositories.base import Repository, contains_any, similarity_to
 
 
 class GroupRepository(Repository):
@@ -30,23 +30,23 @@ class GroupRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count(self, *, q: str | None = None) -> int:
-        stmt = select(func.count()).select_from(Group)
-        if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(Group.name.ilike(ilike))
-        result = await self.session.scalar(stmt)
-        return result or 0
-
     async def list(
-        self, *, q: str | None = None, limit: int = 50, offset: int = 0
-    ) -> Sequence[Group]:
-        stmt = select(Group).order_by(Group.name)
+        self,
+        *,
+        q: str | None = None,
+        sort: SearchOrder = "name",
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Group]:
+        stmt = select(Group)
         if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(Group.name.ilike(ilike))
-        stmt = stmt.limit(limit).offset(offset)
-        return await self.scalars(stmt)
+            stmt = stmt.where(contains_any(q, Group.name))
+        if q and sort == "similarity":
+            stmt = stmt.order_by(similarity_to(q, Group.name).desc(), Group.name, Group.id)
+        else:
+            stmt = stmt.order_by(Group.name)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, group: Group) -> Group:
         await self.add(group)
@@ -57,38 +57,21 @@ class GroupRepository(Repository):
         return res.rowcount or 0
 
     # ----- memberships -----
-    async def count_groups_for_user(self, user_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(GroupMembership)
-            .where(GroupMembership.user_id == user_id)
-        )
-        return result or 0
 
     async def list_groups_for_user(
-        self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Group]:
+        self, user_id: UUID, *, limit: int = 50, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[Group]:
         stmt = (
             select(Group)
             .join(GroupMembership, Group.id == GroupMembership.group_id)
             .where(GroupMembership.user_id == user_id)
             .order_by(Group.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
-
-    async def count_group_members(self, group_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(GroupMembership)
-            .where(GroupMembership.group_id == group_id)
-        )
-        return result or 0
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def list_group_members(
-        self, group_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[GroupMemberRow]:
+        self, group_id: UUID, *, limit: int = 50, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[GroupMemberRow]:
         stmt = (
             select(
                 User.id.label("user_id"),
@@ -99,12 +82,10 @@ class GroupRepository(Repository):
             .join(User, User.id == GroupMembership.user_id)
             .where(GroupMembership.group_id == group_id)
             .order_by(func.lower(User.name).asc(), User.id.asc())
-            .limit(limit)
-            .offset(offset)
         )
-        res = await self.session.execute(stmt)
+        page = await self.paginate(stmt, limit=limit, offset=offset, total=total, scalars=False)
         # Row -> dataclass
-        return [GroupMemberRow(**row._mapping) for row in res.all()]
+        return page.map(lambda row: GroupMemberRow(**row))
 
     async def get_membership(self, group_id: UUID, user_id: UUID) -> GroupMembership | None:
         return await self.session.scalar(
@@ -3,9 +3,12 @@ from __future__ import annotations
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Row, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import OffsetPage, TotalMode
+from app.models.content import Content
 from app.models.like import UserLikedContent
 from app.repositories.base import Repository
 
@@ -14,32 +17,43 @@ class LikeRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session)
 
-    async def count_content_likes(self, content_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(UserLikedContent)
-            .where(UserLikedContent.content_id == content_id)
-        )
-        return result or 0
-
     async def list_for_content(
         self,
         content_id: UUID,
         *,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[UserLikedContent]:
-        stmt = (
-            select(UserLikedContent)
-            .where(UserLikedContent.content_id == content_id)
-            .limit(limit)
-            .offset(offset)
+        total: TotalMode = "exact",
+    ) -> OffsetPage[UserLikedContent]:
+        stmt = select(UserLikedContent).where(UserLikedContent.content_id == content_id)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
+
+    async def like_states(
+        self, user_id: UUID, content_ids: Sequence[UUID]
+    ) -> Sequence[Row[tuple[UUID, int, bool]]]:
+        """(content id, like_count, liked by ``user_id``) for each existing content id.
+
+        One statement: a primary-key probe on content plus one on likes per id.
+        """
+        liked = exists().where(
+            UserLikedContent.user_id == user_id, UserLikedContent.content_id == Content.id
+        )
+        result = await self.session.execute(
+            select(Content.id, Content.like_count, liked.label("liked")).where(
+                Content.id.in_(content_ids)
+            )
         )
-        return await self.scalars(stmt)
+        return result.all()
 
-    async def create(self, like: UserLikedContent) -> UserLikedContent:
-        await self.add(like)
-        return like
+    async def insert(self, user_id: UUID, content_id: UUID) -> bool:
+        """Insert a like unless it already exists; returns whether a row was added."""
+        inserted = await self.session.scalar(
+            insert(UserLikedContent)
+            .values(user_id=user_id, content_id=content_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "content_id"])
+            .returning(UserLikedContent.content_id)
+        )
+        return inserted is not None
 
     async def delete(self, user_id: UUID, content_id: UUID) -> int:
         res = await self.session.execute(
@@ -48,3 +62,30 @@ class LikeRepository(Repository):
             )
         )
         return res.rowcount or 0
+
+    async def adjust_like_count(self, content_id: UUID, delta: int) -> int:
+        """Add ``delta`` to the content's like_count in place; returns rows updated."""
+        res = await self.session.execute(
+            update(Content)
+            .where(Content.id == content_id)
+            .values(like_count=Content.like_count + delta)
+            .execution_options(synchronize_session=False)
+        )
+        return res.rowcount or 0
+
+    async def reconcile_like_counts(self) -> int:
+        """Recompute every content's like_count; returns how many were wrong."""
+        actual = (
+            select(func.count())
+            .select_from(UserLikedContent)
+            .where(UserLikedContent.content_id == Content.id)
+            .correlate(Content)
+            .scalar_subquery()
+        )
+        res = await self.session.execute(
+            update(Content)
+            .where(Content.like_count.is_distinct_from(actual))
+            .values(like_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        return res.rowcount or 0
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import Keyset, OffsetPage, TotalMode
 from app.models.program import Program
+from app.models.tag import ContentTag
 from app.repositories.base import Repository
 
+PROGRAM_ORDER = Keyset(Program.name, Program.id)
+
 
 class ProgramRepository(Repository):
     def __init__(self, session: AsyncSession) -> None:
@@ -22,7 +25,6 @@ class ProgramRepository(Repository):
                 selectinload(Program.author),
                 selectinload(Program.workspace),
                 selectinload(Program.events),
-                selectinload(Program.comments),
                 selectinload(Program.content_tags).selectinload(ContentTag.tag),
             )
             .where(Program.id == program_id)
@@ -30,34 +32,36 @@ class ProgramRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
+    async def exists(self, program_id: UUID) -> bool:
+        return await self.scalar_one(select(exists().where(Program.id == program_id)))
+
     async def get_in_workspace(self, program_id: UUID, workspace_id: UUID) -> Program | None:
         stmt = select(Program).where(Program.id == program_id, Program.workspace_id == workspace_id)
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_programs_for_workspace(self, workspace_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(Program).where(Program.workspace_id == workspace_id)
-        )
-        return result or 0
-
     async def list_by_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Program]:
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Program]:
         stmt = (
             select(Program)
             .options(
                 selectinload(Program.author),
                 selectinload(Program.workspace),
-                selectinload(Program.comments),
                 selectinload(Program.content_tags).selectinload(ContentTag.tag),
             )
             .where(Program.workspace_id == workspace_id)
-            .order_by(Program.name)
-            .limit(limit)
-            .offset(offset)
+            .order_by(*PROGRAM_ORDER.order_by())
         )
-        return await self.scalars(stmt)
+        if cursor:
+            stmt = stmt.where(PROGRAM_ORDER.after(cursor))
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, program: Program) -> Program:
         await self.add(program)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Text,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import Keyset, OffsetPage
+from app.domain.content_constraints import SEARCH_CONFIG
+from app.models.content import Content, ContentType
+from app.models.event import Event
+from app.models.program import Program
+from app.models.task import Task
+from app.models.workspace import WorkspaceMembership
+from app.repositories.base import Repository
+
+_content = Content.__table__
+_programs = Program.__table__
+_events = Event.__table__
+_tasks = Task.__table__
+
+_CONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+# Joined in FROM so the query text is parsed once, not once per matching row
+_QUERY_FROM = func.websearch_to_tsquery(_CONFIG, bindparam("search_query", type_=Text)).alias(
+    "query"
+)
+_QUERY = _QUERY_FROM.column
+# float8 so the rank survives the round trip through a cursor exactly
+SEARCH_RANK = cast(func.ts_rank(_content.c.search_vector, _QUERY), DOUBLE_PRECISION).label("rank")
+SEARCH_ORDER = Keyset(SEARCH_RANK, _content.c.id, descending=True)
+
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+# & first, so the entities added for the other characters are not escaped twice
+_HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#39;"))
+
+
+class SearchRepository(Repository):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        *,
+        content_types: Sequence[ContentType] = (),
+        workspace_id: UUID | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> OffsetPage[dict]:
+        """Content matching ``query`` in workspaces ``user_id`` belongs to, best first.
+
+        Matches are joined to the (small) set of content ids visible to the user, so
+        only visible rows are ranked. The page is ranked and cut in a subquery, so
+        snippets (the expensive part) are only built for the rows that are returned.
+        """
+        visible = _visible_content(
+            user_id, content_types or tuple(ContentType), workspace_id
+        ).subquery("visible")
+        conds = [_content.c.search_vector.op("@@")(_QUERY)]
+        if cursor:
+            conds.append(SEARCH_ORDER.after(cursor))
+
+        page = (
+            select(
+                _content.c.id,
+                _content.c.content_type,
+                _content.c.name,
+                _content.c.description,
+                visible.c.workspace_id,
+                SEARCH_RANK,
+                _QUERY.label("query"),
+            )
+            .select_from(
+                _content.join(visible, visible.c.id == _content.c.id).join(_QUERY_FROM, true())
+            )
+            .where(*conds)
+            .order_by(*SEARCH_ORDER.order_by())
+            .limit(limit + 1)
+            .subquery("page")
+        )
+        snippet = func.ts_headline(
+            _CONFIG,
+            _html_escape(func.coalesce(page.c.description, page.c.name)),
+            page.c.query,
+            _HEADLINE_OPTIONS,
+        )
+        stmt = select(
+            page.c.id,
+            page.c.content_type,
+            page.c.name,
+            page.c.workspace_id,
+            page.c.rank,
+            snippet.label("snippet"),
+        ).order_by(page.c.rank.desc(), page.c.id.desc())
+        result = await self.session.execute(stmt, {"search_query": query})
+        rows = [dict(row._mapping) for row in result]
+        return OffsetPage(items=rows[:limit], total=None, has_more=len(rows) > limit)
+
+
+def _html_escape(text: ColumnElement[str]) -> ColumnElement[str]:
+    """Escape user text in SQL so only the headline's own <mark> tags are markup."""
+    for char, entity in _HTML_ESCAPES:
+        text = func.replace(text, char, entity)
+    return text
+
+
+def _visible_content(
+    user_id: UUID, content_types: Sequence[ContentType], workspace_id: UUID | None
+) -> CompoundSelect:
+    """(id, workspace_id) of the content of the given types in the user's workspaces.
+
+    Tasks have no workspace of their own and inherit their event's.
+    """
+    member_of = select(WorkspaceMembership.workspace_id).where(
+        WorkspaceMembership.user_id == user_id
+    )
+    if workspace_id is not None:
+        member_of = member_of.where(WorkspaceMembership.workspace_id == workspace_id)
+
+    branches = []
+    if ContentType.program in content_types:
+        branches.append(
+            select(_programs.c.id, _programs.c.workspace_id).where(
+                _programs.c.workspace_id.in_(member_of)
+            )
+        )
+    if ContentType.event in content_types:
+        branches.append(
+            select(_events.c.id, _events.c.workspace_id).where(
+                _events.c.workspace_id.in_(member_of)
+            )
+        )
+    if ContentType.task in content_types:
+        branches.append(
+            select(_tasks.c.id, _events.c.workspace_id)
+            .join(_events, _events.c.id == _tasks.c.event_id)
+            .where(_events.c.workspace_id.in_(member_of))
+        )
+    return union_all(*branches)
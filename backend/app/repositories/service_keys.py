@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import datetime as dt
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.service_key import ServiceApiKey
+from app.repositories.base import Repository
+
+
+class ServiceApiKeyRepository(Repository):
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(session)
+
+    async def get_active_by_prefix(self, prefix: str) -> ServiceApiKey | None:
+        stmt = select(ServiceApiKey).where(
+            ServiceApiKey.prefix == prefix, ServiceApiKey.revoked_at.is_(None)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalars().first()
+
+    async def list(self) -> Sequence[ServiceApiKey]:
+        stmt = select(ServiceApiKey).order_by(ServiceApiKey.created_at.desc())
+        return await self.scalars(stmt)
+
+    async def create(self, key: ServiceApiKey) -> ServiceApiKey:
+        await self.add(key)
+        return key
+
+    async def revoke(self, key_id: UUID, revoked_at: dt.datetime) -> int:
+        res = await self.session.execute(
+            update(ServiceApiKey)
+            .where(ServiceApiKey.id == key_id, ServiceApiKey.revoked_at.is_(None))
+            .values(revoked_at=revoked_at)
+        )
+        return res.rowcount or 0
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import Select, and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import Keyset, OffsetPage, SearchOrder, TotalMode
+from app.core.tag_dictionary import CHANNEL
 from app.models.content import Content
 from app.models.tag import ContentTag, Tag
-from app.repositories.base import Repository
+from app.repositories.base import Repository, contains_any, similarity_to
+
+TAG_ORDER = Keyset(Tag.name, Tag.id)
+TAGGED_CONTENT_ORDER = Keyset(Content.created_at, Content.id, descending=True)
 
 
 class TagRepository(Repository):
@@ -30,23 +34,47 @@ class TagRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count(self, *, q: str | None = None) -> int:
-        stmt = select(func.count()).select_from(Tag)
+    async def list(
+        self,
+        *,
+        q: str | None = None,
+        sort: SearchOrder = "name",
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Tag]:
+        """Tags by name, or by closeness to ``q`` for ``sort="similarity"``.
+
+        Cursors follow the name order, so they cannot be combined with similarity.
+        """
+        stmt = select(Tag)
         if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(Tag.name.ilike(ilike))
+            stmt = stmt.where(contains_any(q, Tag.name))
+        if q and sort == "similarity":
+            stmt = stmt.order_by(similarity_to(q, Tag.name).desc(), *TAG_ORDER.order_by())
+        else:
+            stmt = stmt.order_by(*TAG_ORDER.order_by())
+        if cursor:
+            stmt = stmt.where(TAG_ORDER.after(cursor))
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
+
+    async def usage_counts(self) -> list[tuple[UUID, str, int]]:
+        """Every tag as ``(id, name, number of content items tagged)``."""
+        usage = (
+            select(ContentTag.tag_id, func.count().label("usage_count"))
+            .group_by(ContentTag.tag_id)
+            .subquery()
+        )
+        stmt = select(Tag.id, Tag.name, func.coalesce(usage.c.usage_count, 0)).outerjoin(
+            usage, usage.c.tag_id == Tag.id
+        )
         res = await self.session.execute(stmt)
-        return res.scalar_one()
+        return [tuple(row) for row in res.all()]
 
-    async def list(
-        self, *, q: str | None = None, limit: int = 50, offset: int = 0
-    ) -> Sequence[Tag]:
-        stmt = select(Tag).order_by(Tag.name)
-        if q:
-            like = f"%{q.strip()}%"
-            stmt = stmt.where(Tag.name.ilike(like))
-        stmt = stmt.limit(limit).offset(offset)
-        return await self.scalars(stmt)
+    async def notify_changed(self) -> None:
+        """Tell every worker's tag dictionary to reload once this transaction commits."""
+        await self.session.execute(select(func.pg_notify(CHANNEL, "")))
 
     async def create(self, tag: Tag) -> Tag:
         await self.add(tag)
@@ -58,43 +86,40 @@ class TagRepository(Repository):
 
     # ----- associations -----
 
-    async def count_content_tags(self, content_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(ContentTag).where(ContentTag.content_id == content_id)
-        )
-        return result or 0
-
     async def list_content_tags(
-        self, content_id: UUID, *, limit: int = 100, offset: int = 0
-    ) -> Sequence[Tag]:
+        self, content_id: UUID, *, limit: int = 100, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[Tag]:
         stmt = (
             select(Tag)
             .join(ContentTag, ContentTag.tag_id == Tag.id)
             .where(ContentTag.content_id == content_id)
             .order_by(Tag.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
-
-    async def count_tagged_content(self, tag_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(ContentTag).where(ContentTag.tag_id == tag_id)
-        )
-        return result or 0
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def list_tagged_content(
-        self, tag_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Content]:
+        self,
+        tag_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[Content]:
         stmt = (
             select(Content)
             .join(ContentTag, ContentTag.content_id == Content.id)
+            .options(
+                # ContentOut reads author and tags for every row
+                selectinload(Content.author),
+                selectinload(Content.content_tags).selectinload(ContentTag.tag),
+            )
             .where(ContentTag.tag_id == tag_id)
-            .order_by(Content.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(*TAGGED_CONTENT_ORDER.order_by())
         )
-        return await self.scalars(stmt)
+        if cursor:
+            stmt = stmt.where(TAGGED_CONTENT_ORDER.after(cursor))
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def get_content_tag(self, content_id: UUID, tag_id: UUID) -> ContentTag | None:
         return await self.session.scalar(
@@ -1,14 +1,43 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Numeric,
+    Row,
+    Select,
+    Text,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
+from app.core.pagination import OffsetPage, TotalMode
+from app.models.event import Event
+from app.models.tag import ContentTag
 from app.models.task import Task
 from app.repositories.base import Repository
+from app.schemas.task import TaskFilter, TaskInclude
+
+# Relationships TaskOut reads; an AsyncSession cannot lazy-load them
+_SERIALIZED = (
+    selectinload(Task.author),
+    selectinload(Task.content_tags).selectinload(ContentTag.tag),
+)
+
+_tasks = Task.__table__
+_events = Event.__table__
 
 
 class TaskRepository(Repository):
@@ -20,6 +49,9 @@ class TaskRepository(Repository):
             select(Task)
             .options(
                 selectinload(Task.event),
+                *_SERIALIZED,
+                undefer(Task.equipment),
+                undefer(Task.media),
             )
             .where(Task.id == task_id)
         )
@@ -27,31 +59,104 @@ class TaskRepository(Repository):
         return res.scalars().first()
 
     async def get_in_event(self, task_id: UUID, event_id: UUID) -> Task | None:
-        stmt = select(Task).where(Task.id == task_id, Task.event_id == event_id)
+        stmt = (
+            select(Task)
+            .options(*_SERIALIZED, undefer(Task.equipment), undefer(Task.media))
+            .where(Task.id == task_id, Task.event_id == event_id)
+        )
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_tasks_for_event(self, event_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(Task).where(Task.event_id == event_id)
-        )
-        return result or 0
-
     async def list_for_event(
         self,
         event_id: UUID,
         *,
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[Task]:
+        total: TotalMode = "exact",
+        include: Collection[TaskInclude] = (),
+    ) -> OffsetPage[Task]:
         stmt = (
             select(Task)
+            .options(
+                *_SERIALIZED,
+                *_undefer(include),
+            )
             .where(Task.event_id == event_id)
             .order_by(Task.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
+
+    async def query(
+        self,
+        filters: TaskFilter,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[TaskInclude] = (),
+    ) -> OffsetPage[Task]:
+        stmt = (
+            select(Task)
+            .options(
+                *_SERIALIZED,
+                *_undefer(include),
+            )
+            .where(*_conditions(filters))
+            .order_by(Task.name, Task.id)
+        )
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
+
+    async def packing_list(
+        self, *, event_id: UUID | None = None, program_id: UUID | None = None
+    ) -> Sequence[Row[Any]]:
+        """(item, total_quantity, max_quantity, task_count) per equipment key, by key.
+
+        Aggregated in SQL over ``jsonb_each`` of the tasks of one event or of every
+        event in one program; see PackingListItem for how values become quantities.
+
+        Raises:
+            ValueError: Unless exactly one of ``event_id`` and ``program_id`` is given
+        """
+        if (event_id is None) == (program_id is None):
+            raise ValueError("packing_list needs exactly one of event_id and program_id")
+        entry = (
+            func.jsonb_each(_tasks.c.equipment)
+            .table_valued(column("key", Text), column("value", JSONB))
+            .lateral("entry")
+        )
+        quantity = cast(
+            case(
+                (
+                    func.jsonb_typeof(entry.c.value) == "number",
+                    func.ceil(cast(entry.c.value, Numeric)),
+                ),
+                (cast(entry.c.value, Text).in_(("null", "false")), 0),
+                else_=1,
+            ),
+            Integer,
+        )
+        stmt = (
+            select(
+                entry.c.key.label("item"),
+                func.sum(quantity).label("total_quantity"),
+                func.max(quantity).label("max_quantity"),
+                func.count().label("task_count"),
+            )
+            .select_from(_tasks)
+            .join(entry, true())
+            .where(
+                _tasks.c.event_id == event_id
+                if event_id is not None
+                else _tasks.c.event_id.in_(_program_events(program_id)),
+                func.jsonb_typeof(_tasks.c.equipment) == "object",
+                quantity > 0,
+            )
+            .group_by(entry.c.key)
+            .order_by(entry.c.key)
+        )
+        res = await self.session.execute(stmt)
+        return res.all()
 
     async def create(self, task: Task) -> Task:
         await self.add(task)
@@ -61,3 +166,31 @@ class TaskRepository(Repository):
         stmt = delete(Task).where(Task.id == task_id)
         res = await self.session.execute(stmt)
         return res.rowcount or 0
+
+
+def _undefer(include: Collection[TaskInclude]) -> list[Any]:
+    """Load options for the deferred JSONB columns named in ``include``."""
+    return [undefer(getattr(Task, name)) for name in include]
+
+
+def _program_events(program_id: UUID) -> Select[tuple[UUID]]:
+    return select(_events.c.id).where(_events.c.program_id == program_id)
+
+
+def _conditions(filters: TaskFilter) -> list[ColumnElement[bool]]:
+    conds: list[ColumnElement[bool]] = []
+    if filters.event_id is not None:
+        conds.append(Task.event_id == filters.event_id)
+    if filters.program_id is not None:
+        conds.append(Task.event_id.in_(_program_events(filters.program_id)))
+    if filters.equipment:
+        conds.append(Task.equipment.has_all(array(filters.equipment, type_=Text)))
+    if filters.equipment_any:
+        conds.append(Task.equipment.has_any(array(filters.equipment_any, type_=Text)))
+    if filters.equipment_contains:
+        conds.append(Task.equipment.contains(filters.equipment_contains))
+    if filters.media:
+        conds.append(Task.media.has_all(array(filters.media, type_=Text)))
+    if filters.media_contains:
+        conds.append(Task.media.contains(filters.media_contains))
+    return conds
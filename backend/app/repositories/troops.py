@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import Select, and_, delete, func, select
+from sqlalchemy import Select, and_, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import OffsetPage, TotalMode
 from app.models.event import Event
 from app.models.troop import Troop, TroopParticipation
 from app.repositories.base import Repository
@@ -35,23 +35,11 @@ class TroopRepository(Repository):
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_troops_for_workspace(self, workspace_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count()).select_from(Troop).where(Troop.workspace_id == workspace_id)
-        )
-        return result or 0
-
     async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Troop]:
-        stmt = (
-            select(Troop)
-            .where(Troop.workspace_id == workspace_id)
-            .order_by(Troop.name)
-            .limit(limit)
-            .offset(offset)
-        )
-        return await self.scalars(stmt)
+        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[Troop]:
+        stmt = select(Troop).where(Troop.workspace_id == workspace_id).order_by(Troop.name)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, troop: Troop) -> Troop:
         await self.add(troop)
@@ -63,47 +51,27 @@ class TroopRepository(Repository):
 
     # ----- participations -----
 
-    async def count_event_troops(self, event_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(TroopParticipation)
-            .where(TroopParticipation.event_id == event_id)
-        )
-        return result or 0
-
     async def list_event_troops(
-        self, event_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Troop]:
+        self, event_id: UUID, *, limit: int = 50, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[Troop]:
         stmt = (
             select(Troop)
             .join(TroopParticipation, TroopParticipation.troop_id == Troop.id)
             .where(TroopParticipation.event_id == event_id)
             .order_by(Troop.name)
-            .limit(limit)
-            .offset(offset)
-        )
-        return await self.scalars(stmt)
-
-    async def count_troop_events(self, troop_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(TroopParticipation)
-            .where(TroopParticipation.troop_id == troop_id)
         )
-        return result or 0
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def list_troop_events(
-        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Event]:
+        self, troop_id: UUID, *, limit: int = 50, offset: int = 0, total: TotalMode = "exact"
+    ) -> OffsetPage[Event]:
         stmt = (
             select(Event)
             .join(TroopParticipation, TroopParticipation.event_id == Event.id)
             .where(TroopParticipation.troop_id == troop_id)
             .order_by(Event.start_dt)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def get_participation(self, event_id: UUID, troop_id: UUID) -> TroopParticipation | None:
         return await self.session.scalar(
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection
 from uuid import UUID
 
-from sqlalchemy import Select, delete, func, or_, select
+from sqlalchemy import Select, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
+from app.core.pagination import OffsetPage, SearchOrder, TotalMode
 from app.models.user import User
-from app.repositories.base import Repository
+from app.repositories.base import Repository, contains_any, similarity_to
+from app.schemas.user import UserInclude
 
 
 class UserRepository(Repository):
@@ -22,6 +25,7 @@ class UserRepository(Repository):
                 # eager-load relationships if commonly needed; adjust as you like
                 selectinload(User.ws_memberships),
                 selectinload(User.group_memberships),
+                undefer(User.preferences),
             )
             .where(User.id == user_id)
         )
@@ -34,48 +38,56 @@ class UserRepository(Repository):
         return res.scalars().first()
 
     async def get_by_auth0_id(self, auth0_id: str) -> User | None:
-        stmt = select(User).where(User.auth0_id == auth0_id)
+        # The identity cache keeps a full UserOut snapshot of this row
+        stmt = select(User).options(undefer(User.preferences)).where(User.auth0_id == auth0_id)
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count(self, *, q: str | None = None) -> int:
-        stmt = select(func.count()).select_from(User)
-        if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    User.name.ilike(ilike),
-                    User.email.ilike(ilike),
-                    User.auth0_id.ilike(ilike),
-                )
-            )
-        res = await self.session.execute(stmt)
-        return res.scalar_one()
-
     async def list(
         self,
         *,
         q: str | None = None,
+        sort: SearchOrder = "name",
         limit: int = 50,
         offset: int = 0,
-    ) -> Sequence[User]:
-        stmt = select(User).order_by(User.name.asc())
+        total: TotalMode = "exact",
+        include: Collection[UserInclude] = (),
+    ) -> OffsetPage[User]:
+        searched = (User.name, User.email, User.auth0_id)
+        stmt = select(User).options(*(undefer(getattr(User, name)) for name in include))
         if q:
-            ilike = f"%{q.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    User.name.ilike(ilike),
-                    User.email.ilike(ilike),
-                    User.auth0_id.ilike(ilike),
-                )
-            )
-        stmt = stmt.limit(limit).offset(offset)
-        return await self.scalars(stmt)
+            stmt = stmt.where(contains_any(q, *searched))
+        if q and sort == "similarity":
+            stmt = stmt.order_by(similarity_to(q, *searched).desc(), User.name.asc(), User.id)
+        else:
+            stmt = stmt.order_by(User.name.asc())
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create(self, user: User) -> User:
         await self.add(user)
         return user
 
+    async def upsert_by_auth0_id(self, *, auth0_id: str, email: str, name: str) -> User:
+        """
+        Insert the user or return the existing row for ``auth0_id``, in one statement.
+
+        ON CONFLICT makes concurrent first logins with the same token converge on a
+        single row instead of failing on uq_users_auth0_id. The no-op update is there
+        so RETURNING also yields the row when it already exists.
+        """
+        insert_stmt = pg_insert(User).values(auth0_id=auth0_id, email=email, name=name)
+        stmt = (
+            insert_stmt.on_conflict_do_update(
+                constraint="uq_users_auth0_id",
+                set_={"auth0_id": insert_stmt.excluded.auth0_id},
+            )
+            .returning(User)
+            .options(undefer(User.preferences))
+            .execution_options(populate_existing=True)
+        )
+        res = await self.session.execute(stmt)
+        return res.scalars().one()
+
     async def delete(self, user_id: UUID) -> int:
         res = await self.session.execute(delete(User).where(User.id == user_id))
         return res.rowcount or 0
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Collection
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
+from app.core.pagination import OffsetPage, TotalMode
 from app.models.workspace import Workspace, WorkspaceMembership, WorkspaceRole
+from app.schemas.workspace import WorkspaceInclude
 
 from .base import Repository
 
@@ -24,33 +26,30 @@ class WorkspaceRepository(Repository):
                 selectinload(Workspace.programs),
                 selectinload(Workspace.events),
                 selectinload(Workspace.troops),
+                undefer(Workspace.settings),
             )
             .where(Workspace.id == workspace_id)
         )
         res = await self.session.execute(stmt)
         return res.scalars().first()
 
-    async def count_user_workspaces(self, user_id: UUID) -> int:
-        result = await self.session.scalar(
-            select(func.count())
-            .select_from(Workspace)
-            .join(WorkspaceMembership, WorkspaceMembership.workspace_id == Workspace.id)
-            .where(WorkspaceMembership.user_id == user_id)
-        )
-        return result or 0
-
     async def list_user_workspaces(
-        self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> Sequence[Workspace]:
+        self,
+        user_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[WorkspaceInclude] = (),
+    ) -> OffsetPage[Workspace]:
         stmt = (
             select(Workspace)
+            .options(*(undefer(getattr(Workspace, name)) for name in include))
             .join(WorkspaceMembership, WorkspaceMembership.workspace_id == Workspace.id)
             .where(WorkspaceMembership.user_id == user_id)
             .order_by(Workspace.name)
-            .limit(limit)
-            .offset(offset)
         )
-        return await self.scalars(stmt)
+        return await self.paginate(stmt, limit=limit, offset=offset, total=total)
 
     async def create_user_workspace(
         self, user_id: UUID, ws: Workspace
@@ -7,7 +7,14 @@ from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.pagination import (
+    Cursor,
+    Limit,
+    Offset,
+    Total,
+    add_cursor_headers,
+    add_pagination_headers,
+)
 from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
 from app.services.comments import CommentService
 
@@ -25,18 +32,25 @@ async def list_content_comments(
     content_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = CommentService(session)
-    total = await svc.count_content_comments(content_id)
-    items = await svc.list_for_content(content_id, limit=limit, offset=offset)
+    if cursor is not None:
+        page = await svc.page_for_content(content_id, limit=limit, cursor=cursor)
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list_for_content(content_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 # create under content (user_id is in body per schema)
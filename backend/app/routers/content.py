@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_read_session
+from app.core.pagination import add_cursor_headers, add_pagination_headers
+from app.schemas.content_query import ContentQueryOut, ContentQueryParams
+from app.services.content import ContentService
+
+router = APIRouter(tags=["content"])
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+@router.get("/content", response_model=ContentQueryOut)
+async def query_content(
+    session: ReadSessionDep,
+    request: Request,
+    response: Response,
+    params: Annotated[ContentQueryParams, Query()],
+):
+    """Programs, events and tasks matching every given filter, newest first, with
+    facet counts (per content type, tag and duration bucket) over all matches.
+    """
+    svc = ContentService(session)
+    limit = params.limit
+    if params.cursor is not None:
+        cursor_page, facets = await svc.page(params, limit=limit, cursor=params.cursor)
+        add_cursor_headers(
+            response=response, request=request, next_cursor=cursor_page.next_cursor, limit=limit
+        )
+        return ContentQueryOut(items=cursor_page.items, facets=facets)
+    page, facets = await svc.list(params, limit=limit, offset=params.offset)
+    add_pagination_headers(
+        response=response,
+        request=request,
+        page=page,
+        limit=limit,
+        offset=params.offset,
+    )
+    return ContentQueryOut(items=page.items, facets=facets)
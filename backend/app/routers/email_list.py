@@ -6,6 +6,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.auth import Principal
 from app.core.db import get_session
 from app.schemas.email_list import EmailListCreate, EmailListOut
 from app.services.email_list import EmailListService
@@ -26,7 +27,8 @@ async def test_restart():
 
 
 @router.get("", response_model=list[EmailListOut])
-async def list_email_list(session: SessionDep):
+async def list_email_list(session: SessionDep, principal: Principal):
+    """Every subscribed address; for the export job (API key) or a signed-in user."""
     svc = EmailListService(session)
     return await svc.list()
 
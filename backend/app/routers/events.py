@@ -7,14 +7,24 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.auth import Principal
+from app.core.db import get_read_session, get_session
+from app.core.pagination import (
+    Cursor,
+    Limit,
+    Offset,
+    Total,
+    add_cursor_headers,
+    add_pagination_headers,
+)
 from app.models.content import ContentType
+from app.models.user import User
 from app.schemas.event import EventCreate, EventOut, EventUpdate
 from app.services.events import EventService
 
 router = APIRouter(tags=["events"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
 
 DEFAULT_DATE_FROM = Query(None)
 DEFAULT_DATE_TO = Query(None)
@@ -24,7 +34,7 @@ DEFAULT_DATE_TO = Query(None)
 
 @router.get("/workspaces/{workspace_id}/events", response_model=list[EventOut])
 async def list_workspace_events(
-    session: SessionDep,
+    session: ReadSessionDep,
     workspace_id: UUID,
     request: Request,
     response: Response,
@@ -32,20 +42,29 @@ async def list_workspace_events(
     date_to: dt.datetime | None = DEFAULT_DATE_TO,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = EventService(session)
-    total = await svc.count_events_for_workspace(workspace_id, date_from=date_from, date_to=date_to)
-    items = await svc.list_for_workspace(
-        workspace_id, date_from=date_from, date_to=date_to, limit=limit, offset=offset
+    if cursor is not None:
+        page = await svc.page_for_workspace(
+            workspace_id, date_from=date_from, date_to=date_to, limit=limit, cursor=cursor
+        )
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list_for_workspace(
+        workspace_id, date_from=date_from, date_to=date_to, limit=limit, offset=offset, total=total
     )
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.get(
@@ -62,27 +81,40 @@ async def list_program_events(
     date_to: dt.datetime | None = DEFAULT_DATE_TO,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = EventService(session)
-    total = await svc.count_events_for_program(
-        workspace_id, program_id, date_from=date_from, date_to=date_to
-    )
-    items = await svc.list_for_program(
+    if cursor is not None:
+        page = await svc.page_for_program(
+            workspace_id,
+            program_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            cursor=cursor,
+        )
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list_for_program(
         workspace_id,
         program_id,
         date_from=date_from,
         date_to=date_to,
         limit=limit,
         offset=offset,
+        total=total,
     )
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
@@ -92,11 +124,15 @@ async def list_program_events(
 )
 async def create_workspace_event(
     session: SessionDep,
+    principal: Principal,
     response: Response,
     workspace_id: UUID,
     body: EventCreate,
 ):
     assert body.content_type == ContentType.event, "Content type must be 'event'"
+    if isinstance(principal, User):
+        # Override author_id with authenticated user (never trust client input)
+        body.author_id = principal.id
     svc = EventService(session)
     event = await svc.create_under_workspace(workspace_id, body)
     response.headers["Location"] = f"/events/{event.id}"
@@ -110,11 +146,15 @@ async def create_workspace_event(
 )
 async def create_program_event(
     session: SessionDep,
+    principal: Principal,
     response: Response,
     program_id: UUID,
     body: EventCreate,
 ):
     assert body.content_type == ContentType.event, "Content type must be 'event'"
+    if isinstance(principal, User):
+        # Override author_id with authenticated user (never trust client input)
+        body.author_id = principal.id
     svc = EventService(session)
     event = await svc.create_under_program(program_id, body)
     response.headers["Location"] = f"/events/{event.id}"
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.pagination import Limit, Offset, Sort, Total, add_pagination_headers
 from app.schemas.group import (
     GroupCreate,
     GroupMemberOut,
@@ -33,20 +33,21 @@ async def list_groups(
     request: Request,
     response: Response,
     q: str | None = DEFAULT_Q,
+    sort: Sort = "name",
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = GroupService(session)
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+    page = await svc.list(q=q, sort=sort, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post("/groups", response_model=GroupOut, status_code=status.HTTP_201_CREATED)
@@ -87,18 +88,18 @@ async def list_group_members(
     group_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = GroupService(session)
-    total = await svc.count_group_members(group_id)
-    items = await svc.list_group_members(group_id, limit=limit, offset=offset)
+    page = await svc.list_group_members(group_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.get("/users/{user_id}/groups", response_model=list[GroupOut])
@@ -109,18 +110,18 @@ async def list_user_groups(
     user_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = GroupService(session)
-    total = await svc.count_user_groups(user_id)
-    items = await svc.list_user_groups(user_id, limit=limit, offset=offset)
+    page = await svc.list_user_groups(user_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
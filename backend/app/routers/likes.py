@@ -3,16 +3,41 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
-from app.schemas.like import LikeOut
+from app.core.auth import get_current_user
+from app.core.db import get_read_session, get_session
+from app.core.pagination import Limit, Offset, Total, add_pagination_headers
+from app.models.user import User
+from app.schemas.like import LikeOut, LikeState
 from app.services.likes import LikeService
 
 router = APIRouter(tags=["likes"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+MAX_LIKE_STATE_IDS = 200
+
+
+# ----- batch: like state for a page of content -----
+@router.get("/content/likes/state", response_model=list[LikeState])
+async def get_like_states(
+    session: ReadSessionDep,
+    current_user: CurrentUser,
+    content_id: Annotated[
+        list[UUID],
+        Query(
+            min_length=1,
+            max_length=MAX_LIKE_STATE_IDS,
+            description=f"Content ids to look up (repeatable, at most {MAX_LIKE_STATE_IDS})",
+        ),
+    ],
+):
+    """Like count and liked-by-me for every listed content id that exists."""
+    svc = LikeService(session)
+    return await svc.like_states(current_user.id, content_id)
 
 
 # ----- collection: by content -----
@@ -24,18 +49,18 @@ async def list_content_likes(
     content_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = LikeService(session)
-    total = await svc.count_content_likes(content_id)
-    items = await svc.list_for_content(content_id, limit=limit, offset=offset)
+    page = await svc.list_for_content(content_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
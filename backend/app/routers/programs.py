@@ -6,38 +6,55 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.auth import Principal
+from app.core.db import get_read_session, get_session
+from app.core.pagination import (
+    Cursor,
+    Limit,
+    Offset,
+    Total,
+    add_cursor_headers,
+    add_pagination_headers,
+)
 from app.models.content import ContentType
+from app.models.user import User
 from app.schemas.program import ProgramCreate, ProgramOut, ProgramUpdate
 from app.services.programs import ProgramService
 
 router = APIRouter(tags=["programs"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
 
 # ----- workspace-scoped collection endpoints -----
 
 
 @router.get("/workspaces/{workspace_id}/programs", response_model=list[ProgramOut])
 async def list_workspace_programs(
-    session: SessionDep,
+    session: ReadSessionDep,
     request: Request,
     response: Response,
     workspace_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = ProgramService(session)
-    total = await svc.count_programs_for_workspace(workspace_id)
-    items = await svc.list_for_workspace(workspace_id, limit=limit, offset=offset)
+    if cursor is not None:
+        page = await svc.page_for_workspace(workspace_id, limit=limit, cursor=cursor)
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list_for_workspace(workspace_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
@@ -47,40 +64,18 @@ async def list_workspace_programs(
 )
 async def create_program_under_workspace(
     session: SessionDep,
+    principal: Principal,
     workspace_id: UUID,
     body: ProgramCreate,
     response: Response,
 ):
-    # Toggle this to enable/disable debug logging for program creation
-    DEBUG_PROGRAM_CREATE = True
-
-    if DEBUG_PROGRAM_CREATE:
-        print(f"=== CREATE PROGRAM DEBUG ===")
-        print(f"Workspace ID: {workspace_id}")
-        print(f"Current user ID: {current_user.id}")
-        print(f"Request body type: {type(body)}")
-        print(f"Request body: {body.model_dump()}")
-        print(f"Body validation errors: {body.model_validate(body.model_dump())}")
-
-    try:
+    if isinstance(principal, User):
         # Override author_id with authenticated user (never trust client input)
-        body.author_id = current_user.id
-
-        svc = ProgramService(session)
-        program = await svc.create_under_workspace(workspace_id, body)
-        response.headers["Location"] = f"/programs/{program.id}"
-        return program
-    except ValidationError as e:
-        if DEBUG_PROGRAM_CREATE:
-            print(f"=== VALIDATION ERROR ===")
-            print(f"Validation errors: {e.errors()}")
-        raise
-    except Exception as e:
-        if DEBUG_PROGRAM_CREATE:
-            print(f"=== UNEXPECTED ERROR ===")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
-        raise
+        body.author_id = principal.id
+    svc = ProgramService(session)
+    program = await svc.create_under_workspace(workspace_id, body)
+    response.headers["Location"] = f"/programs/{program.id}"
+    return program
 
 
 # ----- item endpoints -----
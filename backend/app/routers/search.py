@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_current_user
+from app.core.db import get_read_session
+from app.core.pagination import Cursor, Limit, add_cursor_headers
+from app.models.content import ContentType
+from app.models.user import User
+from app.schemas.search import SearchHit
+from app.services.search import SearchService
+
+router = APIRouter(tags=["search"])
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+CurrentUser = Annotated[User, Depends(get_current_user)]
+
+MAX_QUERY_LENGTH = 200
+
+
+@router.get("/search", response_model=list[SearchHit])
+async def search_content(
+    session: ReadSessionDep,
+    current_user: CurrentUser,
+    request: Request,
+    response: Response,
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=MAX_QUERY_LENGTH,
+            description='Search terms; supports "quoted phrases", OR and -excluded words',
+        ),
+    ],
+    content_type: Annotated[
+        list[ContentType] | None,
+        Query(description="Only return these content types (repeatable)"),
+    ] = None,
+    workspace_id: UUID | None = None,
+    limit: Limit = 20,
+    cursor: Cursor = None,
+):
+    """Programs, events and tasks in the caller's workspaces whose name or description
+    match ``q``, best match first. Always keyset-paginated: follow the rel="next" Link.
+    """
+    svc = SearchService(session)
+    page = await svc.search(
+        current_user.id,
+        q,
+        content_types=content_type or (),
+        workspace_id=workspace_id,
+        limit=limit,
+        cursor=cursor or "",
+    )
+    add_cursor_headers(
+        response=response, request=request, next_cursor=page.next_cursor, limit=limit
+    )
+    return page.items
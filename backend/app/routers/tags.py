@@ -6,19 +6,29 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.db import get_read_session, get_session
+from app.core.pagination import (
+    Cursor,
+    Limit,
+    Offset,
+    Sort,
+    Total,
+    add_cursor_headers,
+    add_pagination_headers,
+)
 from app.schemas.content import ContentOut
 from app.schemas.tag import (
     ContentTagOut,
     TagCreate,
     TagOut,
+    TagSuggestion,
     TagUpdate,
 )
 from app.services.tags import TagService
 
 router = APIRouter(tags=["tags"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
 
 DEFAULT_Q = Query(None, min_length=2, description="Case-insensitive search in tag names")
 
@@ -31,20 +41,28 @@ async def list_tags(
     request: Request,
     response: Response,
     q: str | None = DEFAULT_Q,
+    sort: Sort = "name",
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = TagService(session)
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+    if cursor is not None:
+        page = await svc.page(q=q, sort=sort, limit=limit, cursor=cursor)
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list(q=q, sort=sort, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post("/tags", response_model=TagOut, status_code=status.HTTP_201_CREATED)
@@ -55,6 +73,17 @@ async def create_tag(session: SessionDep, body: TagCreate, response: Response):
     return tag
 
 
+@router.get("/tags/suggest", response_model=list[TagSuggestion])
+async def suggest_tags(
+    session: SessionDep,
+    q: Annotated[str, Query(min_length=1, max_length=100, description="Typed prefix")],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+):
+    """Tags starting with, then containing, ``q``; most used first. Served from memory."""
+    svc = TagService(session)
+    return await svc.suggest(q, limit=limit)
+
+
 @router.get("/tags/{tag_id}", response_model=TagOut)
 async def get_tag(session: SessionDep, tag_id: UUID):
     svc = TagService(session)
@@ -85,40 +114,47 @@ async def list_content_tags(
     content_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = TagService(session)
-    total = await svc.count_content_tags(content_id)
-    items = await svc.list_content_tags(content_id, limit=limit, offset=offset)
+    page = await svc.list_content_tags(content_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.get("/tags/{tag_id}/content", response_model=list[ContentOut])
 async def list_tagged_content(
-    session: SessionDep,
+    session: ReadSessionDep,
     request: Request,
     response: Response,
     tag_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    cursor: Cursor = None,
 ):
     svc = TagService(session)
-    total = await svc.count_tagged_content(tag_id)
-    items = await svc.list_tagged_content(tag_id, limit=limit, offset=offset)
+    if cursor is not None:
+        page = await svc.page_tagged_content(tag_id, limit=limit, cursor=cursor)
+        add_cursor_headers(
+            response=response, request=request, next_cursor=page.next_cursor, limit=limit
+        )
+        return page.items
+    page = await svc.list_tagged_content(tag_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.put(
@@ -3,23 +3,80 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.auth import Principal
+from app.core.db import get_read_session, get_session
+from app.core.pagination import Limit, Offset, Total, add_pagination_headers
 from app.models.content import ContentType
-from app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from app.models.user import User
+from app.schemas.task import (
+    PackingListItem,
+    TaskCreate,
+    TaskInclude,
+    TaskListItem,
+    TaskOut,
+    TaskQueryParams,
+    TaskUpdate,
+)
 from app.services.tasks import TaskService
 
 router = APIRouter(tags=["tasks"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+# ----- equipment and media queries -----
+
+
+@router.get("/tasks", response_model=list[TaskListItem], response_model_exclude_unset=True)
+async def query_tasks(
+    session: ReadSessionDep,
+    request: Request,
+    response: Response,
+    params: Annotated[TaskQueryParams, Query()],
+):
+    """Tasks by name, filtered on equipment and media keys or contained JSON."""
+    svc = TaskService(session)
+    page = await svc.query(
+        params,
+        limit=params.limit,
+        offset=params.offset,
+        total=params.total,
+        include=params.include,
+    )
+    add_pagination_headers(
+        response=response,
+        request=request,
+        page=page,
+        limit=params.limit,
+        offset=params.offset,
+    )
+    return page.items
+
+
+@router.get("/events/{event_id}/packing-list", response_model=list[PackingListItem])
+async def event_packing_list(session: ReadSessionDep, event_id: UUID):
+    svc = TaskService(session)
+    return await svc.packing_list_for_event(event_id)
+
+
+@router.get("/programs/{program_id}/packing-list", response_model=list[PackingListItem])
+async def program_packing_list(session: ReadSessionDep, program_id: UUID):
+    """Equipment over the tasks of every event in the program."""
+    svc = TaskService(session)
+    return await svc.packing_list_for_program(program_id)
 
 
 # ----- collection under event -----
 
 
-@router.get("/events/{event_id}/tasks", response_model=list[TaskOut])
+@router.get(
+    "/events/{event_id}/tasks",
+    response_model=list[TaskListItem],
+    response_model_exclude_unset=True,
+)
 async def list_event_tasks(
     session: SessionDep,
     request: Request,
@@ -27,18 +84,24 @@ async def list_event_tasks(
     event_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    include: Annotated[
+        list[TaskInclude] | None,
+        Query(description="Deferred fields to add to each task (repeatable)"),
+    ] = None,
 ):
     svc = TaskService(session)
-    total = await svc.count_tasks_for_event(event_id)
-    items = await svc.list_for_event(event_id, limit=limit, offset=offset)
+    page = await svc.list_for_event(
+        event_id, limit=limit, offset=offset, total=total, include=include or ()
+    )
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
@@ -48,11 +111,15 @@ async def list_event_tasks(
 )
 async def create_event_task(
     session: SessionDep,
+    principal: Principal,
     event_id: UUID,
     body: TaskCreate,
     response: Response,
 ):
     assert body.content_type == ContentType.task, "Content type must be 'task'"
+    if isinstance(principal, User):
+        # Override author_id with authenticated user (never trust client input)
+        body.author_id = principal.id
     svc = TaskService(session)
     task = await svc.create_under_event(event_id, body)
     response.headers["Location"] = f"/tasks/{task.id}"
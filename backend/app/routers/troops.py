@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.pagination import Limit, Offset, Total, add_pagination_headers
 from app.schemas.troop import (
     TroopCreate,
     TroopOut,
@@ -31,18 +31,18 @@ async def list_workspace_troops(
     workspace_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = TroopService(session)
-    total = await svc.count_troops_for_workspace(workspace_id)
-    items = await svc.list_for_workspace(workspace_id, limit=limit, offset=offset)
+    page = await svc.list_for_workspace(workspace_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
@@ -98,18 +98,18 @@ async def list_event_troops(
     event_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = TroopService(session)
-    total = await svc.count_event_troops(event_id)
-    items = await svc.list_event_troops(event_id, limit=limit, offset=offset)
+    page = await svc.list_event_troops(event_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.get("/troops/{troop_id}/events", response_model=list[UUID])
@@ -120,18 +120,18 @@ async def list_troop_events(
     troop_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
 ):
     svc = TroopService(session)
-    total = await svc.count_troop_events(troop_id)
-    items = await svc.list_troop_events(troop_id, limit=limit, offset=offset)
+    page = await svc.list_troop_events(troop_id, limit=limit, offset=offset, total=total)
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.put(
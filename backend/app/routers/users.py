@@ -9,9 +9,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
+from app.core.pagination import Limit, Offset, Sort, Total, add_pagination_headers
 from app.models.user import User
-from app.schemas.user import UserCreate, UserOut, UserUpdate
+from app.schemas.user import UserCreate, UserInclude, UserListItem, UserOut, UserUpdate
 from app.services.users import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -21,26 +21,33 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 DEFAULT_Q = Query(None, min_length=2, description="Case-insensitive search in name/email/auth0_id")
 
 
-@router.get("", response_model=list[UserOut])
+@router.get("", response_model=list[UserListItem], response_model_exclude_unset=True)
 async def list_users(
     session: SessionDep,
     request: Request,
     response: Response,
     q: str | None = DEFAULT_Q,
+    sort: Sort = "name",
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    include: Annotated[
+        list[UserInclude] | None,
+        Query(description="Deferred fields to add to each user (repeatable)"),
+    ] = None,
 ):
     svc = UserService(session)
-    total = await svc.count(q=q)
-    items = await svc.list(q=q, limit=limit, offset=offset)
+    page = await svc.list(
+        q=q, sort=sort, limit=limit, offset=offset, total=total, include=include or ()
+    )
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
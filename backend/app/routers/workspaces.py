@@ -3,12 +3,18 @@ from __future__ import annotations
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_session
-from app.core.pagination import Limit, Offset, add_pagination_headers
-from app.schemas.workspace import WorkspaceCreate, WorkspaceOut, WorkspaceUpdate
+from app.core.pagination import Limit, Offset, Total, add_pagination_headers
+from app.schemas.workspace import (
+    WorkspaceCreate,
+    WorkspaceInclude,
+    WorkspaceListItem,
+    WorkspaceOut,
+    WorkspaceUpdate,
+)
 from app.services.workspaces import WorkspaceService
 
 router = APIRouter(tags=["workspaces"])
@@ -16,7 +22,11 @@ router = APIRouter(tags=["workspaces"])
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
-@router.get("/users/{user_id}/workspaces", response_model=list[WorkspaceOut])
+@router.get(
+    "/users/{user_id}/workspaces",
+    response_model=list[WorkspaceListItem],
+    response_model_exclude_unset=True,
+)
 async def list_user_workspaces(
     session: SessionDep,
     request: Request,
@@ -24,18 +34,24 @@ async def list_user_workspaces(
     user_id: UUID,
     limit: Limit = 50,
     offset: Offset = 0,
+    total: Total = "exact",
+    include: Annotated[
+        list[WorkspaceInclude] | None,
+        Query(description="Deferred fields to add to each workspace (repeatable)"),
+    ] = None,
 ):
     svc = WorkspaceService(session)
-    total = await svc.count_user_workspaces(user_id)
-    items = await svc.list_user_workspaces(user_id, limit=limit, offset=offset)
+    page = await svc.list_user_workspaces(
+        user_id, limit=limit, offset=offset, total=total, include=include or ()
+    )
     add_pagination_headers(
         response=response,
         request=request,
-        total=total,
+        page=page,
         limit=limit,
         offset=offset,
     )
-    return items
+    return page.items
 
 
 @router.post(
@@ -4,7 +4,7 @@ import datetime as dt
 from typing import Annotated, TYPE_CHECKING
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from app.domain.content_constraints import DESC_MAX, NAME_MAX, NAME_MIN
 from app.utils import get_current_datetime
@@ -27,17 +27,9 @@ class ContentBase(BaseModel):
 
     name: NameStr
     description: DescStr | None = None
-    like_count: int = 0
     created_at: dt.datetime = Field(default_factory=get_current_datetime)
     author_id: UUID
 
-    @field_validator("like_count")
-    @classmethod
-    def validate_like_count(cls, v: int) -> int:
-        if v < 0:
-            raise ValueError("like_count must be >= 0")
-        return v
-
 
 class ContentCreate(ContentBase):
     pass
@@ -48,14 +40,6 @@ class ContentUpdate(BaseModel):
 
     name: NameStr | None = None
     description: DescStr | None = None
-    like_count: int | None = None
-
-    @field_validator("like_count")
-    @classmethod
-    def validate_like_count(cls, v: int | None) -> int | None:
-        if v is not None and v < 0:
-            raise ValueError("like_count must be >= 0")
-        return v
 
 
 class ContentOut(ContentBase):
@@ -64,4 +48,6 @@ class ContentOut(ContentBase):
     id: UUID
     author: "UserNested"
     tags: list["TagOut"] = []
+    # Counters are output only; likes and comments move them (FR-CN5)
+    like_count: int = 0
     comment_count: int = 0
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from app.models.content import ContentType
+
+from .content import ContentOut
+from .tag import TagOut  # noqa: F401
+from .user import UserNested  # noqa: F401
+
+# Resolve ContentOut's forward references to TagOut and UserNested
+ContentOut.model_rebuild()
+
+MAX_FILTER_TAGS = 20
+MAX_FILTER_EQUIPMENT = 20
+
+
+class ContentFilter(BaseModel):
+    """Filters for GET /content. Duration, participant and equipment filters only
+    match tasks, so setting any of them leaves programs and events out."""
+
+    tag_id: list[UUID] = Field(
+        default_factory=list,
+        max_length=MAX_FILTER_TAGS,
+        description="Tag ids (repeatable); see tag_mode",
+    )
+    tag_mode: Literal["all", "any"] = Field(
+        "all", description="all: content must carry every tag; any: at least one"
+    )
+    content_type: list[ContentType] = Field(default_factory=list)
+    created_from: dt.datetime | None = None
+    created_to: dt.datetime | None = None
+    duration_min: int | None = Field(None, ge=0, description="Minutes, inclusive")
+    duration_max: int | None = Field(None, ge=0, description="Minutes, inclusive")
+    participants_min: int | None = Field(
+        None, ge=0, description="Tasks whose participant range overlaps this range"
+    )
+    participants_max: int | None = Field(None, ge=0)
+    equipment: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_FILTER_EQUIPMENT,
+        description="Equipment keys the task must list (repeatable, all required)",
+    )
+
+    @model_validator(mode="after")
+    def _ordered_ranges(self) -> ContentFilter:
+        for low, high in (
+            ("created_from", "created_to"),
+            ("duration_min", "duration_max"),
+            ("participants_min", "participants_max"),
+        ):
+            lo, hi = getattr(self, low), getattr(self, high)
+            if lo is not None and hi is not None and hi < lo:
+                raise ValueError(f"{high} must be >= {low}")
+        return self
+
+    @property
+    def tasks_only(self) -> bool:
+        return (
+            self.duration_min is not None
+            or self.duration_max is not None
+            or self.participants_min is not None
+            or self.participants_max is not None
+            or bool(self.equipment)
+        )
+
+
+class ContentQueryParams(ContentFilter):
+    """ContentFilter plus paging; FastAPI reads a query model only as the sole query
+    parameter, so limit/offset/cursor (see app.core.pagination) live here too."""
+
+    limit: int = Field(50, ge=1, le=200, description="Max items to return (1-200)")
+    offset: int = Field(0, ge=0, description="Number of items to skip")
+    cursor: str | None = Field(
+        None,
+        max_length=512,
+        description='Opaque cursor from a rel="next" Link header; empty for the first page',
+    )
+
+
+class ContentListItem(ContentOut):
+    model_config = ConfigDict(from_attributes=True)
+
+    content_type: ContentType
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class TagFacetCount(BaseModel):
+    tag_id: UUID
+    name: str
+    count: int
+
+
+class ContentFacets(BaseModel):
+    """Counts over every row matching the filters, not just the returned page."""
+
+    content_type: list[FacetCount] = []
+    tag: list[TagFacetCount] = []
+    duration: list[FacetCount] = []
+
+
+class ContentQueryOut(BaseModel):
+    items: list[ContentListItem]
+    facets: ContentFacets
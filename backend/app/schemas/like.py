@@ -13,3 +13,11 @@ class LikeBase(BaseModel):
 class LikeOut(LikeBase):
     model_config = ConfigDict(from_attributes=True)
     pass
+
+
+class LikeState(BaseModel):
+    """Like counter for one piece of content and whether the caller liked it."""
+
+    content_id: UUID
+    like_count: int
+    liked: bool
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.content import ContentType
+
+
+class SearchHit(BaseModel):
+    """One content item matching a search, best matches first."""
+
+    id: UUID
+    content_type: ContentType
+    name: str
+    workspace_id: UUID
+    rank: float
+    snippet: str = Field(
+        description=(
+            "HTML excerpt of the description (or the name when there is none): the "
+            "text is HTML-escaped and matched words are wrapped in <mark></mark>"
+        )
+    )
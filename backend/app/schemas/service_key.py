@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, StringConstraints
+
+from app.domain.service_key_constraints import NAME_MAX, NAME_MIN, SCOPE_MAX
+
+NameStr = Annotated[
+    str,
+    StringConstraints(min_length=NAME_MIN, max_length=NAME_MAX, strip_whitespace=True),
+]
+ScopeStr = Annotated[
+    str,
+    StringConstraints(
+        min_length=1,
+        max_length=SCOPE_MAX,
+        strip_whitespace=True,
+        pattern=r"^(\*|[a-z_]+(:read|:write)?)$",
+    ),
+]
+
+
+class ServiceApiKeyCreate(BaseModel):
+    """Scopes are router tags (``events``), optionally limited (``events:read``), or ``*``."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    name: NameStr
+    scopes: list[ScopeStr]
+
+
+class ServiceApiKeyOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: NameStr
+    prefix: str
+    scopes: list[str]
+    created_at: dt.datetime
+    revoked_at: dt.datetime | None = None
+
+
+class ServiceApiKeyCreated(ServiceApiKeyOut):
+    """Returned once on creation; ``key`` is never stored or shown again."""
+
+    key: str
@@ -32,6 +32,10 @@ class TagOut(TagBase):
     id: UUID
 
 
+class TagSuggestion(TagOut):
+    usage_count: int
+
+
 # -------- ContentTag --------
 class ContentTagCreate(BaseModel):
     tag_id: UUID
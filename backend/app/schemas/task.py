@@ -3,8 +3,9 @@ from __future__ import annotations
 from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import ConfigDict, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, Json, field_validator, model_validator
 
+from app.core.pagination import TotalMode
 from app.models.content import ContentType
 
 from .content import ContentCreate, ContentOut, ContentUpdate
@@ -14,6 +15,11 @@ from .user import UserNested  # Import for nested author
 # Rebuild model to resolve forward references
 ContentOut.model_rebuild()
 
+MAX_FILTER_KEYS = 20
+
+# Deferred columns a task list can be asked to include
+TaskInclude = Literal["equipment", "media"]
+
 
 class TaskCreate(ContentCreate):
     content_type: Literal[ContentType.task] = ContentType.task
@@ -105,3 +111,65 @@ class TaskOut(ContentOut):
     estimated_duration: int | None = None
     participant_min: int | None = None
     participant_max: int | None = None
+
+
+class TaskListItem(TaskOut):
+    """A task in a list; ``equipment`` and ``media`` are left out unless requested."""
+
+    equipment: dict[str, Any] | None = Field(None, description="Only with include=equipment")
+    media: dict[str, Any] | None = Field(None, description="Only with include=media")
+
+
+class TaskFilter(BaseModel):
+    """Filters for GET /tasks over the free-form ``equipment`` and ``media`` objects.
+
+    Key filters test for top-level keys; ``*_contains`` takes a JSON object the
+    column must contain (``{"rope": 2}`` matches tasks needing exactly 2 ropes).
+    """
+
+    event_id: UUID | None = None
+    program_id: UUID | None = None
+    equipment: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_FILTER_KEYS,
+        description="Equipment keys the task must list (repeatable, all required)",
+    )
+    equipment_any: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_FILTER_KEYS,
+        description="Equipment keys of which the task must list at least one",
+    )
+    equipment_contains: Json[dict[str, Any]] | None = None
+    media: list[str] = Field(
+        default_factory=list,
+        max_length=MAX_FILTER_KEYS,
+        description="Media keys the task must have, e.g. video (repeatable, all required)",
+    )
+    media_contains: Json[dict[str, Any]] | None = None
+
+
+class TaskQueryParams(TaskFilter):
+    """TaskFilter plus paging, as one query model (see ContentQueryParams)."""
+
+    limit: int = Field(50, ge=1, le=200, description="Max items to return (1-200)")
+    offset: int = Field(0, ge=0, description="Number of items to skip")
+    include: list[TaskInclude] = Field(
+        default_factory=list, description="Deferred fields to add to each task (repeatable)"
+    )
+    total: TotalMode = Field(
+        "exact",
+        description=(
+            "exact: count all matching rows (default); estimate: use the query planner's "
+            "row estimate; none: skip counting"
+        ),
+    )
+
+
+class PackingListItem(BaseModel):
+    """One equipment key summed over tasks. Numeric values are rounded up; any
+    other value except null and false counts as one."""
+
+    item: str
+    total_quantity: int = Field(description="Sum over all tasks, if they run at once")
+    max_quantity: int = Field(description="Most any one task needs, if run in turn")
+    task_count: int
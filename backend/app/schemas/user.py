@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
 
 from app.domain.user_constraints import (
     AUTH0_ID_MAX,
@@ -27,6 +27,9 @@ EmailConstrained = Annotated[
     EmailStr, StringConstraints(max_length=EMAIL_MAX, strip_whitespace=True)
 ]
 
+# Deferred columns a user list can be asked to include
+UserInclude = Literal["preferences"]
+
 
 class UserBase(BaseModel):
     """Shared properties across user models."""
@@ -76,6 +79,12 @@ class UserOut(UserBase):
     auth0_id: Auth0Id
 
 
+class UserListItem(UserOut):
+    """A user in a list; ``preferences`` is left out unless requested."""
+
+    preferences: dict[str, Any] | None = Field(None, description="Only with include=preferences")
+
+
 class UserNested(BaseModel):
     """Minimal user info for embedding in other schemas."""
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints
@@ -17,6 +17,9 @@ NameStr = Annotated[
     StringConstraints(min_length=NAME_MIN, max_length=NAME_MAX, strip_whitespace=True),
 ]
 
+# Deferred columns a workspace list can be asked to include
+WorkspaceInclude = Literal["settings"]
+
 
 def get_first_monday_of_september() -> dt.date:
     year = dt.date.today().year
@@ -64,6 +67,12 @@ class WorkspaceOut(WorkspaceBase):
     id: UUID
 
 
+class WorkspaceListItem(WorkspaceOut):
+    """A workspace in a list; ``settings`` is left out unless requested."""
+
+    settings: dict[str, Any] | None = Field(None, description="Only with include=settings")
+
+
 class WorkspaceNested(BaseModel):
     """Minimal workspace info for embedding in other schemas."""
 
@@ -5,8 +5,9 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CursorPage, OffsetPage, TotalMode
 from app.models.comment import Comment
-from app.repositories.comments import CommentRepository
+from app.repositories.comments import COMMENT_ORDER, CommentRepository
 from app.schemas.comment import CommentCreate, CommentOut, CommentUpdate
 
 
@@ -15,16 +16,33 @@ class CommentService:
         self.session = session
         self.repo = CommentRepository(session)
 
-    async def count_content_comments(self, content_id: UUID) -> int:
-        return await self.repo.count_content_comments(content_id)
-
     async def list_for_content(
-        self, content_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[CommentOut]:
-        rows = await self.repo.list_for_content(content_id, limit=limit, offset=offset)
-        return [CommentOut.model_validate(r) for r in rows]
+        self,
+        content_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[CommentOut]:
+        page = await self.repo.list_for_content(content_id, limit=limit, offset=offset, total=total)
+        return page.map(CommentOut.model_validate)
+
+    async def page_for_content(
+        self, content_id: UUID, *, limit: int = 50, cursor: str = ""
+    ) -> CursorPage[CommentOut]:
+        page = await self.repo.list_for_content(
+            content_id,
+            limit=limit,
+            cursor=cursor,
+            total="none",
+        )
+        return COMMENT_ORDER.cursor_page(page.map(CommentOut.model_validate))
 
     async def create_under_content(self, content_id: UUID, data: CommentCreate) -> CommentOut:
+        # Bumping the counter first also locks the content row until commit, so
+        # concurrent comments on the same content serialise on it
+        if not await self.repo.adjust_comment_count(content_id, 1):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Content not found")
         comment = Comment(
             body=data.body,
             content_id=content_id,
@@ -54,7 +72,14 @@ class CommentService:
         return CommentOut.model_validate(row)
 
     async def delete(self, comment_id: UUID) -> None:
-        deleted = await self.repo.delete(comment_id)
-        if not deleted:
+        content_id = await self.repo.delete(comment_id)
+        if content_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+        await self.repo.adjust_comment_count(content_id, -1)
+        await self.session.commit()
+
+    async def reconcile_counts(self) -> int:
+        """Recompute content.comment_count from the comments table."""
+        fixed = await self.repo.reconcile_comment_counts()
         await self.session.commit()
+        return fixed
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import CursorPage, OffsetPage
+from app.repositories.content import CONTENT_ORDER, DURATION_BUCKETS, ContentRepository
+from app.schemas.content_query import (
+    ContentFacets,
+    ContentFilter,
+    ContentListItem,
+    FacetCount,
+    TagFacetCount,
+)
+
+
+class ContentService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.repo = ContentRepository(session)
+
+    async def list(
+        self, filters: ContentFilter, *, limit: int = 50, offset: int = 0
+    ) -> tuple[OffsetPage[ContentListItem], ContentFacets]:
+        page = await self.repo.query(filters, limit=limit, offset=offset)
+        facets = _facets(await self.repo.facets(filters))
+        total = sum(f.count for f in facets.content_type)
+        return replace(page.map(ContentListItem.model_validate), total=total), facets
+
+    async def page(
+        self, filters: ContentFilter, *, limit: int = 50, cursor: str = ""
+    ) -> tuple[CursorPage[ContentListItem], ContentFacets]:
+        page = await self.repo.query(filters, limit=limit, cursor=cursor)
+        facets = _facets(await self.repo.facets(filters))
+        return CONTENT_ORDER.cursor_page(page.map(ContentListItem.model_validate)), facets
+
+
+def _duration_label(bucket: int) -> str:
+    """Minutes covered by width_bucket index ``bucket``, e.g. "15-30" or "120+"."""
+    if bucket >= len(DURATION_BUCKETS):
+        return f"{DURATION_BUCKETS[-1]}+"
+    low = DURATION_BUCKETS[bucket - 1] if bucket > 0 else 0
+    return f"{low}-{DURATION_BUCKETS[bucket]}"
+
+
+def _facets(rows: Sequence[Row[Any]]) -> ContentFacets:
+    facets = ContentFacets()
+    for row in rows:
+        if row.facet == "content_type":
+            facets.content_type.append(FacetCount(value=row.value, count=row.count))
+        elif row.facet == "tag":
+            facets.tag.append(TagFacetCount(tag_id=row.value, name=row.label, count=row.count))
+        else:
+            facets.duration.append(FacetCount(value=row.value, count=row.count))
+    facets.content_type.sort(key=lambda f: (-f.count, f.value))
+    facets.duration.sort(key=lambda f: int(f.value))
+    for f in facets.duration:
+        f.value = _duration_label(int(f.value))
+    return facets
@@ -6,8 +6,9 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CursorPage, OffsetPage, TotalMode
 from app.models.event import Event
-from app.repositories.events import EventRepository
+from app.repositories.events import EVENT_ORDER, EventRepository
 from app.repositories.programs import ProgramRepository
 from app.schemas.event import EventCreate, EventOut, EventUpdate
 
@@ -19,48 +20,69 @@ class EventService:
         self.program_repo = ProgramRepository(session)
 
     # ----- workspace/program scoped listing -----
-    async def count_events_for_workspace(
+
+    async def list_for_workspace(
         self,
         workspace_id: UUID,
         *,
         date_from: dt.datetime | None = None,
         date_to: dt.datetime | None = None,
-    ) -> int:
-        return await self.repo.count_for_workspace(
-            workspace_id, date_from=date_from, date_to=date_to
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[EventOut]:
+        page = await self.repo.list_for_workspace(
+            workspace_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            total=total,
         )
+        return page.map(EventOut.model_validate)
 
-    async def list_for_workspace(
+    async def page_for_workspace(
         self,
         workspace_id: UUID,
         *,
         date_from: dt.datetime | None = None,
         date_to: dt.datetime | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[EventOut]:
-        rows = await self.repo.list_for_workspace(
+        cursor: str = "",
+    ) -> CursorPage[EventOut]:
+        page = await self.repo.list_for_workspace(
             workspace_id,
             date_from=date_from,
             date_to=date_to,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
+            total="none",
         )
-        return [EventOut.model_validate(r) for r in rows]
+        return EVENT_ORDER.cursor_page(page.map(EventOut.model_validate))
 
-    async def count_events_for_program(
+    async def list_for_program(
         self,
         workspace_id: UUID,
         program_id: UUID,
         *,
         date_from: dt.datetime | None = None,
         date_to: dt.datetime | None = None,
-    ) -> int:
-        return await self.repo.count_for_program(
-            workspace_id, program_id, date_from=date_from, date_to=date_to
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[EventOut]:
+        page = await self.repo.list_for_program(
+            workspace_id,
+            program_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            total=total,
         )
+        return page.map(EventOut.model_validate)
 
-    async def list_for_program(
+    async def page_for_program(
         self,
         workspace_id: UUID,
         program_id: UUID,
@@ -68,17 +90,18 @@ class EventService:
         date_from: dt.datetime | None = None,
         date_to: dt.datetime | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[EventOut]:
-        rows = await self.repo.list_for_program(
+        cursor: str = "",
+    ) -> CursorPage[EventOut]:
+        page = await self.repo.list_for_program(
             workspace_id,
             program_id,
             date_from=date_from,
             date_to=date_to,
             limit=limit,
-            offset=offset,
+            cursor=cursor,
+            total="none",
         )
-        return [EventOut.model_validate(r) for r in rows]
+        return EVENT_ORDER.cursor_page(page.map(EventOut.model_validate))
 
     # ----- creation under workspace/program -----
 
@@ -86,7 +109,8 @@ class EventService:
         event = Event(workspace_id=workspace_id, program_id=None, **data.model_dump())
         await self.repo.create(event)
         await self.session.commit()
-        await self.session.refresh(event)
+        # EventOut reads these, and an AsyncSession cannot lazy-load them
+        await self.repo.refresh(event, "author", "workspace", "content_tags")
         return EventOut.model_validate(event)
 
     async def create_under_program(self, program_id: UUID, data: EventCreate) -> EventOut:
@@ -100,7 +124,8 @@ class EventService:
         )
         await self.repo.create(event)
         await self.session.commit()
-        await self.session.refresh(event)
+        # EventOut reads these, and an AsyncSession cannot lazy-load them
+        await self.repo.refresh(event, "author", "workspace", "content_tags")
         return EventOut.model_validate(event)
 
     # ----- item operations -----
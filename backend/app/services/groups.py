@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import OffsetPage, SearchOrder, TotalMode
 from app.models.group import Group
 from app.repositories.groups import GroupRepository
 from app.schemas.group import (
@@ -26,12 +27,21 @@ class GroupService:
 
     # ----- groups -----
 
-    async def count(self, *, q: str | None = None) -> int:
-        return await self.repo.count(q=q)
-
-    async def list(self, *, q: str | None, limit: int = 50, offset: int = 0) -> list[GroupOut]:
-        rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [GroupOut.model_validate(r) for r in rows]
+    async def list(
+        self,
+        *,
+        q: str | None,
+        sort: SearchOrder = "name",
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[GroupOut]:
+        if sort == "similarity" and not q:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="sort=similarity requires q"
+            )
+        page = await self.repo.list(q=q, sort=sort, limit=limit, offset=offset, total=total)
+        return page.map(GroupOut.model_validate)
 
     async def get(self, group_id: UUID) -> GroupOut:
         row = await self.repo.get(group_id)
@@ -82,26 +92,32 @@ class GroupService:
 
     # ----- memberships -----
 
-    async def count_group_members(self, group_id: UUID) -> int:
-        return await self.repo.count_group_members(group_id)
-
     async def list_group_members(
-        self, group_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[GroupMemberOut]:
+        self,
+        group_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[GroupMemberOut]:
         # ensure group exists for better UX
         if not await self.repo.get(group_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Group not found")
-        rows = await self.repo.list_group_members(group_id, limit=limit, offset=offset)
-        return [GroupMemberOut.model_validate(r) for r in rows]
-
-    async def count_user_groups(self, user_id: UUID) -> int:
-        return await self.repo.count_groups_for_user(user_id)
+        page = await self.repo.list_group_members(group_id, limit=limit, offset=offset, total=total)
+        return page.map(GroupMemberOut.model_validate)
 
     async def list_user_groups(
-        self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[GroupOut]:
-        rows = await self.repo.list_groups_for_user(user_id, limit=limit, offset=offset)
-        return [GroupOut.model_validate(r) for r in rows]
+        self,
+        user_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[GroupOut]:
+        page = await self.repo.list_groups_for_user(
+            user_id, limit=limit, offset=offset, total=total
+        )
+        return page.map(GroupOut.model_validate)
 
     async def add_membership(
         self, group_id: UUID, data: GroupMembershipCreate
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.like import UserLikedContent
+from app.core.pagination import OffsetPage, TotalMode
 from app.repositories.likes import LikeRepository
-from app.schemas.like import LikeOut
+from app.schemas.like import LikeOut, LikeState
 
 
 class LikeService:
@@ -15,27 +17,49 @@ class LikeService:
         self.session = session
         self.repo = LikeRepository(session)
 
-    async def count_content_likes(self, content_id: UUID) -> int:
-        return await self.repo.count_content_likes(content_id)
-
     async def list_for_content(
-        self, content_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[LikeOut]:
-        rows = await self.repo.list_for_content(content_id, limit=limit, offset=offset)
-        return [LikeOut.model_validate(r) for r in rows]
+        self,
+        content_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[LikeOut]:
+        page = await self.repo.list_for_content(content_id, limit=limit, offset=offset, total=total)
+        return page.map(LikeOut.model_validate)
+
+    async def like_states(self, user_id: UUID, content_ids: Sequence[UUID]) -> list[LikeState]:
+        """Like state per content id, in request order; unknown ids are left out."""
+        rows = await self.repo.like_states(user_id, list(dict.fromkeys(content_ids)))
+        by_id = {row.id: row for row in rows}
+        return [
+            LikeState(content_id=cid, like_count=by_id[cid].like_count, liked=by_id[cid].liked)
+            for cid in dict.fromkeys(content_ids)
+            if cid in by_id
+        ]
 
     async def like_content(self, user_id: UUID, content_id: UUID) -> LikeOut:
-        like = UserLikedContent(
-            content_id=content_id,
-            user_id=user_id,
-        )
-        await self.repo.create(like)
-        await self.session.commit()
-        await self.session.refresh(like)
-        return LikeOut.model_validate(like)
+        """Like content; liking it again is a no-op. like_count moves in the same transaction."""
+        try:
+            if await self.repo.insert(user_id=user_id, content_id=content_id):
+                await self.repo.adjust_like_count(content_id, 1)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User or content not found"
+            ) from e
+        return LikeOut(user_id=user_id, content_id=content_id)
 
     async def delete(self, user_id: UUID, content_id: UUID) -> None:
         deleted = await self.repo.delete(user_id=user_id, content_id=content_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Like not found")
+        await self.repo.adjust_like_count(content_id, -1)
+        await self.session.commit()
+
+    async def reconcile_counts(self) -> int:
+        """Recompute content.like_count from the likes table."""
+        fixed = await self.repo.reconcile_like_counts()
         await self.session.commit()
+        return fixed
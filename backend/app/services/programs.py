@@ -5,8 +5,9 @@ from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CursorPage, OffsetPage, TotalMode
 from app.models.program import Program
-from app.repositories.programs import ProgramRepository
+from app.repositories.programs import PROGRAM_ORDER, ProgramRepository
 from app.schemas.program import ProgramCreate, ProgramOut, ProgramUpdate
 
 
@@ -16,14 +17,30 @@ class ProgramService:
         self.repo = ProgramRepository(session)
 
     # workspace-scoped reads
-    async def count_programs_for_workspace(self, workspace_id: UUID) -> int:
-        return await self.repo.count_programs_for_workspace(workspace_id)
 
     async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[ProgramOut]:
-        rows = await self.repo.list_by_workspace(workspace_id, limit=limit, offset=offset)
-        return [ProgramOut.model_validate(r) for r in rows]
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[ProgramOut]:
+        page = await self.repo.list_by_workspace(
+            workspace_id, limit=limit, offset=offset, total=total
+        )
+        return page.map(ProgramOut.model_validate)
+
+    async def page_for_workspace(
+        self, workspace_id: UUID, *, limit: int = 50, cursor: str = ""
+    ) -> CursorPage[ProgramOut]:
+        page = await self.repo.list_by_workspace(
+            workspace_id,
+            limit=limit,
+            cursor=cursor,
+            total="none",
+        )
+        return PROGRAM_ORDER.cursor_page(page.map(ProgramOut.model_validate))
 
     async def get_in_workspace(self, program_id: UUID, workspace_id: UUID) -> ProgramOut:
         row = await self.repo.get_in_workspace(program_id, workspace_id)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import CursorPage
+from app.models.content import ContentType
+from app.repositories.search import SEARCH_ORDER, SearchRepository
+from app.schemas.search import SearchHit
+
+
+class SearchService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.repo = SearchRepository(session)
+
+    async def search(
+        self,
+        user_id: UUID,
+        query: str,
+        *,
+        content_types: Sequence[ContentType] = (),
+        workspace_id: UUID | None = None,
+        limit: int = 20,
+        cursor: str = "",
+    ) -> CursorPage[SearchHit]:
+        page = await self.repo.search(
+            user_id,
+            query,
+            content_types=content_types,
+            workspace_id=workspace_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        return SEARCH_ORDER.cursor_page(page.map(SearchHit.model_validate))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.api_keys import generate_api_key, split_api_key, verify_secret
+from app.models.service_key import ServiceApiKey
+from app.repositories.service_keys import ServiceApiKeyRepository
+from app.schemas.service_key import ServiceApiKeyCreate, ServiceApiKeyCreated, ServiceApiKeyOut
+from app.utils import get_current_datetime
+
+
+class ServiceApiKeyService:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+        self.repo = ServiceApiKeyRepository(session)
+
+    async def list(self) -> list[ServiceApiKeyOut]:
+        rows = await self.repo.list()
+        return [ServiceApiKeyOut.model_validate(r) for r in rows]
+
+    async def create(self, data: ServiceApiKeyCreate) -> ServiceApiKeyCreated:
+        key, prefix, key_hash = generate_api_key()
+        row = ServiceApiKey(
+            name=data.name,
+            prefix=prefix,
+            key_hash=key_hash,
+            scopes=sorted(set(data.scopes)),
+            created_at=get_current_datetime(),
+        )
+        await self.repo.create(row)
+        await self.session.commit()
+        await self.session.refresh(row)
+        return ServiceApiKeyCreated.model_validate(
+            {**ServiceApiKeyOut.model_validate(row).model_dump(), "key": key}
+        )
+
+    async def revoke(self, key_id: UUID) -> None:
+        revoked = await self.repo.revoke(key_id, get_current_datetime())
+        if not revoked:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="API key not found")
+        await self.session.commit()
+
+    async def authenticate(self, key: str) -> ServiceApiKey | None:
+        """Return the active key row matching ``key``, or None."""
+        parts = split_api_key(key)
+        if parts is None:
+            return None
+        prefix, secret = parts
+        row = await self.repo.get_active_by_prefix(prefix)
+        if row is None or not verify_secret(secret, row.key_hash):
+            return None
+        return row
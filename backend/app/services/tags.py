@@ -6,13 +6,16 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CursorPage, OffsetPage, SearchOrder, TotalMode
+from app.core.tag_dictionary import tag_dictionary
 from app.models.tag import Tag
-from app.repositories.tags import TagRepository
+from app.repositories.tags import TAG_ORDER, TAGGED_CONTENT_ORDER, TagRepository
 from app.schemas.content import ContentOut
 from app.schemas.tag import (
     ContentTagOut,
     TagCreate,
     TagOut,
+    TagSuggestion,
     TagUpdate,
 )
 
@@ -24,12 +27,42 @@ class TagService:
 
     # ----- tags -----
 
-    async def count(self, *, q: str | None) -> int:
-        return await self.repo.count(q=q)
+    async def list(
+        self,
+        *,
+        q: str | None,
+        sort: SearchOrder = "name",
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[TagOut]:
+        if sort == "similarity" and not q:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="sort=similarity requires q"
+            )
+        page = await self.repo.list(q=q, sort=sort, limit=limit, offset=offset, total=total)
+        return page.map(TagOut.model_validate)
 
-    async def list(self, *, q: str | None, limit: int = 50, offset: int = 0) -> list[TagOut]:
-        rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [TagOut.model_validate(r) for r in rows]
+    async def page(
+        self, *, q: str | None, sort: SearchOrder = "name", limit: int = 50, cursor: str = ""
+    ) -> CursorPage[TagOut]:
+        if sort != "name":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination only supports sort=name",
+            )
+        page = await self.repo.list(
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            total="none",
+        )
+        return TAG_ORDER.cursor_page(page.map(TagOut.model_validate))
+
+    async def suggest(self, q: str, *, limit: int = 10) -> list[TagSuggestion]:
+        """Typeahead from the in-memory tag dictionary; no query once it is loaded."""
+        await tag_dictionary.ensure_loaded(self.repo.usage_counts)
+        return [TagSuggestion.model_validate(e) for e in tag_dictionary.suggest(q, limit)]
 
     async def get(self, tag_id: UUID) -> TagOut:
         row = await self.repo.get(tag_id)
@@ -41,6 +74,7 @@ class TagService:
         tag = Tag(**data.model_dump())
         try:
             await self.repo.create(tag)
+            await self.repo.notify_changed()
             await self.session.commit()
         except IntegrityError as e:
             await self.session.rollback()
@@ -48,6 +82,7 @@ class TagService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Tag with this name already exists",
             ) from e
+        tag_dictionary.invalidate()
         await self.session.refresh(tag)
         return TagOut.model_validate(tag)
 
@@ -59,6 +94,7 @@ class TagService:
         for k, v in patch.items():
             setattr(tag, k, v)
         try:
+            await self.repo.notify_changed()
             await self.session.commit()
         except IntegrityError:
             await self.session.rollback()
@@ -66,6 +102,7 @@ class TagService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Tag update violates constraints",
             ) from None
+        tag_dictionary.invalidate()
         await self.session.refresh(tag)
         return TagOut.model_validate(tag)
 
@@ -74,27 +111,46 @@ class TagService:
         if not tag:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
         await self.repo.delete(tag_id)
+        await self.repo.notify_changed()
         await self.session.commit()
+        tag_dictionary.invalidate()
 
     # ----- associations -----
 
-    async def count_content_tags(self, content_id: UUID) -> int:
-        return await self.repo.count_content_tags(content_id)
-
     async def list_content_tags(
-        self, content_id: UUID, *, limit: int = 100, offset: int = 0
-    ) -> list[TagOut]:
-        rows = await self.repo.list_content_tags(content_id, limit=limit, offset=offset)
-        return [TagOut.model_validate(r) for r in rows]
-
-    async def count_tagged_content(self, tag_id: UUID) -> int:
-        return await self.repo.count_tagged_content(tag_id)
+        self,
+        content_id: UUID,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[TagOut]:
+        page = await self.repo.list_content_tags(
+            content_id, limit=limit, offset=offset, total=total
+        )
+        return page.map(TagOut.model_validate)
 
     async def list_tagged_content(
-        self, tag_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[ContentOut]:
-        rows = await self.repo.list_tagged_content(tag_id, limit=limit, offset=offset)
-        return [ContentOut.model_validate(r) for r in rows]
+        self,
+        tag_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[ContentOut]:
+        page = await self.repo.list_tagged_content(tag_id, limit=limit, offset=offset, total=total)
+        return page.map(ContentOut.model_validate)
+
+    async def page_tagged_content(
+        self, tag_id: UUID, *, limit: int = 50, cursor: str = ""
+    ) -> CursorPage[ContentOut]:
+        page = await self.repo.list_tagged_content(
+            tag_id,
+            limit=limit,
+            cursor=cursor,
+            total="none",
+        )
+        return TAGGED_CONTENT_ORDER.cursor_page(page.map(ContentOut.model_validate))
 
     async def add_content_tag(self, content_id: UUID, tag_id: UUID) -> tuple[bool, ContentTagOut]:
         try:
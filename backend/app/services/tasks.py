@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import OffsetPage, TotalMode
+from app.models.base import Loaded
 from app.models.task import Task
+from app.repositories.events import EventRepository
+from app.repositories.programs import ProgramRepository
 from app.repositories.tasks import TaskRepository
-from app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from app.schemas.task import (
+    PackingListItem,
+    TaskCreate,
+    TaskFilter,
+    TaskInclude,
+    TaskListItem,
+    TaskOut,
+    TaskUpdate,
+)
 
 
 class TaskService:
@@ -15,20 +28,53 @@ class TaskService:
         self.session = session
         self.repo = TaskRepository(session)
 
-    async def count_tasks_for_event(self, event_id: UUID) -> int:
-        return await self.repo.count_tasks_for_event(event_id)
-
     async def list_for_event(
-        self, event_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[TaskOut]:
-        rows = await self.repo.list_for_event(event_id, limit=limit, offset=offset)
-        return [TaskOut.model_validate(r) for r in rows]
+        self,
+        event_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[TaskInclude] = (),
+    ) -> OffsetPage[TaskListItem]:
+        page = await self.repo.list_for_event(
+            event_id, limit=limit, offset=offset, total=total, include=include
+        )
+        return page.map(_list_item)
+
+    async def query(
+        self,
+        filters: TaskFilter,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[TaskInclude] = (),
+    ) -> OffsetPage[TaskListItem]:
+        page = await self.repo.query(
+            filters, limit=limit, offset=offset, total=total, include=include
+        )
+        return page.map(_list_item)
+
+    async def packing_list_for_event(self, event_id: UUID) -> list[PackingListItem]:
+        rows = await self.repo.packing_list(event_id=event_id)
+        # Only an empty list needs the extra lookup to tell "nothing to pack" from 404
+        if not rows and not await EventRepository(self.session).exists(event_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+        return [PackingListItem.model_validate(row._mapping) for row in rows]
+
+    async def packing_list_for_program(self, program_id: UUID) -> list[PackingListItem]:
+        rows = await self.repo.packing_list(program_id=program_id)
+        if not rows and not await ProgramRepository(self.session).exists(program_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
+        return [PackingListItem.model_validate(row._mapping) for row in rows]
 
     async def create_under_event(self, event_id: UUID, data: TaskCreate) -> TaskOut:
         task = Task(event_id=event_id, **data.model_dump())
         await self.repo.create(task)
         await self.session.commit()
-        await self.session.refresh(task)
+        # TaskOut reads author and tags, which an AsyncSession cannot lazy-load
+        await self.repo.refresh(task, "author", "content_tags")
         return TaskOut.model_validate(task)
 
     async def get(self, task_id: UUID) -> TaskOut:
@@ -51,7 +97,7 @@ class TaskService:
         for k, v in patch.items():
             setattr(row, k, v)
         await self.session.commit()
-        await self.session.refresh(row)
+        await self.repo.refresh(row)
         return TaskOut.model_validate(row)
 
     async def delete(self, task_id: UUID) -> None:
@@ -59,3 +105,8 @@ class TaskService:
         if deleted == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
         await self.session.commit()
+
+
+def _list_item(task: Task) -> TaskListItem:
+    # Deferred columns that were not asked for stay unset and out of the response
+    return TaskListItem.model_validate(Loaded(task))
@@ -6,6 +6,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import OffsetPage, TotalMode
 from app.models.troop import Troop
 from app.repositories.troops import TroopRepository
 from app.schemas.event import EventOut
@@ -23,14 +24,19 @@ class TroopService:
         self.repo = TroopRepository(session)
 
     # ----- troops -----
-    async def count_troops_for_workspace(self, workspace_id: UUID) -> int:
-        return await self.repo.count_troops_for_workspace(workspace_id)
 
     async def list_for_workspace(
-        self, workspace_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[TroopOut]:
-        rows = await self.repo.list_for_workspace(workspace_id, limit=limit, offset=offset)
-        return [TroopOut.model_validate(r) for r in rows]
+        self,
+        workspace_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[TroopOut]:
+        page = await self.repo.list_for_workspace(
+            workspace_id, limit=limit, offset=offset, total=total
+        )
+        return page.map(TroopOut.model_validate)
 
     async def create_under_workspace(self, workspace_id: UUID, data: TroopCreate) -> TroopOut:
         troop = Troop(
@@ -67,23 +73,27 @@ class TroopService:
 
     # ----- participations -----
 
-    async def count_event_troops(self, event_id: UUID) -> int:
-        return await self.repo.count_event_troops(event_id)
-
     async def list_event_troops(
-        self, event_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[TroopOut]:
-        rows = await self.repo.list_event_troops(event_id, limit=limit, offset=offset)
-        return [TroopOut.model_validate(r) for r in rows]
-
-    async def count_troop_events(self, troop_id: UUID) -> int:
-        return await self.repo.count_troop_events(troop_id)
+        self,
+        event_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[TroopOut]:
+        page = await self.repo.list_event_troops(event_id, limit=limit, offset=offset, total=total)
+        return page.map(TroopOut.model_validate)
 
     async def list_troop_events(
-        self, troop_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[EventOut]:
-        rows = await self.repo.list_troop_events(troop_id, limit=limit, offset=offset)
-        return [EventOut.model_validate(r) for r in rows]
+        self,
+        troop_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+    ) -> OffsetPage[EventOut]:
+        page = await self.repo.list_troop_events(troop_id, limit=limit, offset=offset, total=total)
+        return page.map(EventOut.model_validate)
 
     async def add_participation(
         self, event_id: UUID, troop_id: UUID
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.identity_cache import identity_cache
+from app.core.pagination import OffsetPage, SearchOrder, TotalMode
+from app.models.base import Loaded
 from app.models.user import User
 from app.repositories.users import UserRepository
-from app.schemas.user import UserCreate, UserOut, UserUpdate
+from app.schemas.user import UserCreate, UserInclude, UserListItem, UserOut, UserUpdate
 
 
 class UserService:
@@ -34,12 +38,24 @@ class UserService:
         """
         return await self.repo.get_by_auth0_id(auth0_id)
 
-    async def count(self, *, q: str | None) -> int:
-        return await self.repo.count(q=q)
-
-    async def list(self, *, q: str | None, limit: int = 50, offset: int = 0) -> list[UserOut]:
-        rows = await self.repo.list(q=q, limit=limit, offset=offset)
-        return [UserOut.model_validate(r) for r in rows]
+    async def list(
+        self,
+        *,
+        q: str | None,
+        sort: SearchOrder = "name",
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[UserInclude] = (),
+    ) -> OffsetPage[UserListItem]:
+        if sort == "similarity" and not q:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="sort=similarity requires q"
+            )
+        page = await self.repo.list(
+            q=q, sort=sort, limit=limit, offset=offset, total=total, include=include
+        )
+        return page.map(lambda row: UserListItem.model_validate(Loaded(row)))
 
     async def create(self, data: UserCreate) -> UserOut:
         user = User(**data.model_dump())
@@ -53,14 +69,38 @@ class UserService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="User with this email or auth0_id already exists",
             ) from e
-        await self.session.refresh(user)
+        await self.repo.refresh(user)
         return UserOut.model_validate(user)
 
+    async def provision(self, data: UserCreate) -> User:
+        """
+        Get or create the user for an authenticated Auth0 identity (first login).
+
+        Safe to call concurrently for the same auth0_id.
+
+        Returns:
+            User model instance
+        """
+        try:
+            user = await self.repo.upsert_by_auth0_id(
+                auth0_id=data.auth0_id, email=data.email, name=data.name
+            )
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            # Email already used by a user with a different auth0_id
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email or auth0_id already exists",
+            ) from e
+        return user
+
     async def update(self, user_id: UUID, data: UserUpdate) -> UserOut:
         row = await self.repo.get(user_id)
         if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
+        previous_auth0_id = row.auth0_id
         patch = data.model_dump(exclude_unset=True)
         for k, v in patch.items():
             setattr(row, k, v)
@@ -73,7 +113,8 @@ class UserService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="User with this email or auth0_id already exists",
             ) from None
-        await self.session.refresh(row)
+        await identity_cache.invalidate(previous_auth0_id, row.auth0_id)
+        await self.repo.refresh(row)
         return UserOut.model_validate(row)
 
     async def delete(self, user_id: UUID) -> None:
@@ -82,3 +123,4 @@ class UserService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         await self.repo.delete(user_id)
         await self.session.commit()
+        await identity_cache.invalidate(row.auth0_id)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import OffsetPage, TotalMode
+from app.models.base import Loaded
 from app.models.workspace import Workspace
 from app.repositories.workspaces import WorkspaceRepository
-from app.schemas.workspace import WorkspaceCreate, WorkspaceOut, WorkspaceUpdate
+from app.schemas.workspace import (
+    WorkspaceCreate,
+    WorkspaceInclude,
+    WorkspaceListItem,
+    WorkspaceOut,
+    WorkspaceUpdate,
+)
 
 
 class WorkspaceService:
@@ -21,20 +30,25 @@ class WorkspaceService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workspace not found")
         return WorkspaceOut.model_validate(ws)
 
-    async def count_user_workspaces(self, user_id: UUID) -> int:
-        return await self.repo.count_user_workspaces(user_id)
-
     async def list_user_workspaces(
-        self, user_id: UUID, *, limit: int = 50, offset: int = 0
-    ) -> list[WorkspaceOut]:
-        rows = await self.repo.list_user_workspaces(user_id, limit=limit, offset=offset)
-        return [WorkspaceOut.model_validate(r) for r in rows]
+        self,
+        user_id: UUID,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        total: TotalMode = "exact",
+        include: Collection[WorkspaceInclude] = (),
+    ) -> OffsetPage[WorkspaceListItem]:
+        page = await self.repo.list_user_workspaces(
+            user_id, limit=limit, offset=offset, total=total, include=include
+        )
+        return page.map(lambda ws: WorkspaceListItem.model_validate(Loaded(ws)))
 
     async def create_user_workspace(self, user_id: UUID, data: WorkspaceCreate) -> WorkspaceOut:
         ws = Workspace(**data.model_dump())
         await self.repo.create_user_workspace(user_id, ws)
         await self.session.commit()
-        await self.session.refresh(ws)
+        await self.repo.refresh(ws)
         return WorkspaceOut.model_validate(ws)
 
     async def update(self, workspace_id: UUID, data: WorkspaceUpdate) -> WorkspaceOut:
@@ -46,7 +60,7 @@ class WorkspaceService:
         for k, v in patch.items():
             setattr(ws, k, v)
         await self.session.commit()
-        await self.session.refresh(ws)
+        await self.repo.refresh(ws)
         return WorkspaceOut.model_validate(ws)
 
     async def delete(self, workspace_id: UUID) -> None:
@@ -16,8 +16,25 @@ class Settings(BaseSettings):
     db_host: str = Field(..., alias="DB_HOST")
     logger_level: str = Field("INFO", alias="LOGGER_LEVEL")
     logger_file: str | None = Field(None, alias="LOGGER_FILE")
+    sql_repeat_warn_threshold: int = Field(10, alias="SQL_REPEAT_WARN_THRESHOLD")
     db_url: str = ""
 
+    # Connection pool (per worker process)
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    db_pool_use_lifo: bool = Field(False, alias="DB_POOL_USE_LIFO")
+    db_pool_warmup: int = Field(2, alias="DB_POOL_WARMUP")
+    db_concurrent_count: bool = Field(True, alias="DB_CONCURRENT_COUNT")
+
+    # Optional read replica (same database name and credentials as the primary)
+    db_replica_host: str | None = Field(None, alias="DB_REPLICA_HOST")
+    db_replica_port: str | None = Field(None, alias="DB_REPLICA_PORT")
+    db_replica_pin_seconds: float = Field(5.0, alias="DB_REPLICA_PIN_SECONDS")
+    db_replica_url: str = ""
+
     # Test database configuration
     test_db_name: str = Field(..., alias="TEST_DB_NAME")
     test_db_user: str = Field(..., alias="TEST_DB_USER")
@@ -30,13 +47,39 @@ class Settings(BaseSettings):
     auth0_domain: str = Field(..., alias="AUTH0_DOMAIN")
     auth0_audience: str = Field(..., alias="AUTH0_AUDIENCE")
     auth0_algorithms: list[str] = Field(["RS256"], alias="AUTH0_ALGORITHMS")
+    auth0_base_url: str = Field("", alias="AUTH0_BASE_URL")
+    auth0_http_timeout: float = Field(5.0, alias="AUTH0_HTTP_TIMEOUT")
+    auth0_jwks_ttl: int = Field(3600, alias="AUTH0_JWKS_TTL")
+    auth0_jwks_min_refresh_interval: int = Field(30, alias="AUTH0_JWKS_MIN_REFRESH_INTERVAL")
+    auth0_token_cache_size: int = Field(4096, alias="AUTH0_TOKEN_CACHE_SIZE")
+    auth0_userinfo_cache_ttl: int = Field(3600, alias="AUTH0_USERINFO_CACHE_TTL")
+    auth0_userinfo_cache_size: int = Field(4096, alias="AUTH0_USERINFO_CACHE_SIZE")
+
+    # Service API keys for machine clients
+    service_key_pepper: str = Field("", alias="SERVICE_KEY_PEPPER")
+    service_key_cache_ttl: int = Field(60, alias="SERVICE_KEY_CACHE_TTL")
+
+    # Identity cache (auth0_id -> user) configuration
+    identity_cache_ttl: int = Field(300, alias="IDENTITY_CACHE_TTL")
+    identity_cache_size: int = Field(10000, alias="IDENTITY_CACHE_SIZE")
+    identity_cache_redis_url: str | None = Field(None, alias="IDENTITY_CACHE_REDIS_URL")
+
+    # In-memory tag dictionary used for typeahead (seconds between usage-count reloads)
+    tag_dictionary_ttl: int = Field(300, alias="TAG_DICTIONARY_TTL")
 
     def model_post_init(self, __context):
         # Production database URL
         self.db_url = f"postgresql+psycopg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+        # Read replica URL; empty when reads should go to the primary
+        if self.db_replica_host:
+            self.db_replica_url = f"postgresql+psycopg://{self.db_user}:{self.db_password}@{self.db_replica_host}:{self.db_replica_port or self.db_port}/{self.db_name}"
+
         # Test database URL
         self.test_db_url = f"postgresql+psycopg://{self.test_db_user}:{self.test_db_password}@{self.test_db_host}:{self.test_db_port}/{self.test_db_name}"
 
+        # Auth0 endpoints (JWKS, userinfo); override to point at a local stub
+        self.auth0_base_url = (self.auth0_base_url or f"https://{self.auth0_domain}").rstrip("/")
+
 
 settings: Settings = Settings()  # type: ignore[call-arg]
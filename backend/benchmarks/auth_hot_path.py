@@ -0,0 +1,226 @@
+"""
+Benchmark for the authentication hot path (verify_auth0_token + get_current_user).
+
+Runs GET /users/me in-process against the FastAPI app, with Auth0 replaced by
+tests/auth0_stub.py (local RSA keys, fake JWKS and userinfo) and the database
+pointed at the *test* database. No Auth0 tenant or network access is needed.
+
+Scenarios:
+- cold:     token, identity and JWKS caches are cleared before every request,
+            so each request pays JWKS lookup, RS256 verification and a user query
+- warm:     every request reuses already verified tokens for known users
+- rotation: Auth0 rotates its signing key halfway through; requests signed with
+            the new kid force a JWKS refetch
+
+Usage (from backend/):
+    PYTHONPATH=. uv run python -m benchmarks.auth_hot_path --requests 2000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app import models as m
+from app.core import auth
+from app.core.auth import JWKSProvider, UserInfoClient
+from app.core.cache import TTLCache
+from app.core.db import get_session
+from app.core.identity_cache import IdentityCache, MemoryIdentityBackend
+from app.main import create_app
+from app.settings import settings
+from tests.auth0_stub import Auth0Stub
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    errors: int
+    elapsed: float
+    latencies_ms: list[float]
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def row(self) -> str:
+        return (
+            f"{self.scenario:<10} {self.requests:>8} {self.errors:>7} "
+            f"{self.percentile(50):>9.2f} {self.percentile(99):>9.2f} "
+            f"{statistics.fmean(self.latencies_ms) if self.latencies_ms else 0.0:>9.2f} "
+            f"{self.rps:>10.1f}"
+        )
+
+
+HEADER = (
+    f"{'scenario':<10} {'requests':>8} {'errors':>7} "
+    f"{'p50 ms':>9} {'p99 ms':>9} {'mean ms':>9} {'req/s':>10}"
+)
+
+
+class Harness:
+    def __init__(self, *, users: int, stub_latency: float) -> None:
+        self.stub = Auth0Stub(latency=stub_latency)
+        self.users = [f"auth0|bench-{i}" for i in range(users)]
+        self.engine = create_async_engine(settings.test_db_url, pool_pre_ping=True)
+        self.maker = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.app = create_app()
+        self.app.dependency_overrides[get_session] = self._session
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app), base_url="http://bench"
+        )
+        self.reset_caches()
+
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        async with self.maker() as session:
+            yield session
+
+    def reset_caches(self) -> None:
+        stub_client = self.stub.client()
+        auth.jwks_provider = JWKSProvider(
+            self.stub.url("/.well-known/jwks.json"),
+            ttl=settings.auth0_jwks_ttl,
+            min_refresh_interval=0,
+            client=stub_client,
+        )
+        auth.userinfo_client = UserInfoClient(
+            self.stub.url("/userinfo"),
+            ttl=settings.auth0_userinfo_cache_ttl,
+            maxsize=settings.auth0_userinfo_cache_size,
+            client=stub_client,
+        )
+        auth.token_cache = TTLCache(maxsize=settings.auth0_token_cache_size)
+        auth.identity_cache = IdentityCache(
+            MemoryIdentityBackend(
+                maxsize=settings.identity_cache_size, ttl=settings.identity_cache_ttl
+            )
+        )
+
+    def token_for(self, i: int) -> str:
+        sub = self.users[i % len(self.users)]
+        return self.stub.mint(sub, email=f"{sub.split('|')[1]}@bench.example", name=sub)
+
+    async def setup(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(m.Base.metadata.create_all)
+        # Provision every benchmark user once so scenarios measure steady state
+        await self.run("setup", len(self.users), 8, self.token_for)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        await self.engine.dispose()
+
+    async def run(
+        self,
+        scenario: str,
+        requests: int,
+        concurrency: int,
+        token: Callable[[int], str],
+        before_each: Callable[[int], Awaitable[None] | None] | None = None,
+    ) -> Result:
+        latencies: list[float] = []
+        errors = 0
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                if before_each is not None:
+                    maybe = before_each(i)
+                    if maybe is not None:
+                        await maybe
+                headers = {"Authorization": f"Bearer {token(i)}"}
+                start = time.perf_counter()
+                response = await self.client.get("/users/me", headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        return Result(scenario, requests, errors, time.perf_counter() - started, latencies)
+
+
+async def main(args: argparse.Namespace) -> None:
+    harness = Harness(users=args.users, stub_latency=args.stub_latency_ms / 1000)
+    await harness.setup()
+    try:
+        # Pre-mint tokens so signing cost is not part of the measurement
+        tokens = [harness.token_for(i) for i in range(args.requests)]
+        warm_tokens = [harness.token_for(i) for i in range(args.users)]
+
+        results = []
+        results.append(
+            await harness.run(
+                "cold",
+                args.requests,
+                args.concurrency,
+                lambda i: tokens[i],
+                before_each=lambda _: harness.reset_caches(),
+            )
+        )
+
+        harness.reset_caches()
+        await harness.run("prime", len(warm_tokens), args.concurrency, lambda i: warm_tokens[i])
+        results.append(
+            await harness.run(
+                "warm",
+                args.requests,
+                args.concurrency,
+                lambda i: warm_tokens[i % len(warm_tokens)],
+            )
+        )
+
+        harness.stub.rotate_key("rotated", keep_old=False)
+        rotated_tokens = [harness.token_for(i) for i in range(args.requests)]
+        results.append(
+            await harness.run(
+                "rotation",
+                args.requests,
+                args.concurrency,
+                lambda i: rotated_tokens[i] if i >= args.requests // 2 else warm_tokens[0],
+            )
+        )
+    finally:
+        await harness.close()
+
+    print(
+        f"\n/users/me  requests={args.requests} concurrency={args.concurrency} "
+        f"users={args.users} jwks_fetches={harness.stub.calls['jwks']}\n"
+    )
+    print(HEADER)
+    for result in results:
+        print(result.row())
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument(
+        "--stub-latency-ms", type=float, default=0.0, help="Simulated Auth0 response latency"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main(args))
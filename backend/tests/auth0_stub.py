@@ -0,0 +1,136 @@
+"""
+In-process stand-in for an Auth0 tenant.
+
+Auth0Stub signs tokens with locally generated RSA keys and serves the two
+endpoints the backend calls, ``/.well-known/jwks.json`` and ``/userinfo``, from
+a small FastAPI app. ``client()`` returns an httpx.AsyncClient wired to that app,
+and ``serve()`` runs it on a local port for use with AUTH0_BASE_URL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import uvicorn
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Header, HTTPException
+from jose import jwk, jwt
+
+from app.settings import settings
+
+BASE_URL = "https://auth0-stub.local"
+
+
+class Auth0Stub:
+    def __init__(self, *, kid: str = "local", latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.userinfo: dict[str, dict[str, Any]] = {}
+        self._private_keys: dict[str, str] = {}
+        self._public_jwks: dict[str, dict[str, Any]] = {}
+        self.active_kid = ""
+        self.rotate_key(kid)
+        self.app = self._build_app()
+
+    # ----- keys & tokens -----
+
+    def rotate_key(self, kid: str, *, keep_old: bool = True) -> None:
+        """Generate a new signing key and make it the one used by ``mint``."""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+        public = jwk.construct(
+            private_key.public_key().public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            ),
+            "RS256",
+        ).to_dict()
+        public.update(kid=kid, use="sig")
+
+        if not keep_old:
+            self._private_keys.clear()
+            self._public_jwks.clear()
+        self._private_keys[kid] = pem
+        self._public_jwks[kid] = public
+        self.active_kid = kid
+
+    def mint(self, sub: str = "auth0|stub-user", *, ttl: int = 3600, **claims: Any) -> str:
+        """Return an RS256 token with the claims the backend expects from Auth0."""
+        now = int(time.time())
+        payload = {
+            "sub": sub,
+            "aud": settings.auth0_audience,
+            "iss": f"https://{settings.auth0_domain}/",
+            "iat": now,
+            "exp": now + ttl,
+            "scope": "openid profile email",
+            **claims,
+        }
+        return jwt.encode(
+            payload,
+            self._private_keys[self.active_kid],
+            algorithm="RS256",
+            headers={"kid": self.active_kid},
+        )
+
+    # ----- HTTP -----
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/.well-known/jwks.json")
+        async def jwks():
+            self.calls["jwks"] += 1
+            await self._delay()
+            return {"keys": list(self._public_jwks.values())}
+
+        @app.get("/userinfo")
+        async def userinfo(authorization: str = Header("")):
+            self.calls["userinfo"] += 1
+            await self._delay()
+            token = authorization.removeprefix("Bearer ").strip()
+            try:
+                sub = jwt.get_unverified_claims(token)["sub"]
+            except Exception as e:
+                raise HTTPException(status_code=401, detail="Invalid token") from e
+            if sub not in self.userinfo:
+                raise HTTPException(status_code=401, detail="Unknown user")
+            return {"sub": sub, **self.userinfo[sub]}
+
+        return app
+
+    async def _delay(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app), base_url=BASE_URL)
+
+    def url(self, path: str) -> str:
+        return f"{BASE_URL}{path}"
+
+    @contextlib.contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """Run the stub on a real local port; yields its base URL."""
+        server = uvicorn.Server(uvicorn.Config(self.app, host=host, port=port, log_level="warning"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+        bound_port = server.servers[0].sockets[0].getsockname()[1]
+        try:
+            yield f"http://{host}:{bound_port}"
+        finally:
+            server.should_exit = True
+            thread.join()
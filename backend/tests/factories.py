@@ -0,0 +1,130 @@
+"""
+Helpers that insert minimal valid rows for integration tests.
+
+Every helper flushes so the returned object has its primary key; callers decide
+when to commit.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models as m
+from app.models.workspace import WorkspaceMembership, WorkspaceRole
+from app.utils import get_current_datetime
+
+
+async def make_user(session: AsyncSession, **fields) -> m.User:
+    suffix = uuid4().hex[:8]
+    user = m.User(
+        **{
+            "name": f"User {suffix}",
+            "auth0_id": f"auth0|{suffix}",
+            "email": f"{suffix}@example.com",
+            **fields,
+        }
+    )
+    session.add(user)
+    await session.flush()
+    return user
+
+
+async def make_workspace(session: AsyncSession, **fields) -> m.Workspace:
+    workspace = m.Workspace(
+        **{
+            "name": f"Workspace {uuid4().hex[:8]}",
+            "default_meeting_weekday": m.Weekday.monday,
+            "default_start_time": dt.time(20, 0),
+            "default_end_time": dt.time(21, 0),
+            "default_interval": m.EventInterval.weekly,
+            "season_start": dt.date.today(),
+            **fields,
+        }
+    )
+    session.add(workspace)
+    await session.flush()
+    return workspace
+
+
+async def make_workspace_membership(
+    session: AsyncSession, user: m.User, workspace: m.Workspace, **fields
+) -> WorkspaceMembership:
+    membership = WorkspaceMembership(
+        **{
+            "workspace_id": workspace.id,
+            "user_id": user.id,
+            "role": WorkspaceRole.viewer,
+            **fields,
+        }
+    )
+    session.add(membership)
+    await session.flush()
+    return membership
+
+
+def _content_fields(author: m.User, fields: dict) -> dict:
+    return {
+        "name": f"Content {uuid4().hex[:8]}",
+        "like_count": 0,
+        "created_at": get_current_datetime(),
+        "author_id": author.id,
+        **fields,
+    }
+
+
+async def make_program(
+    session: AsyncSession, author: m.User, workspace: m.Workspace, **fields
+) -> m.Program:
+    program = m.Program(**_content_fields(author, {"workspace_id": workspace.id, **fields}))
+    session.add(program)
+    await session.flush()
+    return program
+
+
+async def make_event(
+    session: AsyncSession, author: m.User, workspace: m.Workspace, **fields
+) -> m.Event:
+    event = m.Event(
+        **_content_fields(
+            author,
+            {"workspace_id": workspace.id, "start_dt": get_current_datetime(), **fields},
+        )
+    )
+    session.add(event)
+    await session.flush()
+    return event
+
+
+async def make_task(session: AsyncSession, author: m.User, event: m.Event, **fields) -> m.Task:
+    task = m.Task(**_content_fields(author, {"event_id": event.id, **fields}))
+    session.add(task)
+    await session.flush()
+    return task
+
+
+async def make_tag(session: AsyncSession, **fields) -> m.Tag:
+    tag = m.Tag(**{"name": f"tag-{uuid4().hex[:8]}", **fields})
+    session.add(tag)
+    await session.flush()
+    return tag
+
+
+async def make_comment(
+    session: AsyncSession, user: m.User, content: m.Content, **fields
+) -> m.Comment:
+    comment = m.Comment(
+        **{
+            "body": "Nice",
+            "created_at": get_current_datetime(),
+            "user_id": user.id,
+            "content_id": content.id,
+            **fields,
+        }
+    )
+    content.comment_count += 1
+    session.add(comment)
+    await session.flush()
+    return comment
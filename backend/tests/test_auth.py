@@ -0,0 +1,379 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import models as m
+from app.core import auth
+from app.core.auth import JWKSProvider, UserInfoClient
+from app.core.cache import TTLCache
+from app.core.db import get_session
+from app.core.identity_cache import IdentityCache, MemoryIdentityBackend
+from app.main import create_app
+from app.schemas.email_list import EmailListCreate
+from app.schemas.service_key import ServiceApiKeyCreate
+from app.schemas.user import UserCreate, UserUpdate
+from app.services import users as users_service
+from app.services.email_list import EmailListService
+from app.services.service_keys import ServiceApiKeyService
+from app.services.users import UserService
+from tests.auth0_stub import Auth0Stub
+from tests.factories import make_user, make_workspace
+
+JWKS_URL = "https://tenant.example/.well-known/jwks.json"
+
+
+def _jwk(kid: str) -> dict:
+    return {"kty": "RSA", "kid": kid, "use": "sig", "n": "n-" + kid, "e": "AQAB"}
+
+
+class FakeJWKS:
+    """httpx transport serving a mutable key set and counting fetches."""
+
+    def __init__(self, *kids: str) -> None:
+        self.kids = list(kids)
+        self.calls = 0
+        self.fail = False
+        self.delay = 0.01
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"keys": [_jwk(k) for k in self.kids]})
+
+    def provider(self, *, ttl: float = 3600, min_refresh_interval: float = 0) -> JWKSProvider:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return JWKSProvider(
+            JWKS_URL, ttl=ttl, min_refresh_interval=min_refresh_interval, client=client
+        )
+
+
+async def test_jwks_fetched_once_and_cached():
+    fake = FakeJWKS("k1")
+    provider = fake.provider()
+
+    assert (await provider.get_signing_key("k1"))["n"] == "n-k1"
+    assert (await provider.get_signing_key("k1"))["kid"] == "k1"
+    assert fake.calls == 1
+
+
+async def test_jwks_concurrent_cold_misses_fetch_once():
+    fake = FakeJWKS("k1")
+    provider = fake.provider()
+
+    keys = await asyncio.gather(*(provider.get_signing_key("k1") for _ in range(20)))
+    assert all(k is not None for k in keys)
+    assert fake.calls == 1
+
+
+async def test_jwks_refreshes_after_ttl():
+    fake = FakeJWKS("k1")
+    provider = fake.provider(ttl=0)
+
+    await provider.get_signing_key("k1")
+    await provider.get_signing_key("k1")
+    await provider._refresh_task
+    assert fake.calls == 2
+
+
+async def test_jwks_stale_keys_served_while_refreshing_in_background():
+    fake = FakeJWKS("k1")
+    provider = fake.provider(ttl=0)
+    await provider.get_signing_key("k1")
+
+    # A slow Auth0 must not hold up requests once keys are cached
+    fake.delay = 0.5
+    fake.kids = ["k1", "k2"]
+    keys = await asyncio.wait_for(
+        asyncio.gather(*(provider.get_signing_key("k1") for _ in range(10))), timeout=0.1
+    )
+    assert all(k is not None for k in keys)
+    assert "k2" not in provider._keys
+
+    await provider._refresh_task
+    assert fake.calls == 2
+    assert "k2" in provider._keys
+
+
+async def test_jwks_unknown_kid_forces_single_refetch():
+    fake = FakeJWKS("k1")
+    provider = fake.provider(min_refresh_interval=0.05)
+    await provider.get_signing_key("k1")
+
+    # Auth0 rotates keys: the new kid is picked up by one forced refetch
+    fake.kids = ["k2"]
+    await asyncio.sleep(0.06)
+    assert await provider.get_signing_key("k2") is not None
+    assert fake.calls == 2
+
+    # Unknown kids are not allowed to trigger a fetch on every request
+    assert await provider.get_signing_key("bogus") is None
+    assert fake.calls == 2
+
+
+async def test_jwks_serves_last_known_good_when_auth0_down():
+    fake = FakeJWKS("k1")
+    provider = fake.provider(ttl=0)
+    await provider.get_signing_key("k1")
+
+    fake.fail = True
+    assert await provider.get_signing_key("k1") is not None
+    await provider._refresh_task
+    assert fake.calls == 2 and await provider.get_signing_key("k1") is not None
+
+
+async def test_jwks_unavailable_without_cached_keys():
+    fake = FakeJWKS("k1")
+    fake.fail = True
+    provider = fake.provider()
+
+    with pytest.raises(HTTPException) as exc:
+        await provider.get_signing_key("k1")
+    assert exc.value.status_code == 503
+
+
+# ----- verified-token cache -----
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("old", 4, expires_at=time.time() - 1)
+    assert cache.get("old") is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.fixture
+def auth0(monkeypatch) -> Auth0Stub:
+    """Auth0 stub wired into the module-level JWKS provider and userinfo client."""
+    stub = Auth0Stub()
+    client = stub.client()
+    monkeypatch.setattr(
+        auth,
+        "jwks_provider",
+        JWKSProvider(
+            stub.url("/.well-known/jwks.json"), ttl=3600, min_refresh_interval=0, client=client
+        ),
+    )
+    monkeypatch.setattr(
+        auth,
+        "userinfo_client",
+        UserInfoClient(stub.url("/userinfo"), ttl=3600, maxsize=16, client=client),
+    )
+    monkeypatch.setattr(auth, "token_cache", TTLCache(maxsize=16))
+    return stub
+
+
+async def test_verified_token_is_served_from_cache(auth0, monkeypatch):
+    token = auth0.mint()
+    decode_calls = 0
+    real_decode = auth.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        nonlocal decode_calls
+        decode_calls += 1
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+
+    first = await auth.verify_auth0_token(token)
+    second = await auth.verify_auth0_token(token)
+    assert first == second
+    assert first["sub"] == "auth0|stub-user"
+    assert decode_calls == 1
+    assert auth.token_cache.hits == 1
+
+
+async def test_invalid_token_is_not_cached(auth0):
+    token = auth0.mint(aud="someone-else")
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            await auth.verify_auth0_token(token)
+        assert exc.value.status_code == 401
+    assert len(auth.token_cache) == 0
+
+
+# ----- identity cache -----
+
+
+async def test_identity_cache_hit_and_invalidation_on_update(session, monkeypatch):
+    cache = IdentityCache(MemoryIdentityBackend(maxsize=10, ttl=60))
+    monkeypatch.setattr(users_service, "identity_cache", cache)
+
+    user = m.User(name="Cached", auth0_id="auth0|cached", email="cached@example.com")
+    session.add(user)
+    await session.commit()
+    await cache.set(user)
+    session.expunge_all()
+
+    hit = await cache.get(session, "auth0|cached")
+    assert hit is not None
+    assert hit.id == user.id and hit.email == "cached@example.com"
+    assert hit in session
+
+    await UserService(session).update(user.id, UserUpdate(name="Renamed"))
+    assert await cache.get(session, "auth0|cached") is None
+
+
+# ----- first-login provisioning -----
+
+
+async def test_concurrent_first_login_provisions_one_user(engine):
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    data = UserCreate(auth0_id="auth0|first-login", email="First@Example.com", name="First")
+
+    async def provision():
+        async with maker() as s:
+            return await UserService(s).provision(data)
+
+    users = await asyncio.gather(*(provision() for _ in range(10)))
+    assert len({u.id for u in users}) == 1
+    assert users[0].email == "first@example.com"
+
+    async with maker() as s:
+        count = await s.scalar(
+            select(func.count()).select_from(m.User).where(m.User.auth0_id == data.auth0_id)
+        )
+    assert count == 1
+
+
+# ----- userinfo fallback -----
+
+
+async def test_userinfo_lookups_are_deduplicated_and_cached(auth0):
+    auth0.latency = 0.02
+    auth0.userinfo["auth0|no-email"] = {"email": "noemail@example.com", "name": "No Email"}
+    token = auth0.mint("auth0|no-email")
+
+    results = await asyncio.gather(
+        *(auth.userinfo_client.get("auth0|no-email", token) for _ in range(10))
+    )
+    assert all(r["email"] == "noemail@example.com" for r in results)
+    await auth.userinfo_client.get("auth0|no-email", token)
+    assert auth0.calls["userinfo"] == 1
+
+
+async def test_first_login_without_email_claim_uses_stub_server(auth0, session, monkeypatch):
+    auth0.userinfo["auth0|served"] = {"email": "served@example.com", "name": "Served"}
+    monkeypatch.setattr(
+        auth, "identity_cache", IdentityCache(MemoryIdentityBackend(maxsize=10, ttl=60))
+    )
+
+    with auth0.serve() as base_url:
+        monkeypatch.setattr(
+            auth, "userinfo_client", UserInfoClient(f"{base_url}/userinfo", ttl=60, maxsize=16)
+        )
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=auth0.mint("auth0|served")
+        )
+        user = await auth.get_current_user(credentials, session)
+        again = await auth.get_current_user(credentials, session)
+
+    assert user.email == "served@example.com" and user.name == "Served"
+    assert again.id == user.id
+    assert auth0.calls["userinfo"] == 1
+
+
+# ----- service API keys -----
+
+
+async def test_service_api_key_scopes_and_cache(session, monkeypatch):
+    monkeypatch.setattr(auth, "service_key_cache", TTLCache(maxsize=16, ttl=60))
+    created = await ServiceApiKeyService(session).create(
+        ServiceApiKeyCreate(name="export", scopes=["events:read"])
+    )
+
+    router = APIRouter()
+    principal_dep = Depends(auth.get_service_principal)
+
+    @router.get("/events", tags=["events"])
+    async def list_events(principal: auth.ServicePrincipal = principal_dep):
+        return {"name": principal.name}
+
+    @router.post("/events", tags=["events"])
+    async def create_event(principal: auth.ServicePrincipal = principal_dep):
+        return {}
+
+    @router.get("/tags", tags=["tags"])
+    async def list_tags(principal: auth.ServicePrincipal = principal_dep):
+        return []
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_session] = lambda: session
+    headers = {"X-API-Key": created.key}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        ok = await client.get("/events", headers=headers)
+        assert ok.status_code == 200 and ok.json() == {"name": "export"}
+        assert (await client.post("/events", headers=headers)).status_code == 403
+        assert (await client.get("/tags", headers=headers)).status_code == 403
+        assert (await client.get("/events")).status_code == 401
+        bad = {"X-API-Key": created.key[:-1] + ("A" if created.key[-1] != "A" else "B")}
+        assert (await client.get("/events", headers=bad)).status_code == 401
+
+        # Revocation applies once the cached principal expires
+        await ServiceApiKeyService(session).revoke(created.id)
+        assert (await client.get("/events", headers=headers)).status_code == 200
+        auth.service_key_cache.clear()
+        assert (await client.get("/events", headers=headers)).status_code == 401
+
+
+async def test_export_and_import_endpoints_accept_api_key_or_bearer(auth0, session, monkeypatch):
+    monkeypatch.setattr(auth, "service_key_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(
+        auth, "identity_cache", IdentityCache(MemoryIdentityBackend(maxsize=10, ttl=60))
+    )
+    keys = ServiceApiKeyService(session)
+    export = await keys.create(
+        ServiceApiKeyCreate(name="nightly-export", scopes=["emaillist:read"])
+    )
+    importer = await keys.create(ServiceApiKeyCreate(name="import", scopes=["events:write"]))
+    await EmailListService(session).create(EmailListCreate(email="subscriber@example.com"))
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    await session.commit()
+    session.expunge_all()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = lambda: session
+    bearer = {"Authorization": f"Bearer {auth0.mint('auth0|exporter', email='ex@example.com')}"}
+    event = {"name": "Imported hike", "author_id": str(author.id), "content_type": "event"}
+    events_url = f"/workspaces/{workspace.id}/events"
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        by_key = await client.get("/emaillist", headers={"X-API-Key": export.key})
+        by_token = await client.get("/emaillist", headers=bearer)
+        anonymous = await client.get("/emaillist")
+        imported = await client.post(events_url, headers={"X-API-Key": importer.key}, json=event)
+        created_by_user = await client.post(events_url, headers=bearer, json=event)
+        out_of_scope = await client.post(events_url, headers={"X-API-Key": export.key}, json=event)
+        unauthenticated = await client.post(events_url, json=event)
+
+    assert by_key.status_code == 200, by_key.text
+    assert "subscriber@example.com" in [e["email"] for e in by_key.json()]
+    assert by_token.status_code == 200
+    assert anonymous.status_code == 401
+    # A key imports on behalf of the author named in the payload; a user is the author
+    assert imported.status_code == 201, imported.text
+    assert imported.json()["author"]["id"] == str(author.id)
+    assert created_by_user.status_code == 201, created_by_user.text
+    assert created_by_user.json()["author"]["email"] == "ex@example.com"
+    assert out_of_scope.status_code == 403
+    assert unauthenticated.status_code == 401
@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app import models as m
+from app.core import query_stats
+from app.schemas.comment import CommentCreate
+from app.services.comments import CommentService
+from app.services.programs import ProgramService
+from tests.factories import make_program, make_user, make_workspace
+
+
+async def _comment_count(session, content_id) -> int:
+    return await session.scalar(select(m.Content.comment_count).where(m.Content.id == content_id))
+
+
+async def test_comment_count_follows_create_and_delete(session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    await session.commit()
+    svc = CommentService(session)
+
+    first = await svc.create_under_content(program.id, CommentCreate(body="One", user_id=author.id))
+    await svc.create_under_content(program.id, CommentCreate(body="Two", user_id=author.id))
+    assert await _comment_count(session, program.id) == 2
+
+    await svc.delete(first.id)
+    assert await _comment_count(session, program.id) == 1
+
+    with pytest.raises(HTTPException) as missing:
+        await svc.delete(first.id)
+    assert missing.value.status_code == 404
+    assert await _comment_count(session, program.id) == 1
+
+
+async def test_comment_on_missing_content_is_404(session):
+    author = await make_user(session)
+    await session.commit()
+    with pytest.raises(HTTPException) as exc:
+        await CommentService(session).create_under_content(
+            uuid4(), CommentCreate(body="Hello", user_id=author.id)
+        )
+    assert exc.value.status_code == 404
+
+
+async def test_reconcile_repairs_drifted_counts(session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    await session.commit()
+    svc = CommentService(session)
+    await svc.create_under_content(program.id, CommentCreate(body="One", user_id=author.id))
+    await session.execute(
+        update(m.Content).where(m.Content.id == program.id).values(comment_count=7)
+    )
+    await session.commit()
+
+    assert await svc.reconcile_counts() >= 1
+    assert await _comment_count(session, program.id) == 1
+    assert await svc.reconcile_counts() == 0
+
+
+async def test_program_list_reads_comment_count_without_loading_comments(session):
+    query_stats.install(session.bind)
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    program = await make_program(session, author, workspace)
+    await session.commit()
+    await CommentService(session).create_under_content(
+        program.id, CommentCreate(body="Hi", user_id=author.id)
+    )
+    session.expunge_all()
+
+    with query_stats.track() as stats:
+        page = await ProgramService(session).list_for_workspace(workspace.id)
+    assert [p.comment_count for p in page.items] == [1]
+    assert not any("FROM comments" in shape for shape in stats.shapes)
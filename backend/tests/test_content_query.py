@@ -0,0 +1,133 @@
+import datetime as dt
+
+import httpx
+
+from app import models as m
+from app.core import query_stats
+from app.core.db import get_read_session
+from app.main import create_app
+from app.models.content import ContentType
+from app.repositories.content import ContentRepository
+from app.schemas.content_query import ContentFilter
+from app.services.content import ContentService
+from tests.factories import make_event, make_program, make_tag, make_task, make_user, make_workspace
+
+
+async def _tag(session, content, *tags):
+    for tag in tags:
+        session.add(m.ContentTag(content_id=content.id, tag_id=tag.id))
+    await session.flush()
+
+
+async def _catalogue(session):
+    """Tagged content with known task attributes; every row carries tag ``scope``."""
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    scope, knots, fire = [await make_tag(session) for _ in range(3)]
+    program = await make_program(session, author, workspace)
+    event = await make_event(session, author, workspace)
+    short = await make_task(
+        session,
+        author,
+        event,
+        estimated_duration=10,
+        participant_min=2,
+        participant_max=6,
+        equipment={"rope": 2},
+    )
+    medium = await make_task(
+        session,
+        author,
+        event,
+        estimated_duration=45,
+        participant_min=8,
+        equipment={"rope": 1, "matches": 1},
+    )
+    long = await make_task(session, author, event, estimated_duration=150)
+    await _tag(session, program, scope, knots)
+    await _tag(session, event, scope, fire)
+    await _tag(session, short, scope, knots)
+    await _tag(session, medium, scope, knots, fire)
+    await _tag(session, long, scope)
+    await session.commit()
+    return scope, knots, fire, program, event, short, medium, long
+
+
+async def test_filters_combine(session):
+    scope, knots, fire, program, event, short, medium, long = await _catalogue(session)
+    svc = ContentService(session)
+
+    async def ids(**filters):
+        filters.setdefault("tag_id", [scope.id])
+        page, _ = await svc.list(ContentFilter(**filters))
+        return {item.id for item in page.items}
+
+    assert await ids(tag_id=[knots.id, fire.id]) == {medium.id}
+    assert await ids(tag_id=[knots.id, fire.id], tag_mode="any") == {
+        program.id,
+        event.id,
+        short.id,
+        medium.id,
+    }
+    assert await ids(content_type=[ContentType.program, ContentType.event]) == {
+        program.id,
+        event.id,
+    }
+    assert await ids(duration_min=30, duration_max=60) == {medium.id}
+    assert await ids(equipment=["rope"]) == {short.id, medium.id}
+    assert await ids(equipment=["rope", "matches"]) == {medium.id}
+    # Participant ranges overlap; missing bounds are open-ended
+    assert await ids(participants_min=7, participants_max=7) == {long.id}
+    assert await ids(participants_min=5, participants_max=8) == {short.id, medium.id, long.id}
+    assert await ids(created_to=dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc)) == set()
+
+
+async def test_facets_cover_every_match_in_one_statement(session):
+    scope, knots, fire, *_ = await _catalogue(session)
+    query_stats.install(session.bind)
+    filters = ContentFilter(tag_id=[scope.id])
+
+    with query_stats.track() as stats:
+        await ContentRepository(session).facets(filters)
+    assert stats.statements == 1
+
+    page, facets = await ContentService(session).list(filters, limit=2)
+    assert page.total == 5 and len(page.items) == 2 and page.has_more
+    assert [(f.value, f.count) for f in facets.content_type] == [
+        ("task", 3),
+        ("event", 1),
+        ("program", 1),
+    ]
+    assert {(f.name, f.count) for f in facets.tag} == {
+        (scope.name, 5),
+        (knots.name, 3),
+        (fire.name, 2),
+    }
+    assert facets.tag[0].tag_id == scope.id
+    assert [(f.value, f.count) for f in facets.duration] == [
+        ("0-15", 1),
+        ("30-60", 1),
+        ("120+", 1),
+    ]
+
+
+async def test_content_endpoint_pages_and_validates_ranges(session):
+    scope, *_ = await _catalogue(session)
+    app = create_app()
+    app.dependency_overrides[get_read_session] = lambda: session
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.get("/content", params={"tag_id": str(scope.id), "limit": 3})
+        by_cursor = await client.get(
+            "/content", params={"tag_id": str(scope.id), "limit": 3, "cursor": ""}
+        )
+        bad = await client.get("/content", params={"duration_min": 60, "duration_max": 30})
+
+    assert first.status_code == 200
+    body = first.json()
+    assert len(body["items"]) == 3 and first.headers["X-Total-Count"] == "5"
+    assert {item["content_type"] for item in body["items"]} <= {"program", "event", "task"}
+    assert sum(f["count"] for f in body["facets"]["content_type"]) == 5
+    assert by_cursor.status_code == 200 and 'rel="next"' in by_cursor.headers["Link"]
+    assert bad.status_code == 422
@@ -0,0 +1,152 @@
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+from fastapi import Request
+from sqlalchemy import exc, text
+
+from app.core import auth
+from app.core.db import (
+    PRIMARY_PIN_COOKIE,
+    InstrumentedPool,
+    dispose_engine,
+    get_engine,
+    get_read_engine,
+    get_read_session,
+    get_session_maker,
+    make_engine,
+    pool_status,
+)
+from app.main import create_app
+from app.settings import settings
+
+
+async def test_pool_status_reports_waiters_and_timeouts(pg_url):
+    engine = make_engine(pg_url, pool_size=1, max_overflow=0, pool_timeout=0.2)
+    assert isinstance(engine.pool, InstrumentedPool)
+    try:
+        async with engine.connect() as held:
+            await held.execute(text("SELECT 1"))
+            assert pool_status(engine)["checked_out"] == 1
+
+            async def blocked():
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+
+            task = asyncio.create_task(blocked())
+            await asyncio.sleep(0.05)
+            assert pool_status(engine)["waiters"] == 1
+            with pytest.raises(exc.TimeoutError):
+                await task
+
+        status = pool_status(engine)
+        assert status["waiters"] == 0
+        assert status["timeouts"] == 1
+        assert status["checkouts"] == 1
+        assert status["checked_out"] == 0
+        assert sum(status["wait_histogram"].values()) == 1
+    finally:
+        await engine.dispose()
+
+
+async def test_pool_stats_survive_dispose(pg_url):
+    engine = make_engine(pg_url, pool_size=1)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert pool_status(engine)["checkouts"] == 2
+    finally:
+        await engine.dispose()
+
+
+async def test_lifespan_warms_pool_and_disposes_on_shutdown(pg_url, monkeypatch):
+    monkeypatch.setattr(settings, "db_url", pg_url)
+    monkeypatch.setattr(settings, "db_pool_warmup", 2)
+    monkeypatch.setattr(auth, "_http_client", None)
+    await dispose_engine()
+    app = create_app()
+
+    async with app.router.lifespan_context(app):
+        engine = get_engine()
+        assert pool_status(engine)["idle"] == 2
+        assert get_session_maker() is get_session_maker()
+
+    assert engine.pool.checkedin() == 0
+    assert get_engine() is not engine
+    await dispose_engine()
+
+
+@pytest.mark.parametrize(("env", "expected"), [("development", 200), ("production", 404)])
+async def test_pool_health_endpoint_hidden_in_production(pg_url, monkeypatch, env, expected):
+    monkeypatch.setattr(settings, "db_url", pg_url)
+    monkeypatch.setattr(settings, "env", env)
+    await dispose_engine()
+    app = create_app()
+
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/healthz/pool")
+        assert response.status_code == expected
+        if expected == 200:
+            assert "checked_out" in response.json()
+    finally:
+        await dispose_engine()
+
+
+def _request(cookies: dict[str, str] | None = None) -> Request:
+    cookie = "; ".join(f"{k}={v}" for k, v in (cookies or {}).items())
+    return Request({"type": "http", "headers": [(b"cookie", cookie.encode())]})
+
+
+async def _read_bind(request: Request):
+    sessions = get_read_session(request)
+    session = await anext(sessions)
+    try:
+        return session.bind
+    finally:
+        await sessions.aclose()
+
+
+async def test_read_session_falls_back_to_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(settings, "db_replica_url", "")
+    await dispose_engine()
+    assert get_read_engine() is get_engine()
+    assert await _read_bind(_request()) is get_engine()
+    await dispose_engine()
+
+
+async def test_read_session_uses_replica_until_client_writes(pg_url, monkeypatch):
+    # Point at a second Postgres with TEST_DB_REPLICA_URL; defaults to the test database
+    replica_url = os.environ.get("TEST_DB_REPLICA_URL", pg_url)
+    monkeypatch.setattr(settings, "db_url", pg_url)
+    monkeypatch.setattr(settings, "db_replica_url", replica_url)
+    await dispose_engine()
+    app = create_app()
+
+    @app.post("/_write")
+    async def write():
+        return {}
+
+    try:
+        assert get_read_engine() is not get_engine()
+        assert await _read_bind(_request()) is get_read_engine()
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post("/_write")
+        pinned_until = response.cookies[PRIMARY_PIN_COOKIE]
+        assert float(pinned_until) > time.time()
+
+        assert await _read_bind(_request({PRIMARY_PIN_COOKIE: pinned_until})) is get_engine()
+        expired = {PRIMARY_PIN_COOKIE: f"{time.time() - 1:.3f}"}
+        assert await _read_bind(_request(expired)) is get_read_engine()
+    finally:
+        await dispose_engine()
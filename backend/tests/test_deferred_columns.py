@@ -0,0 +1,126 @@
+from uuid import uuid4
+
+import httpx
+
+from app.core import query_stats
+from app.core.db import get_read_session, get_session
+from app.main import create_app
+from app.models.content import ContentType
+from app.repositories.content import ContentRepository
+from app.schemas.content_query import ContentFilter
+from app.schemas.task import TaskUpdate
+from app.schemas.user import UserCreate
+from app.schemas.workspace import WorkspaceUpdate
+from app.services.tasks import TaskService
+from app.services.users import UserService
+from app.services.workspaces import WorkspaceService
+from tests.factories import (
+    make_event,
+    make_task,
+    make_user,
+    make_workspace,
+    make_workspace_membership,
+)
+
+
+def _selected(stats: query_stats.QueryStats, column: str) -> bool:
+    # Counts wrap the page query; Postgres drops the unused subquery columns
+    return any(column in shape for shape in stats.shapes if not shape.startswith("SELECT count"))
+
+
+async def test_task_lists_load_equipment_and_media_only_when_included(session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    event = await make_event(session, author, workspace)
+    await make_task(session, author, event, name="Knots", equipment={"rope": 2}, media={"a": 1})
+    await session.commit()
+    session.expunge_all()
+    query_stats.install(session.bind)
+    svc = TaskService(session)
+
+    with query_stats.track() as stats:
+        page = await svc.list_for_event(event.id)
+    assert not _selected(stats, "tasks.equipment") and not _selected(stats, "tasks.media")
+    assert page.items[0].model_fields_set.isdisjoint({"equipment", "media"})
+
+    session.expunge_all()
+    with query_stats.track() as stats:
+        page = await svc.list_for_event(event.id, include=["equipment"])
+    assert _selected(stats, "tasks.equipment") and not _selected(stats, "tasks.media")
+    assert page.items[0].equipment == {"rope": 2} and "media" not in page.items[0].model_fields_set
+
+    # Content queries never return the task blobs, so they are not read at all
+    with query_stats.track() as stats:
+        await ContentRepository(session).query(ContentFilter(content_type=[ContentType.task]))
+    assert not _selected(stats, "tasks.equipment")
+
+
+async def test_item_and_write_responses_keep_deferred_columns(session):
+    author = await make_user(session)
+    workspace = await make_workspace(session, settings={"patrols": 4})
+    event = await make_event(session, author, workspace)
+    task = await make_task(session, author, event, equipment={"matches": 1})
+    await session.commit()
+    session.expunge_all()
+
+    [row] = (await TaskService(session).list_for_event(event.id)).items
+    assert "equipment" not in row.model_fields_set
+    # The list left the instance without equipment; item reads and writes load it
+    svc = TaskService(session)
+    assert (await svc.get_in_event(task.id, event.id)).equipment == {"matches": 1}
+    updated = await svc.update(task.id, TaskUpdate(name="Fire"))
+    assert updated.equipment == {"matches": 1} and updated.author.id == author.id
+
+    suffix = uuid4().hex[:8]
+    user = await UserService(session).create(
+        UserCreate(
+            name="Prefs",
+            email=f"{suffix}@example.com",
+            auth0_id=f"auth0|{suffix}",
+            preferences={"theme": "dark"},
+        )
+    )
+    assert user.preferences == {"theme": "dark"}
+    renamed = await WorkspaceService(session).update(workspace.id, WorkspaceUpdate(name="Renamed"))
+    assert renamed.settings == {"patrols": 4}
+
+
+async def test_list_endpoints_omit_deferred_fields_unless_included(session):
+    user = await make_user(session, preferences={"theme": "dark"})
+    workspace = await make_workspace(session, settings={"patrols": 4})
+    await make_workspace_membership(session, user, workspace)
+    event = await make_event(session, user, workspace)
+    await make_task(session, user, event, equipment={"rope": 2})
+    await session.commit()
+    session.expunge_all()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_read_session] = lambda: session
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        tasks = await client.get(f"/events/{event.id}/tasks")
+        with_equipment = await client.get(
+            "/tasks", params={"event_id": str(event.id), "include": "equipment"}
+        )
+        workspaces = await client.get(f"/users/{user.id}/workspaces")
+        with_settings = await client.get(
+            f"/users/{user.id}/workspaces", params={"include": "settings"}
+        )
+        users = await client.get("/users", params={"q": user.name})
+        with_preferences = await client.get(
+            "/users", params={"q": user.name, "include": "preferences"}
+        )
+        bad = await client.get("/users", params={"include": "password"})
+
+    assert tasks.status_code == 200, tasks.text
+    [task] = tasks.json()
+    assert "equipment" not in task and "media" not in task and task["author"]["id"] == str(user.id)
+    [task] = with_equipment.json()
+    assert task["equipment"] == {"rope": 2} and "media" not in task
+    assert "settings" not in workspaces.json()[0]
+    assert with_settings.json()[0]["settings"] == {"patrols": 4}
+    assert "preferences" not in users.json()[0]
+    assert with_preferences.json()[0]["preferences"] == {"theme": "dark"}
+    assert bad.status_code == 422
@@ -0,0 +1,155 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select, update
+
+from app import models as m
+from app.core import query_stats
+from app.core.auth import get_current_user, get_principal
+from app.core.db import get_read_session, get_session, get_session_maker, make_engine
+from app.main import create_app
+from app.services.likes import LikeService
+from tests.factories import make_program, make_user, make_workspace
+
+
+async def _like_count(session, content_id) -> int:
+    return await session.scalar(select(m.Content.like_count).where(m.Content.id == content_id))
+
+
+async def test_like_is_idempotent_and_moves_the_counter(session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    await session.commit()
+    svc = LikeService(session)
+
+    await svc.like_content(author.id, program.id)
+    await svc.like_content(author.id, program.id)
+    assert await _like_count(session, program.id) == 1
+
+    await svc.delete(author.id, program.id)
+    assert await _like_count(session, program.id) == 0
+    with pytest.raises(HTTPException) as missing:
+        await svc.delete(author.id, program.id)
+    assert missing.value.status_code == 404
+    assert await _like_count(session, program.id) == 0
+
+
+async def test_create_payload_cannot_set_like_count(session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    await session.commit()
+
+    app = create_app()
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_principal] = lambda: author
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        created = await client.post(
+            f"/workspaces/{workspace.id}/programs",
+            json={"name": "Inflated", "author_id": str(author.id), "like_count": 999},
+        )
+    assert created.status_code == 201, created.text
+    assert created.json()["like_count"] == 0
+    assert await _like_count(session, UUID(created.json()["id"])) == 0
+
+
+async def test_like_on_missing_content_is_404(session):
+    author = await make_user(session)
+    await session.commit()
+    with pytest.raises(HTTPException) as exc:
+        await LikeService(session).like_content(author.id, uuid4())
+    assert exc.value.status_code == 404
+
+
+async def test_reconcile_repairs_drifted_like_counts(session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    await session.commit()
+    svc = LikeService(session)
+    await svc.like_content(author.id, program.id)
+    await session.execute(update(m.Content).where(m.Content.id == program.id).values(like_count=5))
+    await session.commit()
+
+    assert await svc.reconcile_counts() >= 1
+    assert await _like_count(session, program.id) == 1
+    assert await svc.reconcile_counts() == 0
+
+
+async def test_like_count_stays_exact_under_parallel_likes(session, pg_url):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    users = [await make_user(session) for _ in range(200)]
+    await session.commit()
+    user_ids = [u.id for u in users]
+
+    engine = make_engine(pg_url, pool_size=20, max_overflow=0)
+    maker = get_session_maker(engine)
+
+    async def like(user_id):
+        async with maker() as s:
+            await LikeService(s).like_content(user_id, program.id)
+
+    async def unlike(user_id):
+        async with maker() as s:
+            await LikeService(s).delete(user_id, program.id)
+
+    try:
+        # Every user likes twice at once; the duplicates must not count
+        await asyncio.gather(*(like(uid) for uid in user_ids * 2))
+        assert await _like_count(session, program.id) == 200
+
+        # Unlikes race against repeated likes from the users who keep theirs
+        await asyncio.gather(
+            *(unlike(uid) for uid in user_ids[:80]), *(like(uid) for uid in user_ids[80:])
+        )
+        assert await _like_count(session, program.id) == 120
+    finally:
+        await engine.dispose()
+
+
+async def test_like_states_for_a_page_in_one_statement(session):
+    query_stats.install(session.bind)
+    me = await make_user(session)
+    other = await make_user(session)
+    workspace = await make_workspace(session)
+    programs = [await make_program(session, me, workspace) for _ in range(3)]
+    await session.commit()
+    svc = LikeService(session)
+    await svc.like_content(me.id, programs[0].id)
+    await svc.like_content(other.id, programs[0].id)
+    await svc.like_content(other.id, programs[2].id)
+
+    ids = [programs[2].id, uuid4(), programs[0].id, programs[1].id, programs[2].id]
+    with query_stats.track() as stats:
+        states = await svc.like_states(me.id, ids)
+    assert stats.statements == 1
+    assert [(s.content_id, s.like_count, s.liked) for s in states] == [
+        (programs[2].id, 1, False),
+        (programs[0].id, 2, True),
+        (programs[1].id, 0, False),
+    ]
+
+
+async def test_like_state_endpoint_uses_the_caller_and_caps_ids(session):
+    me = await make_user(session)
+    program = await make_program(session, me, await make_workspace(session))
+    await session.commit()
+    await LikeService(session).like_content(me.id, program.id)
+
+    app = create_app()
+    app.dependency_overrides[get_read_session] = lambda: session
+    app.dependency_overrides[get_current_user] = lambda: me
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        ok = await client.get("/content/likes/state", params={"content_id": [str(program.id)]})
+        too_many = await client.get(
+            "/content/likes/state", params={"content_id": [str(uuid4()) for _ in range(201)]}
+        )
+    assert ok.status_code == 200
+    assert ok.json() == [{"content_id": str(program.id), "like_count": 1, "liked": True}]
+    assert too_many.status_code == 422
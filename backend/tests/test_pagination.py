@@ -0,0 +1,218 @@
+import datetime as dt
+import re
+import time
+from uuid import UUID
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from app import models as m
+from app.core import query_stats
+from app.core.db import get_read_session, get_session, get_session_maker, make_engine, warm_up
+from app.main import create_app
+from app.repositories.base import Repository
+from app.repositories.events import EventRepository
+from app.settings import settings
+from tests.factories import (
+    make_comment,
+    make_event,
+    make_program,
+    make_user,
+    make_workspace,
+)
+
+
+@pytest.fixture
+async def client(session):
+    app = create_app()
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_read_session] = lambda: session
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+def _next_link(response: httpx.Response) -> str | None:
+    match = re.search(r'<([^>]+)>; rel="next"', response.headers.get("Link", ""))
+    return match.group(1) if match else None
+
+
+async def _walk(client: httpx.AsyncClient, url: str) -> list[list[str]]:
+    pages = []
+    next_url: str | None = url
+    while next_url:
+        response = await client.get(next_url)
+        assert response.status_code == 200, response.text
+        pages.append([item["id"] for item in response.json()])
+        next_url = _next_link(response)
+    return pages
+
+
+async def test_event_cursor_pages_match_offset_order(client, session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    start = dt.datetime(2025, 9, 1, 18, tzinfo=dt.timezone.utc)
+    # Several events share a start time, so the id tie-breaker decides their order
+    for i in range(7):
+        await make_event(session, author, workspace, start_dt=start + dt.timedelta(days=i // 3))
+    await session.commit()
+
+    url = f"/workspaces/{workspace.id}/events"
+    by_offset = [e["id"] for e in (await client.get(url, params={"limit": 50})).json()]
+    pages = await _walk(client, f"{url}?limit=3&cursor=")
+
+    assert [len(p) for p in pages] == [3, 3, 1]
+    assert [i for page in pages for i in page] == by_offset
+
+
+async def test_comment_cursor_pages_descend_and_skip_count(client, session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    for _ in range(4):
+        await make_comment(session, author, program)
+    await session.commit()
+
+    first = await client.get(f"/content/{program.id}/comments", params={"limit": 2, "cursor": ""})
+    assert "X-Total-Count" not in first.headers
+    assert 'rel="first"' in first.headers["Link"]
+
+    pages = await _walk(client, f"/content/{program.id}/comments?limit=2&cursor=")
+    by_offset = [c["id"] for c in (await client.get(f"/content/{program.id}/comments")).json()]
+    assert [i for page in pages for i in page] == by_offset
+    assert len(by_offset) == 4
+
+
+async def test_invalid_cursor_is_rejected(client, session):
+    workspace = await make_workspace(session)
+    response = await client.get(f"/workspaces/{workspace.id}/events", params={"cursor": "bogus"})
+    assert response.status_code == 400
+
+
+async def test_program_cursor_pages_sort_by_name(client, session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    for name in ["Camp", "Badges", "Camp", "Archery", "Hike"]:
+        await make_program(session, author, workspace, name=name)
+    await session.commit()
+
+    pages = await _walk(client, f"/workspaces/{workspace.id}/programs?limit=2&cursor=")
+    names = {p.id: p.name for p in await _programs(session, workspace.id)}
+    walked = [i for page in pages for i in page]
+    assert len(set(walked)) == 5
+    assert [names[UUID(i)] for i in walked] == ["Archery", "Badges", "Camp", "Camp", "Hike"]
+
+
+async def _programs(session, workspace_id):
+    result = await session.scalars(select(m.Program).where(m.Program.workspace_id == workspace_id))
+    return result.all()
+
+
+async def test_offset_page_total_modes(client, session):
+    author = await make_user(session)
+    program = await make_program(session, author, await make_workspace(session))
+    for _ in range(5):
+        await make_comment(session, author, program)
+    await session.commit()
+    url = f"/content/{program.id}/comments"
+
+    exact = await client.get(url, params={"limit": 2})
+    assert exact.headers["X-Total-Count"] == "5"
+    assert 'rel="last"' in exact.headers["Link"] and _next_link(exact)
+
+    # Past the end the window count has no row to ride on but the total stays right
+    beyond = await client.get(url, params={"limit": 2, "offset": 10})
+    assert beyond.json() == [] and beyond.headers["X-Total-Count"] == "5"
+    assert _next_link(beyond) is None
+
+    skipped = await client.get(url, params={"limit": 2, "offset": 4, "total": "none"})
+    assert len(skipped.json()) == 1
+    assert "X-Total-Count" not in skipped.headers and _next_link(skipped) is None
+    assert 'rel="last"' not in skipped.headers["Link"]
+
+    estimated = await client.get(url, params={"limit": 2, "total": "estimate"})
+    assert "X-Total-Count" not in estimated.headers
+    assert int(estimated.headers["X-Total-Count-Estimate"]) >= 0
+    assert _next_link(estimated)
+
+
+async def test_exact_total_comes_from_the_page_query(session, monkeypatch):
+    monkeypatch.setattr(settings, "db_concurrent_count", False)
+    query_stats.install(session.bind)
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    for _ in range(3):
+        await make_event(session, author, workspace)
+    await session.commit()
+    session.expunge_all()
+
+    with query_stats.track() as stats:
+        page = await EventRepository(session).list_for_workspace(workspace.id, limit=2)
+    assert page.total == 3 and page.has_more and len(page.items) == 2
+    window = [s for s in stats.shapes if "OVER ()" in s]
+    assert len(window) == 1 and not any("count(*) AS count_1" in s for s in stats.shapes)
+
+
+async def test_exact_count_runs_beside_the_page_on_another_connection(pg_url):
+    engine = make_engine(pg_url)
+    await warm_up(engine, 2)
+    # pg_sleep in the select list runs once per row for both the page and the count
+    stmt = (
+        select(m.User.id, func.pg_sleep(0.3).label("nap"))
+        .where(m.User.id == select(m.User.id).limit(1).scalar_subquery())
+        .order_by(m.User.id)
+    )
+    try:
+        async with get_session_maker(engine)() as session:
+            await make_user(session)
+            await session.commit()
+            started = time.perf_counter()
+            page = await Repository(session).paginate(stmt, limit=5, offset=0, scalars=False)
+            elapsed = time.perf_counter() - started
+            await session.rollback()
+    finally:
+        await engine.dispose()
+    assert page.total == 1 and len(page.items) == 1
+    assert elapsed < 0.55
+
+
+async def test_concurrent_count_shares_a_repeatable_read_snapshot(session, engine):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_event(session, author, workspace)
+    await session.commit()
+    workspace_id = workspace.id
+
+    await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    repo = EventRepository(session)
+    first = await repo.list_for_workspace(workspace_id)
+
+    async with get_session_maker(engine)() as other:
+        await make_event(other, author, workspace)
+        await other.commit()
+    # Keep an idle connection around so the count can take the concurrent path
+    async with engine.connect():
+        pass
+
+    again = await repo.list_for_workspace(workspace_id)
+    assert first.total == again.total == len(again.items) == 1
+    await session.rollback()
+    session.expunge_all()
+    assert (await repo.list_for_workspace(workspace_id)).total == 2
+
+
+async def test_count_stays_on_the_session_after_it_writes(session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_event(session, author, workspace)
+    page = await EventRepository(session).list_for_workspace(workspace.id)
+    assert page.total == len(page.items) == 1
+
+
+async def test_total_past_the_end_on_searchable_lists(client, session):
+    await make_user(session, name="Paginated Person")
+    await session.commit()
+    response = await client.get("/users", params={"q": "Paginated", "offset": 500})
+    assert response.status_code == 200 and response.json() == []
+    assert response.headers["X-Total-Count"] == "1"
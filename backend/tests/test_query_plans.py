@@ -0,0 +1,449 @@
+"""
+Query plan regression checks for repository read paths.
+
+A dedicated schema is seeded with a few hundred thousand rows, analysed, and every
+repository get/list method is run once while its SQL is captured. Each captured
+statement is then replayed under EXPLAIN (ANALYZE, FORMAT JSON), and a case fails when
+its plan
+
+* sequentially scans a table with at least LARGE_TABLE_ROWS rows,
+* sorts on disk (an external sort or merge), or
+* costs more than its entry in query_plan_budget.json allows (a case without an
+  entry only warns).
+
+After an intentional change, regenerate the budget with
+``UPDATE_QUERY_PLAN_BUDGET=1 pytest tests/test_query_plans.py`` and review the diff.
+QUERY_PLAN_SCALE multiplies the seeded volumes.
+"""
+
+import datetime as dt
+import hashlib
+import json
+import os
+import warnings
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app import models as m
+from app.repositories.comments import CommentRepository
+from app.repositories.content import ContentRepository
+from app.repositories.events import EventRepository
+from app.repositories.groups import GroupRepository
+from app.repositories.likes import LikeRepository
+from app.repositories.programs import ProgramRepository
+from app.repositories.search import SearchRepository
+from app.repositories.tags import TagRepository
+from app.repositories.tasks import TaskRepository
+from app.repositories.troops import TroopRepository
+from app.repositories.users import UserRepository
+from app.repositories.workspaces import WorkspaceRepository
+from app.schemas.content_query import ContentFilter
+from app.schemas.task import TaskFilter
+
+SCHEMA = "query_plans"
+SCALE = int(os.environ.get("QUERY_PLAN_SCALE", "1"))
+LARGE_TABLE_ROWS = 10_000
+BUDGET_FILE = Path(__file__).with_name("query_plan_budget.json")
+BUDGET_TOLERANCE = 1.5
+UPDATE_BUDGET = os.environ.get("UPDATE_QUERY_PLAN_BUDGET") == "1"
+ANALYZE_TARGET = 1000
+
+USERS = 20_000 * SCALE
+WORKSPACES = 200 * SCALE
+GROUPS = 200 * SCALE
+TAGS = 2_000 * SCALE
+PROGRAMS_PER_WORKSPACE = 20
+EVENTS_PER_WORKSPACE = 200
+TROOPS_PER_WORKSPACE = 10
+PROGRAMS = WORKSPACES * PROGRAMS_PER_WORKSPACE
+EVENTS = WORKSPACES * EVENTS_PER_WORKSPACE
+COMMENTS = 100_000 * SCALE
+LIKES = 100_000 * SCALE
+
+
+def uid(kind: str, n: int) -> UUID:
+    """Id of the n-th seeded row of ``kind``; matches md5(kind || n)::uuid in SEED_SQL."""
+    return UUID(hashlib.md5(f"{kind}{n}".encode()).hexdigest())
+
+
+def _ws(n: str) -> str:
+    return f"md5('workspace' || ((({n}) - 1) % {WORKSPACES} + 1))::uuid"
+
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, auth0_id, name, email)
+    SELECT md5('user' || n)::uuid, 'auth0|user' || n, 'User ' || n, 'user' || n || '@example.com'
+    FROM generate_series(1, {USERS}) AS n
+    """,
+    f"""
+    INSERT INTO groups (id, name)
+    SELECT md5('group' || n)::uuid, 'Group ' || n FROM generate_series(1, {GROUPS}) AS n
+    """,
+    f"""
+    INSERT INTO group_memberships (user_id, group_id, role)
+    SELECT md5('user' || n)::uuid, md5('group' || (n % {GROUPS} + 1))::uuid, 'viewer'
+    FROM generate_series(1, {USERS}) AS n
+    """,
+    f"""
+    INSERT INTO workspaces (id, name, default_meeting_weekday, default_start_time,
+                            default_end_time, default_interval, season_start)
+    SELECT md5('workspace' || n)::uuid, 'Workspace ' || n, 'monday', '19:00', '21:00',
+           'weekly', DATE '2024-09-01'
+    FROM generate_series(1, {WORKSPACES}) AS n
+    """,
+    f"""
+    INSERT INTO workspace_memberships (workspace_id, user_id, role)
+    SELECT {_ws("n")}, md5('user' || n)::uuid, 'viewer' FROM generate_series(1, {USERS}) AS n
+    """,
+    f"""
+    INSERT INTO content (id, content_type, name, like_count, comment_count, created_at, author_id)
+    SELECT md5(kind || n)::uuid, kind::content_type_enum, initcap(kind) || ' ' || n, 0, 0,
+           TIMESTAMPTZ '2025-01-01' - n * INTERVAL '1 minute', md5('user' || (n % {USERS} + 1))::uuid
+    FROM (VALUES ('program', {PROGRAMS}), ('event', {EVENTS}), ('task', {EVENTS})) AS k(kind, total),
+         generate_series(1, total) AS n
+    """,
+    f"""
+    INSERT INTO programs (id, workspace_id)
+    SELECT md5('program' || n)::uuid, {_ws("n")} FROM generate_series(1, {PROGRAMS}) AS n
+    """,
+    # Odd events belong to one of their workspace's programs, even ones to none
+    f"""
+    INSERT INTO events (id, start_dt, workspace_id, program_id)
+    SELECT md5('event' || n)::uuid, TIMESTAMPTZ '2024-09-01' + (n % 730) * INTERVAL '1 day',
+           {_ws("n")},
+           CASE WHEN n % 2 = 1 THEN md5('program' || ((n - 1) % {WORKSPACES} + 1
+               + {WORKSPACES} * (((n - 1) / {WORKSPACES}) % {PROGRAMS_PER_WORKSPACE})))::uuid END
+    FROM generate_series(1, {EVENTS}) AS n
+    """,
+    f"""
+    INSERT INTO tasks (id, event_id, estimated_duration, participant_min, participant_max,
+                       equipment, media)
+    SELECT md5('task' || n)::uuid, md5('event' || n)::uuid, n % 13 * 10, n % 4, n % 4 + 10,
+           jsonb_build_object('item' || n % 50, 1, 'item' || n % 7 + 50, 2),
+           CASE WHEN n % 25 = 0 THEN jsonb_build_object('video', jsonb_build_array('v' || n))
+                ELSE jsonb_build_object('images', jsonb_build_array('i' || n)) END
+    FROM generate_series(1, {EVENTS}) AS n
+    """,
+    f"""
+    INSERT INTO tags (id, name)
+    SELECT md5('tag' || n)::uuid, 'tag-' || n FROM generate_series(1, {TAGS}) AS n
+    """,
+    f"""
+    INSERT INTO content_tags (content_id, tag_id)
+    SELECT md5('event' || n)::uuid, md5('tag' || (n % {TAGS} + 1))::uuid
+    FROM generate_series(1, {EVENTS}) AS n
+    """,
+    f"""
+    INSERT INTO comments (id, body, created_at, user_id, content_id)
+    SELECT md5('comment' || n)::uuid, 'Comment ' || n,
+           TIMESTAMPTZ '2025-01-01' + n * INTERVAL '1 minute',
+           md5('user' || (n % {USERS} + 1))::uuid, md5('event' || (n % {EVENTS} + 1))::uuid
+    FROM generate_series(1, {COMMENTS}) AS n
+    """,
+    f"""
+    INSERT INTO likes (user_id, content_id)
+    SELECT md5('user' || (n % {USERS} + 1))::uuid, md5('event' || (n * 7 % {EVENTS} + 1))::uuid
+    FROM generate_series(1, {LIKES}) AS n
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO troops (id, name, workspace_id)
+    SELECT md5('troop' || n)::uuid, 'Troop ' || n, {_ws("n")}
+    FROM generate_series(1, {WORKSPACES * TROOPS_PER_WORKSPACE}) AS n
+    """,
+    # Event n shares its workspace with troop n % (WORKSPACES * TROOPS_PER_WORKSPACE)
+    f"""
+    INSERT INTO troop_participation (troop_id, event_id)
+    SELECT md5('troop' || ((n - 1) % {WORKSPACES * TROOPS_PER_WORKSPACE} + 1))::uuid,
+           md5('event' || n)::uuid
+    FROM generate_series(1, {EVENTS}) AS n
+    """,
+    """
+    UPDATE content SET comment_count = c.n
+    FROM (SELECT content_id, count(*) AS n FROM comments GROUP BY content_id) AS c
+    WHERE content.id = c.content_id
+    """,
+    """
+    UPDATE content SET like_count = l.n
+    FROM (SELECT content_id, count(*) AS n FROM likes GROUP BY content_id) AS l
+    WHERE content.id = l.content_id
+    """,
+]
+
+
+@dataclass
+class Captured:
+    statements: list[tuple[str, Any]] = field(default_factory=list)
+    active: bool = False
+
+
+@dataclass
+class PlanDb:
+    engine: AsyncEngine
+    maker: async_sessionmaker[AsyncSession]
+    captured: Captured
+    row_counts: dict[str, float]
+    extensions: set[str]
+
+
+@pytest.fixture(scope="module")
+async def plan_db(pg_url: str, engine: AsyncEngine) -> AsyncIterator[PlanDb]:
+    # `engine` (the shared test engine) is requested so the public schema exists first
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    # public stays on the path for extension objects such as gin_trgm_ops
+    plan_engine = create_async_engine(
+        pg_url, connect_args={"options": f"-c search_path={SCHEMA},public"}
+    )
+    captured = Captured()
+
+    @event.listens_for(plan_engine.sync_engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if captured.active and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.statements.append((statement, parameters))
+
+    try:
+        async with plan_engine.begin() as conn:
+            # The schema is empty; checking first would find the public tables instead
+            await conn.run_sync(m.Base.metadata.create_all, checkfirst=False)
+            for sql in SEED_SQL:
+                await conn.execute(text(sql))
+        # As autovacuum would have: fresh statistics and an all-visible visibility map
+        async with plan_engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            # A sample of 300 x target rows covers every seeded row at SCALE=1, so the
+            # statistics (and the estimates for jsonb ?/?& filters) are the same each run
+            await conn.execute(text(f"SET default_statistics_target = {ANALYZE_TARGET}"))
+            await conn.execute(text("VACUUM ANALYZE"))
+        async with plan_engine.connect() as conn:
+            rows = await conn.execute(
+                text(
+                    "SELECT c.relname, c.reltuples FROM pg_class c "
+                    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                    "WHERE n.nspname = :schema AND c.relkind = 'r'"
+                ),
+                {"schema": SCHEMA},
+            )
+            row_counts = {name: tuples for name, tuples in rows}
+            extensions = set(await conn.scalars(text("SELECT extname FROM pg_extension")))
+        assert row_counts.get("content", 0) > 0, f"seeded rows did not land in {SCHEMA}"
+        yield PlanDb(
+            plan_engine,
+            async_sessionmaker(plan_engine, expire_on_commit=False),
+            captured,
+            row_counts,
+            extensions,
+        )
+    finally:
+        await plan_engine.dispose()
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+Call = Callable[[AsyncSession], Awaitable[Any]]
+
+WS = uid("workspace", 1)
+PROGRAM = uid("program", 1)
+EVENT = uid("event", 1)  # odd, so it belongs to PROGRAM
+USER = uid("user", 1)
+TAG = uid("tag", 2)  # tags event 1
+TROOP = uid("troop", 1)
+GROUP = uid("group", 2)  # user 1's group
+SEASON = dt.datetime(2025, 1, 1, tzinfo=dt.timezone.utc)
+
+CASES: dict[str, Call] = {
+    "comments.get": lambda s: CommentRepository(s).get(uid("comment", 1)),
+    "comments.list_for_content": lambda s: CommentRepository(s).list_for_content(uid("event", 2)),
+    "content.query": lambda s: ContentRepository(s).query(ContentFilter()),
+    "content.query.tags": lambda s: ContentRepository(s).query(
+        ContentFilter(tag_id=[TAG, uid("tag", 3)], tag_mode="any")
+    ),
+    "content.query.tasks": lambda s: ContentRepository(s).query(
+        ContentFilter(duration_min=30, duration_max=30, equipment=["item3"])
+    ),
+    "content.facets": lambda s: ContentRepository(s).facets(ContentFilter()),
+    "content.facets.tags": lambda s: ContentRepository(s).facets(
+        ContentFilter(tag_id=[TAG, uid("tag", 3)], tag_mode="any")
+    ),
+    "content.facets.tasks": lambda s: ContentRepository(s).facets(
+        ContentFilter(duration_min=30, duration_max=30, equipment=["item3"])
+    ),
+    "events.get": lambda s: EventRepository(s).get(EVENT),
+    "events.get_in_program": lambda s: EventRepository(s).get_in_program(EVENT, PROGRAM, WS),
+    "events.list_for_workspace": lambda s: EventRepository(s).list_for_workspace(WS),
+    "events.list_for_workspace.dates": lambda s: EventRepository(s).list_for_workspace(
+        WS, date_from=SEASON, date_to=SEASON + dt.timedelta(days=90)
+    ),
+    "events.list_for_program": lambda s: EventRepository(s).list_for_program(WS, PROGRAM),
+    "groups.get": lambda s: GroupRepository(s).get(GROUP),
+    "groups.list": lambda s: GroupRepository(s).list(),
+    "groups.list.q": lambda s: GroupRepository(s).list(q="roup 12"),
+    "groups.list_groups_for_user": lambda s: GroupRepository(s).list_groups_for_user(USER),
+    "groups.list_group_members": lambda s: GroupRepository(s).list_group_members(GROUP),
+    "groups.get_membership": lambda s: GroupRepository(s).get_membership(GROUP, USER),
+    "likes.list_for_content": lambda s: LikeRepository(s).list_for_content(EVENT),
+    "likes.like_states": lambda s: LikeRepository(s).like_states(
+        USER, [uid("event", n) for n in range(1, 51)]
+    ),
+    "programs.get": lambda s: ProgramRepository(s).get(PROGRAM),
+    "programs.get_in_workspace": lambda s: ProgramRepository(s).get_in_workspace(PROGRAM, WS),
+    "programs.list_by_workspace": lambda s: ProgramRepository(s).list_by_workspace(WS),
+    "search.search": lambda s: SearchRepository(s).search(USER, "event 1"),
+    "search.search.common_word": lambda s: SearchRepository(s).search(USER, "task"),
+    "tags.get": lambda s: TagRepository(s).get(TAG),
+    "tags.get_by_name": lambda s: TagRepository(s).get_by_name("tag-2"),
+    "tags.list": lambda s: TagRepository(s).list(),
+    "tags.list.q": lambda s: TagRepository(s).list(q="ag-123"),
+    "tags.list.q.similarity": lambda s: TagRepository(s).list(q="ag-123", sort="similarity"),
+    "tags.list_content_tags": lambda s: TagRepository(s).list_content_tags(EVENT),
+    "tags.list_tagged_content": lambda s: TagRepository(s).list_tagged_content(TAG),
+    "tags.get_content_tag": lambda s: TagRepository(s).get_content_tag(EVENT, TAG),
+    "tags.usage_counts": lambda s: TagRepository(s).usage_counts(),
+    "tasks.get": lambda s: TaskRepository(s).get(uid("task", 1)),
+    "tasks.query.equipment": lambda s: TaskRepository(s).query(
+        TaskFilter(equipment=["item3"], equipment_any=["item51", "item52"])
+    ),
+    "tasks.query.equipment_contains": lambda s: TaskRepository(s).query(
+        TaskFilter(equipment_contains='{"item3": 1}')
+    ),
+    "tasks.query.media": lambda s: TaskRepository(s).query(TaskFilter(media=["video"])),
+    "tasks.packing_list.event": lambda s: TaskRepository(s).packing_list(event_id=EVENT),
+    "tasks.packing_list.program": lambda s: TaskRepository(s).packing_list(program_id=PROGRAM),
+    "tasks.get_in_event": lambda s: TaskRepository(s).get_in_event(uid("task", 1), EVENT),
+    "tasks.list_for_event": lambda s: TaskRepository(s).list_for_event(EVENT),
+    "troops.get": lambda s: TroopRepository(s).get(TROOP),
+    "troops.get_in_workspace": lambda s: TroopRepository(s).get_in_workspace(TROOP, WS),
+    "troops.list_for_workspace": lambda s: TroopRepository(s).list_for_workspace(WS),
+    "troops.list_event_troops": lambda s: TroopRepository(s).list_event_troops(EVENT),
+    "troops.list_troop_events": lambda s: TroopRepository(s).list_troop_events(TROOP),
+    "troops.get_participation": lambda s: TroopRepository(s).get_participation(EVENT, TROOP),
+    "users.get": lambda s: UserRepository(s).get(USER),
+    "users.get_by_email": lambda s: UserRepository(s).get_by_email("USER1@example.com"),
+    "users.get_by_auth0_id": lambda s: UserRepository(s).get_by_auth0_id("auth0|user1"),
+    # An exact total of an unfiltered list has to count every row; check the page itself
+    "users.list": lambda s: UserRepository(s).list(total="estimate"),
+    "users.list.q": lambda s: UserRepository(s).list(q="user1234"),
+    "users.list.q.similarity": lambda s: UserRepository(s).list(q="user1234", sort="similarity"),
+    "workspaces.get": lambda s: WorkspaceRepository(s).get(WS),
+    "workspaces.list_user_workspaces": lambda s: WorkspaceRepository(s).list_user_workspaces(USER),
+}
+
+
+# Sequential scans that are the planner's right call at the seeded volume, with why
+ALLOWED_SEQ_SCANS: dict[str, set[str]] = {
+    # Facets without filters count every row, so reading every row is the plan
+    "content.facets": {"content", "tasks", "content_tags", "tags"},
+    # ~100 members are hash-joined against users; PK probes only win once users is larger
+    "groups.list_group_members": {"users"},
+    # The tag dictionary loads every tag with its usage count
+    "tags.usage_counts": {"content_tags", "tags"},
+    # ~1k-2k matching tasks are hash-joined to content for the name order; the
+    # planner prices that below as many content PK probes at default page costs
+    "tasks.query.equipment_contains": {"content"},
+    "tasks.query.media": {"content"},
+}
+
+
+# Substring searches are only indexed where pg_trgm is installed
+NEEDS_PG_TRGM = {
+    "groups.list.q",
+    "tags.list.q",
+    "tags.list.q.similarity",
+    "users.list.q",
+    "users.list.q.similarity",
+}
+
+
+def _nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _nodes(child)
+
+
+def _problems(plan: dict[str, Any], row_counts: dict[str, float], allowed: set[str]) -> list[str]:
+    problems = []
+    for node in _nodes(plan):
+        relation = node.get("Relation Name")
+        if (
+            node["Node Type"] == "Seq Scan"
+            and row_counts.get(relation, 0) >= LARGE_TABLE_ROWS
+            and relation not in allowed
+        ):
+            problems.append(f"Seq Scan on {relation} ({row_counts[relation]:.0f} rows)")
+        if node.get("Sort Space Type") == "Disk" or "external" in node.get("Sort Method", ""):
+            problems.append(f"{node.get('Sort Method', 'sort')} spilled to disk")
+    return problems
+
+
+async def _explain(db: PlanDb, case: str) -> tuple[float, list[str], list[str]]:
+    async with db.maker() as session:
+        db.captured.statements.clear()
+        db.captured.active = True
+        try:
+            await CASES[case](session)
+        finally:
+            db.captured.active = False
+        statements = list(db.captured.statements)
+
+        cost, problems = 0.0, []
+        conn = await session.connection()
+        for statement, parameters in statements:
+            explained = await conn.exec_driver_sql(
+                "EXPLAIN (ANALYZE, FORMAT JSON) " + statement, parameters
+            )
+            plan = explained.scalar_one()[0]["Plan"]
+            cost += plan["Total Cost"]
+            problems += _problems(plan, db.row_counts, ALLOWED_SEQ_SCANS.get(case, set()))
+        return cost, problems, [s for s, _ in statements]
+
+
+def _budget() -> dict[str, float]:
+    return json.loads(BUDGET_FILE.read_text()) if BUDGET_FILE.exists() else {}
+
+
+_measured: dict[str, float] = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _write_budget():
+    yield
+    if UPDATE_BUDGET and _measured:
+        budget = {**_budget(), **{k: round(v, 1) for k, v in _measured.items()}}
+        BUDGET_FILE.write_text(json.dumps(dict(sorted(budget.items())), indent=2) + "\n")
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+async def test_repository_query_plan(plan_db: PlanDb, case: str):
+    if case in NEEDS_PG_TRGM and "pg_trgm" not in plan_db.extensions:
+        pytest.skip("pg_trgm is not installed on the test server")
+    cost, problems, statements = await _explain(plan_db, case)
+    assert statements, f"{case} issued no SELECT"
+    assert not problems, f"{case}: " + "; ".join(problems) + "\n" + "\n\n".join(statements)
+
+    _measured[case] = cost
+    if UPDATE_BUDGET:
+        return
+    budget = _budget().get(case)
+    if budget is None:
+        # Cases that only run with optional extensions may not have been measured yet
+        warnings.warn(f"{case} has no entry in {BUDGET_FILE.name}; regenerate it", stacklevel=1)
+        return
+    assert cost <= budget * BUDGET_TOLERANCE, (
+        f"{case}: estimated cost {cost:.1f} exceeds budget {budget:.1f} "
+        f"(x{BUDGET_TOLERANCE} tolerance)"
+    )
@@ -0,0 +1,82 @@
+import logging
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models as m
+from app.core import query_stats
+from app.core.db import get_session, get_session_maker, make_engine
+from app.main import create_app
+from app.services.tags import TagService
+from app.settings import settings
+from tests.factories import make_comment, make_program, make_tag, make_user, make_workspace
+
+
+def test_fingerprint_ignores_parameter_values():
+    a = query_stats.fingerprint("SELECT * FROM users WHERE id = %(id_1)s::UUID AND name = 'x'")
+    b = query_stats.fingerprint("SELECT *\n  FROM users WHERE id = %(id_2)s::UUID AND name = 'y'")
+    assert a == b == "SELECT * FROM users WHERE id = ?::UUID AND name = ?"
+    assert query_stats.fingerprint("SELECT 1 FROM t WHERE x IN (1, 2, 3) LIMIT 10") == (
+        "SELECT ? FROM t WHERE x IN (?) LIMIT ?"
+    )
+
+
+async def test_request_statement_headers_and_repeat_warning(pg_url, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "env", "development")
+    monkeypatch.setattr(settings, "sql_repeat_warn_threshold", 3)
+    engine = make_engine(pg_url)
+    maker = get_session_maker(engine)
+
+    async def session_override():
+        async with maker() as s:
+            yield s
+
+    app = create_app()
+    app.dependency_overrides[get_session] = session_override
+    session_dep = Depends(get_session)
+
+    @app.get("/_n_plus_one")
+    async def n_plus_one(session: AsyncSession = session_dep):
+        for _ in range(5):
+            await session.execute(select(m.User.id).where(m.User.email == "nobody@example.com"))
+        await session.execute(text("SELECT 1"))
+        return {}
+
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+                response = await client.get("/_n_plus_one")
+    finally:
+        await engine.dispose()
+
+    assert response.headers["X-DB-Statements"] == "6"
+    assert float(response.headers["X-DB-Time-Ms"]) > 0
+    warnings = [r.getMessage() for r in caplog.records if r.name == query_stats.__name__]
+    assert len(warnings) == 1
+    assert "GET /_n_plus_one" in warnings[0] and "FROM users" in warnings[0]
+
+
+async def test_tagged_content_statements_do_not_grow_with_page_size(session):
+    query_stats.install(session.bind)
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    tag = await make_tag(session)
+    for _ in range(5):
+        program = await make_program(session, author, workspace)
+        session.add(m.ContentTag(content_id=program.id, tag_id=tag.id))
+        await make_comment(session, author, program)
+    await session.commit()
+    session.expunge_all()
+
+    async def statements_for(limit: int) -> int:
+        session.expunge_all()
+        with query_stats.track() as stats:
+            out = (await TagService(session).list_tagged_content(tag.id, limit=limit)).items
+        assert len(out) == limit and all(c.comment_count == 1 for c in out)
+        return stats.statements
+
+    assert await statements_for(1) == await statements_for(5) > 0
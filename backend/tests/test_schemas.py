@@ -33,15 +33,16 @@ def test_workspace_defaults_in_schema():
     assert isinstance(w.season_start, dt.date)
 
 
-def test_content_like_count_non_negative():
-    with pytest.raises(ValidationError):
-        s.ContentCreate(
-            name="N",
-            description=None,
-            like_count=-1,
-            created_at=get_current_datetime(),
-            author_id=uuid4(),
-        )
+def test_content_create_ignores_like_count():
+    # Counters only move through likes (FR-CN5); clients cannot set them
+    c = s.ContentCreate(
+        name="N",
+        description=None,
+        like_count=999,
+        created_at=get_current_datetime(),
+        author_id=uuid4(),
+    )
+    assert "like_count" not in c.model_dump()
 
 
 def test_event_time_is_tz_aware():
@@ -0,0 +1,124 @@
+import httpx
+
+from app.core.auth import get_current_user
+from app.core.db import get_read_session
+from app.main import create_app
+from app.models.content import ContentType
+from app.services.search import SearchService
+from tests.factories import (
+    make_event,
+    make_program,
+    make_task,
+    make_user,
+    make_workspace,
+    make_workspace_membership,
+)
+
+
+async def test_search_ranks_name_matches_and_hides_other_workspaces(session):
+    me = await make_user(session)
+    mine = await make_workspace(session)
+    theirs = await make_workspace(session)
+    await make_workspace_membership(session, me, mine)
+    program = await make_program(session, me, mine, name="Knots for beginners")
+    event = await make_event(
+        session, me, mine, name="Tuesday meeting", description="We practise knots and lashings"
+    )
+    task = await make_task(session, me, event, name="Knots relay")
+    await make_program(session, me, mine, name="Campfire songs")
+    await make_program(session, me, theirs, name="Knots for beginners")
+    await session.commit()
+
+    svc = SearchService(session)
+    page = await svc.search(me.id, "knots")
+    assert [hit.id for hit in page.items[2:]] == [event.id]
+    assert {hit.id for hit in page.items[:2]} == {program.id, task.id}
+    assert all(hit.workspace_id == mine.id for hit in page.items)
+    assert page.items[0].rank > page.items[2].rank
+    assert "<mark>knots</mark>" in page.items[2].snippet
+    assert page.next_cursor is None
+
+    tasks_only = await svc.search(me.id, "knots", content_types=[ContentType.task])
+    assert [hit.id for hit in tasks_only.items] == [task.id]
+    assert (await svc.search(me.id, "knots", workspace_id=theirs.id)).items == []
+
+
+async def test_search_cursor_pages_cover_every_match_once(session):
+    me = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_workspace_membership(session, me, workspace)
+    for n in range(7):
+        await make_program(session, me, workspace, name=f"Hike {n}", description="hike " * (n % 3))
+    await session.commit()
+
+    svc = SearchService(session)
+    everything = (await svc.search(me.id, "hike", limit=50)).items
+    seen, cursor = [], ""
+    while True:
+        page = await svc.search(me.id, "hike", limit=3, cursor=cursor)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert len(everything) == 7
+    assert [hit.id for hit in seen] == [hit.id for hit in everything]
+
+
+async def test_search_endpoint_links_next_page_and_validates_query(session):
+    me = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_workspace_membership(session, me, workspace)
+    for n in range(3):
+        await make_program(session, me, workspace, name=f"Orienteering {n}")
+    await session.commit()
+
+    app = create_app()
+    app.dependency_overrides[get_read_session] = lambda: session
+    app.dependency_overrides[get_current_user] = lambda: me
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.get("/search", params={"q": "orienteering", "limit": 2})
+        empty = await client.get("/search", params={"q": ""})
+        bad_cursor = await client.get("/search", params={"q": "x", "cursor": "nope"})
+
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    assert 'rel="next"' in first.headers["Link"]
+    assert empty.status_code == 422
+    assert bad_cursor.status_code == 400
+
+
+async def test_search_snippet_escapes_markup_in_user_text(session):
+    me = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_workspace_membership(session, me, workspace)
+    await make_program(
+        session,
+        me,
+        workspace,
+        name="Lashings",
+        description="Square lashings <script>alert('x')</script> & knots",
+    )
+    await session.commit()
+
+    [hit] = (await SearchService(session).search(me.id, "lashings")).items
+    assert "<script" not in hit.snippet
+    assert "&lt;script&gt;alert(&#39;x&#39;)&lt;/script&gt; &amp;" in hit.snippet
+    assert "<mark>lashings</mark>" in hit.snippet
+
+
+async def test_search_keeps_icelandic_words_intact(session):
+    me = await make_user(session)
+    workspace = await make_workspace(session)
+    await make_workspace_membership(session, me, workspace)
+    # "her" (army) is an English stop word and "hreyfing" looks like an -ing form
+    program = await make_program(
+        session, me, workspace, name="Leikir", description="Her og hreyfing í útilegu"
+    )
+    await session.commit()
+
+    svc = SearchService(session)
+    for query in ("her", "hreyfing", "Útilegu"):
+        assert [hit.id for hit in (await svc.search(me.id, query)).items] == [program.id], query
+    assert (await svc.search(me.id, "hreyf")).items == []
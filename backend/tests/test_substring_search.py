@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.services.groups import GroupService
+from app.services.tags import TagService
+from app.services.users import UserService
+from tests.factories import make_tag, make_user
+
+
+@pytest.fixture
+async def pg_trgm(session):
+    installed = await session.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+    if not installed:
+        pytest.skip("pg_trgm is not installed on the test server")
+
+
+async def test_user_search_matches_any_column_and_escapes_wildcards(session):
+    token = uuid4().hex[:8]
+    by_name = await make_user(session, name=f"Ann {token}_x")
+    by_email = await make_user(session, email=f"{token}_x@example.com")
+    by_auth0 = await make_user(session, auth0_id=f"auth0|{token}_x")
+    # "_" must not act as a single-character wildcard
+    await make_user(session, name=f"Bob {token}Zx")
+    await session.commit()
+
+    page = await UserService(session).list(q=f"{token}_X")
+    assert {u.id for u in page.items} == {by_name.id, by_email.id, by_auth0.id}
+    assert page.total == 3
+
+
+async def test_similarity_sort_ranks_closest_tag_first(session, pg_trgm):
+    token = uuid4().hex[:6]
+    exact = await make_tag(session, name=f"{token}")
+    inside = await make_tag(session, name=f"a{token}yy")
+    await session.commit()
+    svc = TagService(session)
+
+    by_name = await svc.list(q=token)
+    by_similarity = await svc.list(q=token, sort="similarity")
+    assert [t.id for t in by_name.items] == [inside.id, exact.id]
+    assert [t.id for t in by_similarity.items] == [exact.id, inside.id]
+
+
+async def test_similarity_sort_needs_q_and_offset_paging(session):
+    with pytest.raises(HTTPException) as no_q:
+        await GroupService(session).list(q=None, sort="similarity")
+    with pytest.raises(HTTPException) as with_cursor:
+        await TagService(session).page(q="camp", sort="similarity")
+    assert no_q.value.status_code == with_cursor.value.status_code == 400
@@ -0,0 +1,136 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import models as m
+from app.core import query_stats
+from app.core.db import get_read_session, get_session
+from app.core.tag_dictionary import TagDictionary, listen, tag_dictionary
+from app.main import create_app
+from app.repositories.tags import TagRepository
+from app.schemas.tag import TagCreate, TagUpdate
+from app.services.tags import TagService
+from tests.factories import make_program, make_tag, make_user, make_workspace
+
+
+def _dictionary(*rows: tuple[str, int]) -> TagDictionary:
+    d = TagDictionary(ttl=60)
+    d.load((uuid4(), name, count) for name, count in rows)
+    return d
+
+
+def test_suggest_ranks_prefix_matches_before_substring_matches_by_usage():
+    d = _dictionary(
+        ("Campfire", 2),
+        ("camping", 9),
+        ("Day camp", 50),
+        ("summer-camp", 1),
+        ("hiking", 100),
+    )
+    assert [e.name for e in d.suggest("CAMP")] == ["camping", "Campfire", "Day camp", "summer-camp"]
+    assert [e.name for e in d.suggest(" camp", limit=3)] == ["camping", "Campfire", "Day camp"]
+    assert [e.name for e in d.suggest("amp", limit=2)] == ["Day camp", "camping"]
+    assert d.suggest("") == [] and d.suggest("zzz") == []
+
+
+async def test_concurrent_reloads_share_one_load_unless_invalidated_meanwhile():
+    d = TagDictionary(ttl=60)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        if loads == 1:
+            d.invalidate()  # a rename lands while the first reload is reading
+        return [(uuid4(), f"load-{loads}", 0)]
+
+    await asyncio.gather(*(d.ensure_loaded(loader) for _ in range(5)))
+    assert loads == 2 and [e.name for e in d.suggest("load")] == ["load-2"]
+    assert not d.stale
+
+
+async def test_service_writes_refresh_suggestions(session):
+    prefix = f"tq{uuid4().hex[:6]}"
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    popular = await make_tag(session, name=f"{prefix}-popular")
+    for _ in range(2):
+        program = await make_program(session, author, workspace)
+        session.add(m.ContentTag(content_id=program.id, tag_id=popular.id))
+    await session.commit()
+    svc = TagService(session)
+
+    created = await svc.create(TagCreate(name=f"{prefix}-new"))
+    assert [(t.name, t.usage_count) for t in await svc.suggest(prefix)] == [
+        (f"{prefix}-popular", 2),
+        (f"{prefix}-new", 0),
+    ]
+
+    query_stats.install(session.bind)
+    with query_stats.track() as stats:
+        await svc.suggest(prefix)
+    assert stats.statements == 0
+
+    await svc.update(created.id, TagUpdate(name=f"x-{prefix}-renamed"))
+    assert [t.name for t in await svc.suggest(prefix)] == [
+        f"{prefix}-popular",
+        f"x-{prefix}-renamed",
+    ]
+    await svc.delete(popular.id)
+    assert [t.name for t in await svc.suggest(prefix)] == [f"x-{prefix}-renamed"]
+    assert not tag_dictionary.stale
+
+
+async def test_suggest_reloads_from_primary_after_invalidation(session):
+    prefix = f"tr{uuid4().hex[:6]}"
+    await tag_dictionary.ensure_loaded(TagRepository(session).usage_counts)
+    # Uncommitted, so only the primary session sees it; a lagging replica would not
+    session.add(m.Tag(name=f"{prefix}-knots"))
+    await session.flush()
+    tag_dictionary.invalidate()
+
+    async with async_sessionmaker(session.bind)() as replica:
+        app = create_app()
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[get_read_session] = lambda: replica
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get("/tags/suggest", params={"q": prefix})
+        finally:
+            await session.rollback()
+            tag_dictionary.invalidate()
+
+    assert response.status_code == 200, response.text
+    assert [t["name"] for t in response.json()] == [f"{prefix}-knots"]
+
+
+async def _until_stale(d: TagDictionary) -> None:
+    for _ in range(500):
+        if d.stale:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("dictionary was not invalidated")
+
+
+async def test_listener_invalidates_on_notify_from_another_connection(pg_url, session):
+    d = _dictionary()
+    listener = asyncio.create_task(listen(d, pg_url))
+    try:
+        # Connecting invalidates, since notifications sent before then were missed
+        await _until_stale(d)
+        d.load([])
+        await TagRepository(session).notify_changed()
+        await asyncio.sleep(0.05)
+        assert not d.stale, "delivered before commit"
+        await session.commit()
+        await _until_stale(d)
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
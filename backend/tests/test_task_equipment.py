@@ -0,0 +1,120 @@
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.core.db import get_read_session
+from app.main import create_app
+from app.repositories.tasks import TaskRepository
+from app.schemas.task import TaskFilter
+from app.services.tasks import TaskService
+from tests.factories import make_event, make_program, make_task, make_user, make_workspace
+
+
+async def _program_with_tasks(session):
+    author = await make_user(session)
+    workspace = await make_workspace(session)
+    program = await make_program(session, author, workspace)
+    day1 = await make_event(session, author, workspace, program_id=program.id)
+    day2 = await make_event(session, author, workspace, program_id=program.id)
+    orienteering = await make_task(
+        session,
+        author,
+        day1,
+        name="Orienteering",
+        equipment={"compass": 1, "map": 2},
+        media={"video": ["https://example.com/v.mp4"]},
+    )
+    knots = await make_task(
+        session,
+        author,
+        day1,
+        name="Knots",
+        equipment={"rope": 2.5, "whistle": True, "gloves": False, "tarp": None},
+    )
+    night_hike = await make_task(
+        session,
+        author,
+        day2,
+        name="Night hike",
+        equipment={"compass": 3, "headlamp": 1, "rope": 4},
+        media={"images": []},
+    )
+    await make_task(session, author, day2, name="Campfire songs")
+    await session.commit()
+    return program, day1, day2, orienteering, knots, night_hike
+
+
+async def test_equipment_and_media_filters(session):
+    program, day1, day2, orienteering, knots, night_hike = await _program_with_tasks(session)
+    svc = TaskService(session)
+
+    async def names(**filters):
+        page = await svc.query(TaskFilter(program_id=program.id, **filters))
+        return [t.name for t in page.items]
+
+    assert await names() == ["Campfire songs", "Knots", "Night hike", "Orienteering"]
+    assert await names(equipment=["compass"]) == ["Night hike", "Orienteering"]
+    assert await names(equipment=["compass", "rope"]) == ["Night hike"]
+    assert await names(equipment_any=["map", "whistle"]) == ["Knots", "Orienteering"]
+    assert await names(equipment_contains='{"compass": 3}') == ["Night hike"]
+    assert await names(media=["video"]) == ["Orienteering"]
+    assert await names(media_contains='{"images": []}') == ["Night hike"]
+    assert await names(event_id=day2.id, equipment=["rope"]) == ["Night hike"]
+
+
+async def test_packing_list_aggregates_in_sql(session):
+    program, day1, day2, *_ = await _program_with_tasks(session)
+    svc = TaskService(session)
+
+    items = {i.item: i for i in await svc.packing_list_for_program(program.id)}
+    assert list(items) == ["compass", "headlamp", "map", "rope", "whistle"]
+    assert (items["compass"].total_quantity, items["compass"].max_quantity) == (4, 3)
+    assert items["compass"].task_count == 2
+    # 2.5 ropes round up to 3
+    assert (items["rope"].total_quantity, items["rope"].max_quantity) == (7, 4)
+    assert items["whistle"].total_quantity == 1
+
+    day1_items = [(i.item, i.total_quantity) for i in await svc.packing_list_for_event(day1.id)]
+    assert day1_items == [("compass", 1), ("map", 2), ("rope", 3), ("whistle", 1)]
+
+    # An event with nothing to pack is an empty list; an unknown id is a 404
+    empty = await make_event(session, await make_user(session), await make_workspace(session))
+    assert await svc.packing_list_for_event(empty.id) == []
+    with pytest.raises(HTTPException) as exc:
+        await svc.packing_list_for_event(program.id)
+    assert exc.value.status_code == 404
+    with pytest.raises(HTTPException) as exc:
+        await svc.packing_list_for_program(day1.id)
+    assert exc.value.status_code == 404
+
+    repo = TaskRepository(session)
+    with pytest.raises(ValueError):
+        await repo.packing_list()
+    with pytest.raises(ValueError):
+        await repo.packing_list(event_id=day1.id, program_id=program.id)
+
+
+async def test_tasks_endpoint_parses_json_containment(session):
+    program, *_ = await _program_with_tasks(session)
+    app = create_app()
+    app.dependency_overrides[get_read_session] = lambda: session
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        ok = await client.get(
+            "/tasks",
+            params={"program_id": str(program.id), "equipment_contains": '{"map": 2}'},
+        )
+        bad = await client.get("/tasks", params={"equipment_contains": "{not json"})
+        packing = await client.get(f"/programs/{program.id}/packing-list")
+        missing_event = await client.get(f"/events/{uuid4()}/packing-list")
+        missing_program = await client.get(f"/programs/{uuid4()}/packing-list")
+
+    assert ok.status_code == 200, ok.text
+    assert [t["name"] for t in ok.json()] == ["Orienteering"]
+    assert ok.headers["X-Total-Count"] == "1"
+    assert bad.status_code == 422
+    assert packing.status_code == 200 and packing.json()[0]["item"] == "compass"
+    assert missing_event.status_code == 404 and missing_program.status_code == 404
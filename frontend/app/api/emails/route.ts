@@ -74,9 +74,13 @@ export async function POST(request: NextRequest) {
 // Get all emails in the emaillist (admin function)
 export async function GET() {
     try {
+        // The backend only lists subscribers to a signed-in user or a service API key
         const response = await fetch(`${API_BASE_URL}/emaillist/`, {
             method: 'GET',
-            headers: { 'Content-Type': 'application/json' },
+            headers: {
+                'Content-Type': 'application/json',
+                'X-API-Key': process.env.BACKEND_API_KEY ?? '',
+            },
         });
 
         if (!response.ok) {